@@ -4,7 +4,6 @@ from facefusion.jobs import job_store
 from facefusion.normalizer import normalize_fps, normalize_padding
 from facefusion.processors.core import get_processors_modules
 from facefusion.types import ApplyStateItem, Args
-from facefusion.vision import detect_video_fps
 
 
 def reduce_step_args(args : Args) -> Args:
@@ -96,31 +95,54 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('output_video_quality', args.get('output_video_quality'))
 	apply_state_item('output_video_scale', args.get('output_video_scale'))
 	if args.get('output_video_fps') or is_video(args.get('target_path')):
+		from facefusion.vision import detect_video_fps
+
 		output_video_fps = normalize_fps(args.get('output_video_fps')) or detect_video_fps(args.get('target_path'))
 		apply_state_item('output_video_fps', output_video_fps)
 	# processors
 	available_processors = [ get_file_name(file_path) for file_path in resolve_file_paths('facefusion/processors/modules') ]
 	apply_state_item('processors', args.get('processors'))
-	for processor_module in get_processors_modules(available_processors):
-		processor_module.apply_args(args, apply_state_item)
+	if args.get('processors'):
+		for processor_module in get_processors_modules(available_processors):
+			processor_module.apply_args(args, apply_state_item)
 	# uis
 	apply_state_item('open_browser', args.get('open_browser'))
 	apply_state_item('ui_layouts', args.get('ui_layouts'))
 	apply_state_item('ui_workflow', args.get('ui_workflow'))
+	# tune
+	apply_state_item('tune_cycle_count', args.get('tune_cycle_count'))
+	# warm up
+	apply_state_item('warm_up_cycle_count', args.get('warm_up_cycle_count'))
 	# execution
 	apply_state_item('execution_device_ids', args.get('execution_device_ids'))
 	apply_state_item('execution_providers', args.get('execution_providers'))
 	apply_state_item('execution_thread_count', args.get('execution_thread_count'))
+	apply_state_item('execution_session_thread_count', args.get('execution_session_thread_count'))
+	apply_state_item('execution_session_replica_count', args.get('execution_session_replica_count'))
+	apply_state_item('execution_dispatch_mode', args.get('execution_dispatch_mode'))
+	apply_state_item('execution_batch_size', args.get('execution_batch_size'))
+	apply_state_item('execution_batch_timeout', args.get('execution_batch_timeout'))
+	apply_state_item('execution_load_thread_count', args.get('execution_load_thread_count'))
+	apply_state_item('execution_profile_path', args.get('execution_profile_path'))
+	apply_state_item('execution_share_weights', args.get('execution_share_weights'))
+	apply_state_item('execution_precision', args.get('execution_precision'))
 	# download
 	apply_state_item('download_providers', args.get('download_providers'))
 	apply_state_item('download_scope', args.get('download_scope'))
+	apply_state_item('download_thread_count', args.get('download_thread_count'))
+	apply_state_item('download_force_validation', args.get('download_force_validation'))
 	# benchmark
 	apply_state_item('benchmark_mode', args.get('benchmark_mode'))
 	apply_state_item('benchmark_resolutions', args.get('benchmark_resolutions'))
 	apply_state_item('benchmark_cycle_count', args.get('benchmark_cycle_count'))
+	# quantize
+	apply_state_item('quantize_precisions', args.get('quantize_precisions'))
+	apply_state_item('quantize_calibration_path', args.get('quantize_calibration_path'))
 	# memory
 	apply_state_item('video_memory_strategy', args.get('video_memory_strategy'))
 	apply_state_item('system_memory_limit', args.get('system_memory_limit'))
+	apply_state_item('system_memory_budget', args.get('system_memory_budget'))
+	apply_state_item('video_memory_budget', args.get('video_memory_budget'))
 	# misc
 	apply_state_item('log_level', args.get('log_level'))
 	apply_state_item('halt_on_error', args.get('halt_on_error'))
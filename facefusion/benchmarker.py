@@ -6,7 +6,7 @@ from time import perf_counter
 from typing import Generator, List
 
 import facefusion.choices
-from facefusion import content_analyser, core, state_manager
+from facefusion import content_analyser, core, state_manager, warmer
 from facefusion.cli_helper import render_table
 from facefusion.download import conditional_download, resolve_download_url
 from facefusion.face_store import clear_static_faces
@@ -41,6 +41,7 @@ def run() -> Generator[List[BenchmarkCycleSet], None, None]:
 	state_manager.init_item('output_audio_volume', 0)
 	state_manager.init_item('output_video_preset', 'ultrafast')
 	state_manager.init_item('video_memory_strategy', 'tolerant')
+	warmer.warm_up()
 
 	benchmarks = []
 	target_paths = [ facefusion.choices.benchmark_set.get(benchmark_resolution) for benchmark_resolution in benchmark_resolutions if benchmark_resolution in facefusion.choices.benchmark_set ]
@@ -2,7 +2,7 @@ import logging
 from typing import List, Sequence
 
 from facefusion.common_helper import create_float_range, create_int_range
-from facefusion.types import Angle, AudioEncoder, AudioFormat, AudioTypeSet, BenchmarkMode, BenchmarkResolution, BenchmarkSet, DownloadProvider, DownloadProviderSet, DownloadScope, EncoderSet, ExecutionProvider, ExecutionProviderSet, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskArea, FaceMaskAreaSet, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, ImageFormat, ImageTypeSet, JobStatus, LogLevel, LogLevelSet, Race, Score, TempFrameFormat, UiWorkflow, VideoEncoder, VideoFormat, VideoMemoryStrategy, VideoPreset, VideoTypeSet, VoiceExtractorModel
+from facefusion.types import Angle, AudioEncoder, AudioFormat, AudioTypeSet, BenchmarkMode, BenchmarkResolution, BenchmarkSet, DownloadProvider, DownloadProviderSet, DownloadScope, EncoderSet, ExecutionDispatchMode, ExecutionPrecision, ExecutionProvider, ExecutionProviderSet, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskArea, FaceMaskAreaSet, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, ImageFormat, ImageTypeSet, JobStatus, LogLevel, LogLevelSet, QuantizeMetric, QuantizeMetricSet, QuantizePrecision, Race, Score, TempFrameFormat, UiWorkflow, VideoEncoder, VideoFormat, VideoMemoryStrategy, VideoPreset, VideoTypeSet, VoiceExtractorModel
 
 face_detector_set : FaceDetectorSet =\
 {
@@ -111,6 +111,19 @@ execution_provider_set : ExecutionProviderSet =\
 	'cpu': 'CPUExecutionProvider'
 }
 execution_providers : List[ExecutionProvider] = list(execution_provider_set.keys())
+execution_precisions : List[ExecutionPrecision] = [ 'fp32', 'fp16', 'int8' ]
+execution_optimize_providers : List[ExecutionProvider] = [ 'cuda', 'cpu' ]
+execution_dispatch_modes : List[ExecutionDispatchMode] = [ 'least_busy', 'round_robin' ]
+
+quantize_precisions : List[QuantizePrecision] = [ 'fp16', 'int8' ]
+quantize_metric_set : QuantizeMetricSet =\
+{
+	'cosine': 0.99,
+	'error': 0.01,
+	'iou': 0.9,
+	'psnr': 30.0
+}
+quantize_metrics : List[QuantizeMetric] = list(quantize_metric_set.keys())
 download_provider_set : DownloadProviderSet =\
 {
 	'github':
@@ -133,6 +146,7 @@ download_provider_set : DownloadProviderSet =\
 }
 download_providers : List[DownloadProvider] = list(download_provider_set.keys())
 download_scopes : List[DownloadScope] = [ 'lite', 'full' ]
+download_thread_count_range : Sequence[int] = create_int_range(1, 16, 1)
 
 video_memory_strategies : List[VideoMemoryStrategy] = [ 'strict', 'moderate', 'tolerant' ]
 
@@ -149,8 +163,17 @@ ui_workflows : List[UiWorkflow] = [ 'instant_runner', 'job_runner', 'job_manager
 job_statuses : List[JobStatus] = [ 'drafted', 'queued', 'completed', 'failed' ]
 
 benchmark_cycle_count_range : Sequence[int] = create_int_range(1, 10, 1)
+tune_cycle_count_range : Sequence[int] = create_int_range(1, 10, 1)
+warm_up_cycle_count_range : Sequence[int] = create_int_range(1, 10, 1)
 execution_thread_count_range : Sequence[int] = create_int_range(1, 32, 1)
+execution_session_thread_count_range : Sequence[int] = create_int_range(0, 64, 1)
+execution_session_replica_count_range : Sequence[int] = create_int_range(1, 8, 1)
+execution_batch_size_range : Sequence[int] = create_int_range(1, 16, 1)
+execution_batch_timeout_range : Sequence[int] = create_int_range(0, 20, 1)
+execution_load_thread_count_range : Sequence[int] = create_int_range(1, 16, 1)
 system_memory_limit_range : Sequence[int] = create_int_range(0, 128, 4)
+system_memory_budget_range : Sequence[int] = create_int_range(0, 131072, 256)
+video_memory_budget_range : Sequence[int] = create_int_range(0, 131072, 256)
 face_detector_angles : Sequence[Angle] = create_int_range(0, 270, 90)
 face_detector_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
 face_landmarker_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
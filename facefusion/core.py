@@ -4,19 +4,17 @@ import shutil
 import signal
 import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from time import time
+from contextvars import copy_context
+from time import perf_counter, time
+from typing import Dict, List
 
 import numpy
-from tqdm import tqdm
 
-from facefusion import benchmarker, cli_helper, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, hash_helper, logger, process_manager, state_manager, video_manager, voice_extractor, wording
+from facefusion import cli_helper, hash_helper, logger, process_manager, profiler, state_manager, wording
+from facefusion.app_context import bind_app_context
 from facefusion.args import apply_args, collect_job_args, reduce_job_args, reduce_step_args
-from facefusion.audio import create_empty_audio_frame, get_audio_frame, get_voice_frame
 from facefusion.common_helper import get_first
-from facefusion.content_analyser import analyse_image, analyse_video
-from facefusion.download import conditional_download_hashes, conditional_download_sources
 from facefusion.exit_helper import hard_exit, signal_exit
-from facefusion.ffmpeg import copy_image, extract_frames, finalize_image, merge_video, replace_audio, restore_audio
 from facefusion.filesystem import filter_audio_paths, get_file_name, is_image, is_video, resolve_file_paths, resolve_file_pattern
 from facefusion.jobs import job_helper, job_manager, job_runner
 from facefusion.jobs.job_list import compose_job_list
@@ -26,14 +24,17 @@ from facefusion.program import create_program
 from facefusion.program_helper import validate_args
 from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, move_temp_file, resolve_temp_frame_paths
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import Args, ErrorCode
-from facefusion.vision import detect_image_resolution, detect_video_resolution, pack_resolution, read_static_image, read_static_images, read_static_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, write_image
+from facefusion.types import Args, DownloadSet, ErrorCode
+
+PRE_CHECK_SET : Dict[str, bool] = {}
 
 
 def cli() -> None:
+	bind_app_context('cli')
+
 	if pre_check():
 		signal.signal(signal.SIGINT, signal_exit)
-		program = create_program()
+		program = create_program(get_first(sys.argv[1:]))
 
 		if validate_args(program):
 			args = vars(program.parse_args())
@@ -61,10 +62,36 @@ def route(args : Args) -> None:
 		hard_exit(error_code)
 
 	if state_manager.get_item('command') == 'benchmark':
+		from facefusion import benchmarker
+
 		if not common_pre_check() or not processors_pre_check() or not benchmarker.pre_check():
 			hard_exit(2)
 		benchmarker.render()
 
+	if state_manager.get_item('command') == 'tune':
+		from facefusion import tuner
+
+		if not common_pre_check() or not processors_pre_check():
+			hard_exit(2)
+		error_code = tuner.run()
+		hard_exit(error_code)
+
+	if state_manager.get_item('command') == 'warm-up':
+		from facefusion import warmer
+
+		if not common_pre_check() or not processors_pre_check():
+			hard_exit(2)
+		error_code = warmer.run()
+		hard_exit(error_code)
+
+	if state_manager.get_item('command') == 'quantize':
+		from facefusion import quantizer
+
+		if not common_pre_check() or not processors_pre_check():
+			hard_exit(2)
+		error_code = quantizer.run()
+		hard_exit(error_code)
+
 	if state_manager.get_item('command') in [ 'job-list', 'job-create', 'job-submit', 'job-submit-all', 'job-delete', 'job-delete-all', 'job-add-step', 'job-remix-step', 'job-insert-step', 'job-remove-step' ]:
 		if not job_manager.init_jobs(state_manager.get_item('jobs_path')):
 			hard_exit(1)
@@ -79,6 +106,7 @@ def route(args : Args) -> None:
 		for ui_layout in ui.get_ui_layouts_modules(state_manager.get_item('ui_layouts')):
 			if not ui_layout.pre_check():
 				hard_exit(2)
+		bind_app_context('ui')
 		ui.init()
 		ui.launch()
 
@@ -117,6 +145,9 @@ def pre_check() -> bool:
 
 
 def common_pre_check() -> bool:
+	from facefusion import content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, voice_extractor
+	from facefusion.thread_helper import run_parallel
+
 	common_modules =\
 	[
 		content_analyser,
@@ -128,20 +159,45 @@ def common_pre_check() -> bool:
 		voice_extractor
 	]
 
+	pre_check_key = create_pre_check_key('common', [ 'face_detector_model', 'face_landmarker_model', 'face_occluder_model', 'face_parser_model', 'voice_extractor_model' ])
+
+	if is_pre_checked(pre_check_key):
+		return True
+
 	content_analyser_content = inspect.getsource(content_analyser).encode()
 	content_analyser_hash = hash_helper.create_hash(content_analyser_content)
 
-	return all(module.pre_check() for module in common_modules) and content_analyser_hash == '803b5ec7'
+	PRE_CHECK_SET[pre_check_key] = all(run_parallel([ module.pre_check for module in common_modules ])) and content_analyser_hash == '803b5ec7'
+	return PRE_CHECK_SET.get(pre_check_key)
 
 
 def processors_pre_check() -> bool:
-	for processor_module in get_processors_modules(state_manager.get_item('processors')):
-		if not processor_module.pre_check():
-			return False
-	return True
+	from facefusion.thread_helper import run_parallel
+
+	processors = state_manager.get_item('processors')
+	pre_check_key = create_pre_check_key('processors', [ 'processors' ] + [ processor + '_model' for processor in processors ])
+
+	if is_pre_checked(pre_check_key):
+		return True
+
+	processor_modules = get_processors_modules(processors)
+	PRE_CHECK_SET[pre_check_key] = all(run_parallel([ processor_module.pre_check for processor_module in processor_modules ]))
+	return PRE_CHECK_SET.get(pre_check_key)
+
+
+def create_pre_check_key(pre_check_name : str, state_keys : List[str]) -> str:
+	state_values = [ str(state_manager.get_item(state_key)) for state_key in state_keys ] #type:ignore[arg-type]
+	return pre_check_name + ':' + ','.join(state_values)
+
+
+def is_pre_checked(pre_check_key : str) -> bool:
+	return not state_manager.get_item('download_force_validation') and PRE_CHECK_SET.get(pre_check_key) is True
 
 
 def force_download() -> ErrorCode:
+	from facefusion import content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, voice_extractor
+	from facefusion.download import conditional_download_hashes, conditional_download_sources
+
 	common_modules =\
 	[
 		content_analyser,
@@ -154,6 +210,8 @@ def force_download() -> ErrorCode:
 	]
 	available_processors = [ get_file_name(file_path) for file_path in resolve_file_paths('facefusion/processors/modules') ]
 	processor_modules = get_processors_modules(available_processors)
+	download_hash_set : DownloadSet = {}
+	download_source_set : DownloadSet = {}
 
 	for module in common_modules + processor_modules:
 		if hasattr(module, 'create_static_model_set'):
@@ -162,10 +220,12 @@ def force_download() -> ErrorCode:
 				model_source_set = model.get('sources')
 
 				if model_hash_set and model_source_set:
-					if not conditional_download_hashes(model_hash_set) or not conditional_download_sources(model_source_set):
-						return 1
+					download_hash_set.update({ model_hash.get('path'): model_hash for model_hash in model_hash_set.values() })
+					download_source_set.update({ model_source.get('path'): model_source for model_source in model_source_set.values() })
 
-	return 0
+	if conditional_download_hashes(download_hash_set) and conditional_download_sources(download_source_set):
+		return 0
+	return 1
 
 
 def route_job_manager(args : Args) -> ErrorCode:
@@ -325,6 +385,7 @@ def process_step(job_id : str, step_index : int, step_args : Args) -> bool:
 	step_total = job_manager.count_step_total(job_id)
 	step_args.update(collect_job_args())
 	apply_args(step_args, state_manager.set_item)
+	state_manager.bind_state_snapshot()
 
 	logger.info(wording.get('processing_step').format(step_current = step_index + 1, step_total = step_total), __name__)
 	if common_pre_check() and processors_pre_check():
@@ -349,6 +410,11 @@ def conditional_process() -> ErrorCode:
 
 
 def process_image(start_time : float) -> ErrorCode:
+	from facefusion.audio import create_empty_audio_frame
+	from facefusion.content_analyser import analyse_image
+	from facefusion.ffmpeg import copy_image, finalize_image
+	from facefusion.vision import detect_image_resolution, pack_resolution, read_static_image, read_static_images, restrict_image_resolution, scale_resolution, write_image
+
 	if analyse_image(state_manager.get_item('target_path')):
 		return 3
 
@@ -380,6 +446,7 @@ def process_image(start_time : float) -> ErrorCode:
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
 		logger.info(wording.get('processing'), processor_module.__name__)
 
+		process_start_time = perf_counter()
 		temp_vision_frame = processor_module.process_frame(
 		{
 			'reference_vision_frame': reference_vision_frame,
@@ -389,6 +456,7 @@ def process_image(start_time : float) -> ErrorCode:
 			'target_vision_frame': target_vision_frame,
 			'temp_vision_frame': temp_vision_frame
 		})
+		profiler.record_process_time(processor_module.__name__, perf_counter() - process_start_time)
 
 		processor_module.post_process()
 
@@ -416,6 +484,13 @@ def process_image(start_time : float) -> ErrorCode:
 
 
 def process_video(start_time : float) -> ErrorCode:
+	from tqdm import tqdm
+
+	from facefusion import video_manager
+	from facefusion.content_analyser import analyse_video
+	from facefusion.ffmpeg import extract_frames, merge_video, replace_audio, restore_audio
+	from facefusion.vision import detect_video_resolution, pack_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution
+
 	trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
 	if analyse_video(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
 		return 3
@@ -450,7 +525,7 @@ def process_video(start_time : float) -> ErrorCode:
 				futures = []
 
 				for frame_number, temp_frame_path in enumerate(temp_frame_paths):
-					future = executor.submit(process_temp_frame, temp_frame_path, frame_number)
+					future = executor.submit(copy_context().run, process_temp_frame, temp_frame_path, frame_number)
 					futures.append(future)
 
 				for future in as_completed(futures):
@@ -522,6 +597,9 @@ def process_video(start_time : float) -> ErrorCode:
 
 
 def process_temp_frame(temp_frame_path : str, frame_number : int) -> bool:
+	from facefusion.audio import create_empty_audio_frame, get_audio_frame, get_voice_frame
+	from facefusion.vision import read_static_image, read_static_images, read_static_video_frame, restrict_video_fps, write_image
+
 	reference_vision_frame = read_static_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
 	source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
 	source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
@@ -538,6 +616,7 @@ def process_temp_frame(temp_frame_path : str, frame_number : int) -> bool:
 		source_voice_frame = create_empty_audio_frame()
 
 	for processor_module in get_processors_modules(state_manager.get_item('processors')):
+		process_start_time = perf_counter()
 		temp_vision_frame = processor_module.process_frame(
 		{
 			'reference_vision_frame': reference_vision_frame,
@@ -547,6 +626,7 @@ def process_temp_frame(temp_frame_path : str, frame_number : int) -> bool:
 			'target_vision_frame': target_vision_frame,
 			'temp_vision_frame': temp_vision_frame
 		})
+		profiler.record_process_time(processor_module.__name__, perf_counter() - process_start_time)
 
 	return write_image(temp_frame_path, temp_vision_frame)
 
@@ -23,5 +23,9 @@ def download(url : str, download_file_path : str) -> Commands:
 	return [ '--create-dirs', '--continue-at', '-', '--output', download_file_path, url ]
 
 
+def stream(url : str, initial_size : int) -> Commands:
+	return [ '--fail', '--continue-at', str(initial_size), url ]
+
+
 def set_timeout(timeout : int) -> Commands:
 	return [ '--connect-timeout', str(timeout) ]
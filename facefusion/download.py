@@ -1,17 +1,23 @@
 import os
 import subprocess
-from functools import lru_cache
-from typing import List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from tqdm import tqdm
 
 import facefusion.choices
 from facefusion import curl_builder, logger, process_manager, state_manager, wording
-from facefusion.filesystem import get_file_name, get_file_size, is_file, remove_file
-from facefusion.hash_helper import validate_hash
+from facefusion.filesystem import create_directory, get_file_name, get_file_size, is_file, remove_file
+from facefusion.hash_helper import create_file_hash_value, format_hash_value, get_hash_content, update_hash_manifest, update_hash_value, validate_hash
 from facefusion.types import Commands, DownloadProvider, DownloadSet
 
+DOWNLOAD_LOCK_SET : Dict[str, threading.Lock] = {}
+DOWNLOAD_SEMAPHORE_SET : Dict[int, threading.Semaphore] = {}
+DOWNLOAD_CHUNK_SIZE : int = 1024 * 1024
+
 
 def open_curl(commands : Commands) -> subprocess.Popen[bytes]:
 	commands = curl_builder.run(commands)
@@ -19,26 +25,69 @@ def open_curl(commands : Commands) -> subprocess.Popen[bytes]:
 
 
 def conditional_download(download_directory_path : str, urls : List[str]) -> None:
+	download_set : DownloadSet = {}
+
 	for url in urls:
-		download_file_name = os.path.basename(urlparse(url).path)
-		download_file_path = os.path.join(download_directory_path, download_file_name)
+		download_set[url] =\
+		{
+			'url': url,
+			'path': os.path.join(download_directory_path, os.path.basename(urlparse(url).path))
+		}
+
+	download_files(download_set)
+
+
+def download_files(download_set : DownloadSet) -> bool:
+	download_thread_count = state_manager.get_item('download_thread_count') or 1
+
+	with ThreadPoolExecutor(max_workers = download_thread_count) as executor:
+		return all(list(executor.map(download_file, [ download.get('url') for download in download_set.values() ], [ download.get('path') for download in download_set.values() ])))
+
+
+def download_file(url : str, download_file_path : str) -> bool:
+	download_file_name = os.path.basename(download_file_path)
+
+	with DOWNLOAD_LOCK_SET.setdefault(download_file_path, threading.Lock()), download_semaphore():
 		initial_size = get_file_size(download_file_path)
 		download_size = get_static_download_size(url)
 
-		if initial_size < download_size:
+		if initial_size < download_size and create_directory(os.path.dirname(download_file_path)):
+			download_hash_value = create_file_hash_value(download_file_path)
+			commands = curl_builder.chain(
+				curl_builder.stream(url, initial_size),
+				curl_builder.set_timeout(5)
+			)
+			process = open_curl(commands)
+
 			with tqdm(total = download_size, initial = initial_size, desc = wording.get('downloading'), unit = 'B', unit_scale = True, unit_divisor = 1024, ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
-				commands = curl_builder.chain(
-					curl_builder.download(url, download_file_path),
-					curl_builder.set_timeout(5)
-				)
-				open_curl(commands)
-				current_size = initial_size
 				progress.set_postfix(download_providers = state_manager.get_item('download_providers'), file_name = download_file_name)
 
-				while current_size < download_size:
-					if is_file(download_file_path):
-						current_size = get_file_size(download_file_path)
-						progress.update(current_size - progress.n)
+				with open(download_file_path, 'ab') as download_file:
+					for download_chunk in iter(partial(process.stdout.read, DOWNLOAD_CHUNK_SIZE), b''):
+						download_file.write(download_chunk)
+						download_hash_value = update_hash_value(download_hash_value, download_chunk)
+						progress.update(len(download_chunk))
+
+			if process.wait() == 0:
+				return verify_download_file(download_file_path, download_hash_value)
+			return False
+	return is_file(download_file_path)
+
+
+def download_semaphore() -> threading.Semaphore:
+	download_thread_count = state_manager.get_item('download_thread_count') or 1
+	return DOWNLOAD_SEMAPHORE_SET.setdefault(download_thread_count, threading.Semaphore(download_thread_count))
+
+
+def verify_download_file(download_file_path : str, download_hash_value : int) -> bool:
+	hash_content = get_hash_content(download_file_path)
+
+	if hash_content:
+		if format_hash_value(download_hash_value) == hash_content:
+			return update_hash_manifest(download_file_path, hash_content)
+		remove_file(download_file_path)
+		return False
+	return is_file(download_file_path)
 
 
 @lru_cache(maxsize = 1024)
@@ -76,12 +125,7 @@ def conditional_download_hashes(hash_set : DownloadSet) -> bool:
 	process_manager.check()
 	_, invalid_hash_paths = validate_hash_paths(hash_paths)
 	if invalid_hash_paths:
-		for index in hash_set:
-			if hash_set.get(index).get('path') in invalid_hash_paths:
-				invalid_hash_url = hash_set.get(index).get('url')
-				if invalid_hash_url:
-					download_directory_path = os.path.dirname(hash_set.get(index).get('path'))
-					conditional_download(download_directory_path, [ invalid_hash_url ])
+		download_files({ index: hash_set.get(index) for index in hash_set if hash_set.get(index).get('path') in invalid_hash_paths and hash_set.get(index).get('url') })
 
 	valid_hash_paths, invalid_hash_paths = validate_hash_paths(hash_paths)
 
@@ -92,8 +136,7 @@ def conditional_download_hashes(hash_set : DownloadSet) -> bool:
 		invalid_hash_file_name = get_file_name(invalid_hash_path)
 		logger.error(wording.get('validating_hash_failed').format(hash_file_name = invalid_hash_file_name), __name__)
 
-	if not invalid_hash_paths:
-		process_manager.end()
+	process_manager.end()
 	return not invalid_hash_paths
 
 
@@ -103,12 +146,7 @@ def conditional_download_sources(source_set : DownloadSet) -> bool:
 	process_manager.check()
 	_, invalid_source_paths = validate_source_paths(source_paths)
 	if invalid_source_paths:
-		for index in source_set:
-			if source_set.get(index).get('path') in invalid_source_paths:
-				invalid_source_url = source_set.get(index).get('url')
-				if invalid_source_url:
-					download_directory_path = os.path.dirname(source_set.get(index).get('path'))
-					conditional_download(download_directory_path, [ invalid_source_url ])
+		download_files({ index: source_set.get(index) for index in source_set if source_set.get(index).get('path') in invalid_source_paths and source_set.get(index).get('url') })
 
 	valid_source_paths, invalid_source_paths = validate_source_paths(source_paths)
 
@@ -122,8 +160,7 @@ def conditional_download_sources(source_set : DownloadSet) -> bool:
 		if remove_file(invalid_source_path):
 			logger.error(wording.get('deleting_corrupt_source').format(source_file_name = invalid_source_file_name), __name__)
 
-	if not invalid_source_paths:
-		process_manager.end()
+	process_manager.end()
 	return not invalid_source_paths
 
 
@@ -1,13 +1,16 @@
+import os
 import shutil
 import subprocess
 import xml.etree.ElementTree as ElementTree
 from functools import lru_cache
 from typing import List, Optional
 
-from onnxruntime import get_available_providers, set_default_logger_severity
+from onnxruntime import ExecutionMode, GraphOptimizationLevel, SessionOptions, get_available_providers, set_default_logger_severity
 
 import facefusion.choices
-from facefusion.types import ExecutionDevice, ExecutionProvider, InferenceSessionProvider, ValueAndUnit
+from facefusion.filesystem import get_file_name, resolve_relative_path
+from facefusion.json import read_json
+from facefusion.types import ExecutionDevice, ExecutionProvider, GraphOptimizationLevelName, InferenceSessionProvider, TuneOptions, TuneSet, ValueAndUnit
 
 set_default_logger_severity(3)
 
@@ -28,16 +31,21 @@ def get_available_execution_providers() -> List[ExecutionProvider]:
 	return available_execution_providers
 
 
-def create_inference_session_providers(execution_device_id : str, execution_providers : List[ExecutionProvider]) -> List[InferenceSessionProvider]:
+def create_inference_session_providers(execution_device_id : str, execution_providers : List[ExecutionProvider], tune_options : Optional[TuneOptions] = None) -> List[InferenceSessionProvider]:
 	inference_session_providers : List[InferenceSessionProvider] = []
+	tune_options = tune_options or {}
 
 	for execution_provider in execution_providers:
 		if execution_provider == 'cuda':
-			inference_session_providers.append((facefusion.choices.execution_provider_set.get(execution_provider),
+			cuda_provider_options =\
 			{
 				'device_id': execution_device_id,
-				'cudnn_conv_algo_search': resolve_cudnn_conv_algo_search()
-			}))
+				'cudnn_conv_algo_search': tune_options.get('cudnn_conv_algo_search') or resolve_cudnn_conv_algo_search()
+			}
+
+			if tune_options.get('arena_extend_strategy'):
+				cuda_provider_options['arena_extend_strategy'] = tune_options.get('arena_extend_strategy')
+			inference_session_providers.append((facefusion.choices.execution_provider_set.get(execution_provider), cuda_provider_options))
 		if execution_provider == 'tensorrt':
 			inference_session_providers.append((facefusion.choices.execution_provider_set.get(execution_provider),
 			{
@@ -63,7 +71,7 @@ def create_inference_session_providers(execution_device_id : str, execution_prov
 			inference_session_providers.append((facefusion.choices.execution_provider_set.get(execution_provider),
 			{
 				'device_type': resolve_openvino_device_type(execution_device_id),
-				'precision': 'FP32'
+				'precision': tune_options.get('openvino_precision') or 'FP32'
 			}))
 		if execution_provider == 'coreml':
 			inference_session_providers.append((facefusion.choices.execution_provider_set.get(execution_provider),
@@ -78,6 +86,66 @@ def create_inference_session_providers(execution_device_id : str, execution_prov
 	return inference_session_providers
 
 
+def create_inference_session_options(execution_thread_count : int, execution_session_thread_count : int, optimized_model_path : Optional[str] = None, tune_options : Optional[TuneOptions] = None, profile_file_prefix : Optional[str] = None, share_weights : bool = False) -> SessionOptions:
+	session_options = SessionOptions()
+	tune_options = tune_options or {}
+	session_options.intra_op_num_threads = resolve_session_thread_count(execution_thread_count, execution_session_thread_count or tune_options.get('intra_op_num_threads') or 0)
+	session_options.inter_op_num_threads = 1
+	session_options.execution_mode = ExecutionMode.ORT_SEQUENTIAL
+
+	if execution_thread_count > 1:
+		session_options.add_session_config_entry('session.intra_op.allow_spinning', '0')
+		session_options.add_session_config_entry('session.inter_op.allow_spinning', '0')
+	if tune_options.get('graph_optimization_level'):
+		session_options.graph_optimization_level = resolve_graph_optimization_level(tune_options.get('graph_optimization_level'))
+	if optimized_model_path:
+		session_options.graph_optimization_level = resolve_graph_optimization_level(tune_options.get('graph_optimization_level') or 'extended')
+		session_options.optimized_model_filepath = optimized_model_path
+	if share_weights:
+		session_options.add_session_config_entry('session.disable_prepacking', '1')
+	if profile_file_prefix:
+		session_options.enable_profiling = True
+		session_options.profile_file_prefix = profile_file_prefix
+	return session_options
+
+
+def resolve_graph_optimization_level(graph_optimization_level : GraphOptimizationLevelName) -> GraphOptimizationLevel:
+	if graph_optimization_level == 'basic':
+		return GraphOptimizationLevel.ORT_ENABLE_BASIC
+	if graph_optimization_level == 'extended':
+		return GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+	return GraphOptimizationLevel.ORT_ENABLE_ALL
+
+
+def get_tune_path() -> str:
+	return resolve_relative_path('../.caches/tuning.json')
+
+
+def get_tune_key(model_path : str, execution_providers : List[ExecutionProvider]) -> str:
+	return get_file_name(model_path) + '.' + '.'.join(execution_providers)
+
+
+@lru_cache()
+def read_static_tune_set() -> TuneSet:
+	return read_json(get_tune_path()) or {} #type:ignore[return-value]
+
+
+def get_tune_options(model_path : str, execution_providers : List[ExecutionProvider]) -> TuneOptions:
+	return read_static_tune_set().get(get_tune_key(model_path, execution_providers), {})
+
+
+def resolve_session_thread_count(execution_thread_count : int, execution_session_thread_count : int) -> int:
+	if execution_session_thread_count > 0:
+		return execution_session_thread_count
+	return max(1, detect_cpu_count() // max(1, execution_thread_count))
+
+
+def detect_cpu_count() -> int:
+	if hasattr(os, 'sched_getaffinity'):
+		return len(os.sched_getaffinity(0))
+	return os.cpu_count() or 1
+
+
 def resolve_cudnn_conv_algo_search() -> str:
 	execution_devices = detect_static_execution_devices()
 	product_names = ('GeForce GTX 1630', 'GeForce GTX 1650', 'GeForce GTX 1660')
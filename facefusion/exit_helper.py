@@ -4,7 +4,7 @@ import sys
 from time import sleep
 from types import FrameType
 
-from facefusion import process_manager, state_manager
+from facefusion import process_manager, profiler, state_manager
 from facefusion.temp_helper import clear_temp_directory
 from facefusion.types import ErrorCode
 
@@ -14,6 +14,7 @@ def fatal_exit(error_code : ErrorCode) -> None:
 
 
 def hard_exit(error_code : ErrorCode) -> None:
+	profiler.write_report()
 	sys.exit(error_code)
 
 
@@ -86,7 +86,7 @@ def forward(crop_vision_frame : VisionFrame) -> Tuple[List[int], List[int], List
 	face_classifier = get_inference_pool().get('face_classifier')
 
 	with conditional_thread_semaphore():
-		race_id, gender_id, age_id = face_classifier.run(None,
+		race_id, gender_id, age_id = inference_manager.run_inference(face_classifier,
 		{
 			'input': crop_vision_frame
 		})
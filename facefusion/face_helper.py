@@ -99,17 +99,25 @@ def warp_face_by_translation(temp_vision_frame : VisionFrame, translation : Tran
 
 
 def paste_back(temp_vision_frame : VisionFrame, crop_vision_frame : VisionFrame, crop_mask : Mask, affine_matrix : Matrix) -> VisionFrame:
+	temp_vision_frame = temp_vision_frame.copy()
+	return paste_back_in_place(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+
+
+def paste_back_in_place(temp_vision_frame : VisionFrame, crop_vision_frame : VisionFrame, crop_mask : Mask, affine_matrix : Matrix) -> VisionFrame:
 	paste_bounding_box, paste_matrix = calculate_paste_area(temp_vision_frame, crop_vision_frame, affine_matrix)
 	x1, y1, x2, y2 = paste_bounding_box
 	paste_width = x2 - x1
 	paste_height = y2 - y1
-	inverse_mask = cv2.warpAffine(crop_mask, paste_matrix, (paste_width, paste_height)).clip(0, 1)
-	inverse_mask = numpy.expand_dims(inverse_mask, axis = -1)
-	inverse_vision_frame = cv2.warpAffine(crop_vision_frame, paste_matrix, (paste_width, paste_height), borderMode = cv2.BORDER_REPLICATE)
-	temp_vision_frame = temp_vision_frame.copy()
-	paste_vision_frame = temp_vision_frame[y1:y2, x1:x2]
-	paste_vision_frame = paste_vision_frame * (1 - inverse_mask) + inverse_vision_frame * inverse_mask
-	temp_vision_frame[y1:y2, x1:x2] = paste_vision_frame.astype(temp_vision_frame.dtype)
+
+	if paste_width > 0 and paste_height > 0:
+		inverse_mask = cv2.warpAffine(crop_mask.astype(numpy.float32), paste_matrix, (paste_width, paste_height)).clip(0, 1)
+		inverse_mask = numpy.expand_dims(inverse_mask, axis = -1)
+		inverse_vision_frame = cv2.warpAffine(crop_vision_frame.astype(numpy.float32), paste_matrix, (paste_width, paste_height), borderMode = cv2.BORDER_REPLICATE)
+		paste_vision_frame = temp_vision_frame[y1:y2, x1:x2].astype(numpy.float32)
+		numpy.subtract(inverse_vision_frame, paste_vision_frame, out = inverse_vision_frame)
+		numpy.multiply(inverse_vision_frame, inverse_mask, out = inverse_vision_frame)
+		numpy.add(paste_vision_frame, inverse_vision_frame, out = paste_vision_frame)
+		temp_vision_frame[y1:y2, x1:x2] = paste_vision_frame.astype(temp_vision_frame.dtype)
 	return temp_vision_frame
 
 
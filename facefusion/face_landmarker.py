@@ -190,7 +190,7 @@ def forward_with_2dfan4(crop_vision_frame : VisionFrame) -> Tuple[Prediction, Pr
 	face_landmarker = get_inference_pool().get('2dfan4')
 
 	with conditional_thread_semaphore():
-		prediction = face_landmarker.run(None,
+		prediction = inference_manager.run_inference(face_landmarker,
 		{
 			'input': [ crop_vision_frame ]
 		})
@@ -202,7 +202,7 @@ def forward_with_peppa_wutz(crop_vision_frame : VisionFrame) -> Prediction:
 	face_landmarker = get_inference_pool().get('peppa_wutz')
 
 	with conditional_thread_semaphore():
-		prediction = face_landmarker.run(None,
+		prediction = inference_manager.run_inference(face_landmarker,
 		{
 			'input': crop_vision_frame
 		})[0]
@@ -214,7 +214,7 @@ def forward_fan_68_5(face_landmark_5 : FaceLandmark5) -> FaceLandmark68:
 	face_landmarker = get_inference_pool().get('fan_68_5')
 
 	with conditional_thread_semaphore():
-		face_landmark_68_5 = face_landmarker.run(None,
+		face_landmark_68_5 = inference_manager.run_inference(face_landmarker,
 		{
 			'input': [ face_landmark_5 ]
 		})[0][0]
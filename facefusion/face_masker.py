@@ -1,14 +1,16 @@
-from functools import lru_cache
+from functools import lru_cache, partial
 from typing import List, Tuple
 
 import cv2
 import numpy
+from cv2.typing import Size
 
 import facefusion.choices
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
+from facefusion.face_store import clear_static_masks, get_static_mask, set_static_mask
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.thread_helper import conditional_thread_semaphore, run_parallel
 from facefusion.types import DownloadScope, DownloadSet, FaceLandmark68, FaceMaskArea, FaceMaskRegion, InferencePool, Mask, ModelSet, Padding, VisionFrame
 
 
@@ -129,6 +131,7 @@ def get_inference_pool() -> InferencePool:
 def clear_inference_pool() -> None:
 	model_names = [ state_manager.get_item('face_occluder_model'), state_manager.get_item('face_parser_model') ]
 	inference_manager.clear_inference_pool(__name__, model_names)
+	clear_static_masks()
 
 
 def collect_model_downloads() -> Tuple[DownloadSet, DownloadSet]:
@@ -157,9 +160,14 @@ def pre_check() -> bool:
 
 def create_box_mask(crop_vision_frame : VisionFrame, face_mask_blur : float, face_mask_padding : Padding) -> Mask:
 	crop_size = crop_vision_frame.shape[:2][::-1]
+	return create_static_box_mask(crop_size, face_mask_blur, face_mask_padding)
+
+
+@lru_cache(maxsize = 64)
+def create_static_box_mask(crop_size : Size, face_mask_blur : float, face_mask_padding : Padding) -> Mask:
 	blur_amount = int(crop_size[0] * 0.5 * face_mask_blur)
 	blur_area = max(blur_amount // 2, 1)
-	box_mask : Mask = numpy.ones(crop_size).astype(numpy.float32)
+	box_mask : Mask = numpy.ones(crop_size, dtype = numpy.float32)
 	box_mask[:max(blur_area, int(crop_size[1] * face_mask_padding[0] / 100)), :] = 0
 	box_mask[-max(blur_area, int(crop_size[1] * face_mask_padding[2] / 100)):, :] = 0
 	box_mask[:, :max(blur_area, int(crop_size[0] * face_mask_padding[3] / 100))] = 0
@@ -167,29 +175,37 @@ def create_box_mask(crop_vision_frame : VisionFrame, face_mask_blur : float, fac
 
 	if blur_amount > 0:
 		box_mask = cv2.GaussianBlur(box_mask, (0, 0), blur_amount * 0.25)
+	box_mask.setflags(write = False)
 	return box_mask
 
 
 def create_occlusion_mask(crop_vision_frame : VisionFrame) -> Mask:
-	temp_masks = []
+	face_occluder_model = state_manager.get_item('face_occluder_model')
+	occlusion_mask = get_static_mask(crop_vision_frame, face_occluder_model)
 
-	if state_manager.get_item('face_occluder_model') == 'many':
-		model_names = [ 'xseg_1', 'xseg_2', 'xseg_3' ]
-	else:
-		model_names = [ state_manager.get_item('face_occluder_model') ]
+	if occlusion_mask is None:
+		prepare_vision_frames = []
 
-	for model_name in model_names:
-		model_size = create_static_model_set('full').get(model_name).get('size')
-		prepare_vision_frame = cv2.resize(crop_vision_frame, model_size)
-		prepare_vision_frame = numpy.expand_dims(prepare_vision_frame, axis = 0).astype(numpy.float32) / 255.0
-		prepare_vision_frame = prepare_vision_frame.transpose(0, 1, 2, 3)
-		temp_mask = forward_occlude_face(prepare_vision_frame, model_name)
-		temp_mask = temp_mask.transpose(0, 1, 2).clip(0, 1).astype(numpy.float32)
-		temp_mask = cv2.resize(temp_mask, crop_vision_frame.shape[:2][::-1])
-		temp_masks.append(temp_mask)
-
-	occlusion_mask = numpy.minimum.reduce(temp_masks)
-	occlusion_mask = (cv2.GaussianBlur(occlusion_mask.clip(0, 1), (0, 0), 5).clip(0.5, 1) - 0.5) * 2
+		if face_occluder_model == 'many':
+			model_names = [ 'xseg_1', 'xseg_2', 'xseg_3' ]
+		else:
+			model_names = [ face_occluder_model ]
+
+		for model_name in model_names:
+			model_size = create_static_model_set('full').get(model_name).get('size')
+			prepare_vision_frame = cv2.resize(crop_vision_frame, model_size)
+			prepare_vision_frame = numpy.expand_dims(prepare_vision_frame, axis = 0).astype(numpy.float32) / 255.0
+			prepare_vision_frames.append(prepare_vision_frame)
+
+		temp_masks = forward_occlude_faces(prepare_vision_frames, model_names)
+
+		for index, temp_mask in enumerate(temp_masks):
+			temp_mask = temp_mask.clip(0, 1).astype(numpy.float32)
+			temp_masks[index] = cv2.resize(temp_mask, crop_vision_frame.shape[:2][::-1])
+
+		occlusion_mask = merge_masks(temp_masks)
+		occlusion_mask = blur_mask(occlusion_mask)
+		set_static_mask(crop_vision_frame, face_occluder_model, occlusion_mask)
 	return occlusion_mask
 
 
@@ -202,33 +218,55 @@ def create_area_mask(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLan
 			landmark_points.extend(facefusion.choices.face_mask_area_set.get(face_mask_area))
 
 	convex_hull = cv2.convexHull(face_landmark_68[landmark_points].astype(numpy.int32))
-	area_mask = numpy.zeros(crop_size).astype(numpy.float32)
+	area_mask = numpy.zeros(crop_size, dtype = numpy.float32)
 	cv2.fillConvexPoly(area_mask, convex_hull, 1.0) # type: ignore[call-overload]
-	area_mask = (cv2.GaussianBlur(area_mask.clip(0, 1), (0, 0), 5).clip(0.5, 1) - 0.5) * 2
+	area_mask = blur_mask(area_mask)
 	return area_mask
 
 
 def create_region_mask(crop_vision_frame : VisionFrame, face_mask_regions : List[FaceMaskRegion]) -> Mask:
 	model_name = state_manager.get_item('face_parser_model')
-	model_size = create_static_model_set('full').get(model_name).get('size')
-	prepare_vision_frame = cv2.resize(crop_vision_frame, model_size)
-	prepare_vision_frame = prepare_vision_frame[:, :, ::-1].astype(numpy.float32) / 255.0
-	prepare_vision_frame = numpy.subtract(prepare_vision_frame, numpy.array([ 0.485, 0.456, 0.406 ]).astype(numpy.float32))
-	prepare_vision_frame = numpy.divide(prepare_vision_frame, numpy.array([ 0.229, 0.224, 0.225 ]).astype(numpy.float32))
-	prepare_vision_frame = numpy.expand_dims(prepare_vision_frame, axis = 0)
-	prepare_vision_frame = prepare_vision_frame.transpose(0, 3, 1, 2)
-	region_mask = forward_parse_face(prepare_vision_frame)
-	region_mask = numpy.isin(region_mask.argmax(0), [ facefusion.choices.face_mask_region_set.get(face_mask_region) for face_mask_region in face_mask_regions ])
-	region_mask = cv2.resize(region_mask.astype(numpy.float32), crop_vision_frame.shape[:2][::-1])
-	region_mask = (cv2.GaussianBlur(region_mask.clip(0, 1), (0, 0), 5).clip(0.5, 1) - 0.5) * 2
+	mask_key = '.'.join([ model_name ] + face_mask_regions)
+	region_mask = get_static_mask(crop_vision_frame, mask_key)
+
+	if region_mask is None:
+		model_size = create_static_model_set('full').get(model_name).get('size')
+		prepare_vision_frame = cv2.resize(crop_vision_frame, model_size)
+		prepare_vision_frame = prepare_vision_frame[:, :, ::-1].astype(numpy.float32) / 255.0
+		prepare_vision_frame = numpy.subtract(prepare_vision_frame, numpy.array([ 0.485, 0.456, 0.406 ]).astype(numpy.float32))
+		prepare_vision_frame = numpy.divide(prepare_vision_frame, numpy.array([ 0.229, 0.224, 0.225 ]).astype(numpy.float32))
+		prepare_vision_frame = numpy.expand_dims(prepare_vision_frame, axis = 0)
+		prepare_vision_frame = prepare_vision_frame.transpose(0, 3, 1, 2)
+		region_mask = forward_parse_face(prepare_vision_frame)
+		region_mask = numpy.isin(region_mask.argmax(0), [ facefusion.choices.face_mask_region_set.get(face_mask_region) for face_mask_region in face_mask_regions ])
+		region_mask = cv2.resize(region_mask.astype(numpy.float32), crop_vision_frame.shape[:2][::-1])
+		region_mask = blur_mask(region_mask)
+		set_static_mask(crop_vision_frame, mask_key, region_mask)
 	return region_mask
 
 
+def blur_mask(temp_mask : Mask) -> Mask:
+	temp_mask = cv2.GaussianBlur(temp_mask, (0, 0), 5)
+	numpy.multiply(temp_mask, 2, out = temp_mask)
+	numpy.subtract(temp_mask, 1, out = temp_mask)
+	numpy.clip(temp_mask, 0, 1, out = temp_mask)
+	return temp_mask
+
+
+def merge_masks(temp_masks : List[Mask]) -> Mask:
+	crop_mask = temp_masks[0].astype(numpy.float32)
+
+	for temp_mask in temp_masks[1:]:
+		numpy.minimum(crop_mask, temp_mask, out = crop_mask)
+	numpy.clip(crop_mask, 0, 1, out = crop_mask)
+	return crop_mask
+
+
 def forward_occlude_face(prepare_vision_frame : VisionFrame, model_name : str) -> Mask:
 	face_occluder = get_inference_pool().get(model_name)
 
 	with conditional_thread_semaphore():
-		occlusion_mask : Mask = face_occluder.run(None,
+		occlusion_mask : Mask = inference_manager.run_inference(face_occluder,
 		{
 			'input': prepare_vision_frame
 		})[0][0]
@@ -236,12 +274,18 @@ def forward_occlude_face(prepare_vision_frame : VisionFrame, model_name : str) -
 	return occlusion_mask
 
 
+def forward_occlude_faces(prepare_vision_frames : List[VisionFrame], model_names : List[str]) -> List[Mask]:
+	if len(model_names) == 1:
+		return [ forward_occlude_face(prepare_vision_frames[0], model_names[0]) ]
+	return run_parallel([ partial(forward_occlude_face, prepare_vision_frame, model_name) for prepare_vision_frame, model_name in zip(prepare_vision_frames, model_names) ], len(model_names))
+
+
 def forward_parse_face(prepare_vision_frame : VisionFrame) -> Mask:
 	model_name = state_manager.get_item('face_parser_model')
 	face_parser = get_inference_pool().get(model_name)
 
 	with conditional_thread_semaphore():
-		region_mask : Mask = face_parser.run(None,
+		region_mask : Mask = inference_manager.run_inference(face_parser,
 		{
 			'input': prepare_vision_frame
 		})[0][0]
@@ -79,7 +79,7 @@ def forward(crop_vision_frame : VisionFrame) -> Embedding:
 	face_recognizer = get_inference_pool().get('face_recognizer')
 
 	with conditional_thread_semaphore():
-		face_embedding = face_recognizer.run(None,
+		face_embedding = inference_manager.run_inference(face_recognizer,
 		{
 			'input': crop_vision_frame
 		})[0]
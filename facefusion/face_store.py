@@ -1,12 +1,16 @@
+import threading
 from typing import List, Optional
 
 from facefusion.hash_helper import create_hash
-from facefusion.types import Face, FaceStore, VisionFrame
+from facefusion.types import Face, FaceStore, Mask, VisionFrame
 
 FACE_STORE : FaceStore =\
 {
-	'static_faces': {}
+	'static_faces': {},
+	'static_masks': {}
 }
+STATIC_MASK_LIMIT : int = 32
+STATIC_MASK_LOCK : threading.Lock = threading.Lock()
 
 
 def get_face_store() -> FaceStore:
@@ -26,3 +30,27 @@ def set_static_faces(vision_frame : VisionFrame, faces : List[Face]) -> None:
 
 def clear_static_faces() -> None:
 	FACE_STORE['static_faces'].clear()
+
+
+def get_static_mask(crop_vision_frame : VisionFrame, mask_key : str) -> Optional[Mask]:
+	mask_hash = create_mask_hash(crop_vision_frame, mask_key)
+	return FACE_STORE.get('static_masks').get(mask_hash)
+
+
+def set_static_mask(crop_vision_frame : VisionFrame, mask_key : str, mask : Mask) -> None:
+	mask_hash = create_mask_hash(crop_vision_frame, mask_key)
+	mask.setflags(write = False)
+
+	with STATIC_MASK_LOCK:
+		while len(FACE_STORE.get('static_masks')) >= STATIC_MASK_LIMIT:
+			FACE_STORE['static_masks'].pop(next(iter(FACE_STORE.get('static_masks'))))
+		FACE_STORE['static_masks'][mask_hash] = mask
+
+
+def clear_static_masks() -> None:
+	with STATIC_MASK_LOCK:
+		FACE_STORE['static_masks'].clear()
+
+
+def create_mask_hash(crop_vision_frame : VisionFrame, mask_key : str) -> str:
+	return mask_key + '.' + create_hash(crop_vision_frame.tobytes())
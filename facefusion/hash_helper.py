@@ -1,28 +1,72 @@
 import os
+import tempfile
+import threading
 import zlib
+from functools import lru_cache, partial
 from typing import Optional
 
-from facefusion.filesystem import get_file_name, is_file
+from facefusion import state_manager
+from facefusion.filesystem import create_directory, get_file_name, is_file, move_file, remove_file, resolve_relative_path
+from facefusion.json import read_json, write_json
+from facefusion.types import HashManifest
+
+HASH_MANIFEST_LOCK : threading.Lock = threading.Lock()
 
 
 def create_hash(content : bytes) -> str:
-	return format(zlib.crc32(content), '08x')
+	return format_hash_value(update_hash_value(0, content))
+
+
+def create_file_hash_value(file_path : str) -> int:
+	hash_value = 0
+
+	if is_file(file_path):
+		with open(file_path, 'rb') as file:
+			for content in iter(partial(file.read, 1024 * 1024), b''):
+				hash_value = update_hash_value(hash_value, content)
+	return hash_value
+
+
+def update_hash_value(hash_value : int, content : bytes) -> int:
+	return zlib.crc32(content, hash_value)
+
+
+def format_hash_value(hash_value : int) -> str:
+	return format(hash_value, '08x')
 
 
 def validate_hash(validate_path : str) -> bool:
-	hash_path = get_hash_path(validate_path)
+	hash_content = get_hash_content(validate_path)
 
-	if is_file(hash_path):
-		with open(hash_path) as hash_file:
-			hash_content = hash_file.read()
+	if hash_content:
+		if not state_manager.get_item('download_force_validation') and get_hash_manifest_entry(validate_path) == create_hash_manifest_entry(validate_path, hash_content):
+			return True
+
+		if format_hash_value(create_file_hash_value(validate_path)) == hash_content:
+			update_hash_manifest(validate_path, hash_content)
+			return True
+	return False
 
-		with open(validate_path, 'rb') as validate_file:
-			validate_content = validate_file.read()
 
-		return create_hash(validate_content) == hash_content
+def write_hash(validate_path : str) -> bool:
+	hash_path = get_hash_path(validate_path)
+
+	if hash_path:
+		with open(hash_path, 'w') as hash_file:
+			hash_file.write(format_hash_value(create_file_hash_value(validate_path)))
+		return is_file(hash_path)
 	return False
 
 
+def get_hash_content(validate_path : str) -> Optional[str]:
+	hash_path = get_hash_path(validate_path)
+
+	if is_file(hash_path) and hash_path != validate_path:
+		with open(hash_path) as hash_file:
+			return hash_file.read()
+	return None
+
+
 def get_hash_path(validate_path : str) -> Optional[str]:
 	if is_file(validate_path):
 		validate_directory_path, file_name_and_extension = os.path.split(validate_path)
@@ -30,3 +74,48 @@ def get_hash_path(validate_path : str) -> Optional[str]:
 
 		return os.path.join(validate_directory_path, validate_file_name + '.hash')
 	return None
+
+
+def get_hash_manifest_path() -> str:
+	return resolve_relative_path('../.caches/hash_manifest.json')
+
+
+@lru_cache()
+def read_static_hash_manifest() -> HashManifest:
+	return read_hash_manifest()
+
+
+def read_hash_manifest() -> HashManifest:
+	return read_json(get_hash_manifest_path()) or {} #type:ignore[return-value]
+
+
+def write_hash_manifest(hash_manifest : HashManifest) -> bool:
+	temp_manifest_file, temp_manifest_path = tempfile.mkstemp(dir = os.path.dirname(get_hash_manifest_path()), suffix = '.json')
+	os.close(temp_manifest_file)
+
+	try:
+		if write_json(temp_manifest_path, hash_manifest) and move_file(temp_manifest_path, get_hash_manifest_path()): #type:ignore[arg-type]
+			return True
+	finally:
+		remove_file(temp_manifest_path)
+	return False
+
+
+def get_hash_manifest_entry(validate_path : str) -> Optional[str]:
+	return read_static_hash_manifest().get(os.path.abspath(validate_path))
+
+
+def create_hash_manifest_entry(validate_path : str, hash_content : str) -> str:
+	validate_stat = os.stat(validate_path)
+	return '{size}:{mtime}:{inode}:{hash}'.format(size = validate_stat.st_size, mtime = validate_stat.st_mtime_ns, inode = validate_stat.st_ino, hash = hash_content)
+
+
+def update_hash_manifest(validate_path : str, hash_content : str) -> bool:
+	with HASH_MANIFEST_LOCK:
+		hash_manifest = read_static_hash_manifest()
+
+		for manifest_path, manifest_entry in read_hash_manifest().items():
+			hash_manifest.setdefault(manifest_path, manifest_entry)
+		hash_manifest[os.path.abspath(validate_path)] = create_hash_manifest_entry(validate_path, hash_content)
+
+		return create_directory(os.path.dirname(get_hash_manifest_path())) and write_hash_manifest(hash_manifest)
@@ -1,93 +1,456 @@
 import importlib
-import random
+import os
+import tempfile
+import threading
+from functools import partial
 from time import sleep, time
-from typing import List
+from typing import Any, List
 
-from onnxruntime import InferenceSession
+import numpy
+from onnxruntime import GraphOptimizationLevel, InferenceSession, OrtValue
 
-from facefusion import logger, process_manager, state_manager, wording
+from facefusion import logger, process_manager, profiler, state_manager, wording
 from facefusion.app_context import detect_app_context
-from facefusion.execution import create_inference_session_providers
+from facefusion.common_helper import get_first
+from facefusion.execution import create_inference_session_options, create_inference_session_providers, get_tune_options
 from facefusion.exit_helper import fatal_exit
-from facefusion.filesystem import get_file_name, is_file
+from facefusion.filesystem import create_directory, get_file_name, get_file_size, is_file, move_file, remove_file
+from facefusion.model_helper import get_optimized_model_path, resolve_precision_model_path, resolve_shared_model_path
+from facefusion.thread_helper import run_parallel
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import DownloadSet, ExecutionProvider, InferencePool, InferencePoolSet
+from facefusion.types import AppContext, DownloadSet, ExecutionPrecision, ExecutionProvider, InferenceBatchSet, InferenceBinding, InferenceBindingPool, InferenceBindingSet, InferenceCaptureSet, InferenceDispatchSet, InferenceInputs, InferenceLoadSet, InferenceMemory, InferencePool, InferencePoolSet, InferenceRequest, InferenceUsageSet, ModelInput
 
 INFERENCE_POOL_SET : InferencePoolSet =\
 {
 	'cli': {},
 	'ui': {}
 }
+INFERENCE_BINDING_SET : InferenceBindingSet = {}
+INFERENCE_CAPTURE_SET : InferenceCaptureSet = {}
+INFERENCE_LOAD_SET : InferenceLoadSet = {}
+INFERENCE_DISPATCH_SET : InferenceDispatchSet = {}
+INFERENCE_BATCH_SET : InferenceBatchSet = {}
+INFERENCE_USAGE_SET : InferenceUsageSet = {}
+INFERENCE_LOCK : threading.Lock = threading.Lock()
+INFERENCE_POOL_LOCK : threading.RLock = threading.RLock()
+INFERENCE_BINDING_CONDITION : threading.Condition = threading.Condition()
+INFERENCE_BINDING_SHAPE_LIMIT : int = 8
 
 
 def get_inference_pool(module_name : str, model_names : List[str], model_source_set : DownloadSet) -> InferencePool:
 	while process_manager.is_checking():
 		sleep(0.5)
 	execution_device_ids = state_manager.get_item('execution_device_ids')
+	execution_session_replica_count = state_manager.get_item('execution_session_replica_count') or 1
 	execution_providers = resolve_execution_providers(module_name)
+	execution_precision = resolve_execution_precision(module_name)
 	app_context = detect_app_context()
+	inference_contexts : List[str] = []
 
-	for execution_device_id in execution_device_ids:
-		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
+	with INFERENCE_POOL_LOCK:
+		for execution_device_id in execution_device_ids:
+			for replica_index in range(execution_session_replica_count):
+				inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers, replica_index)
 
-		if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
-			INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
-		if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
-			INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
-		if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(model_source_set, execution_device_id, execution_providers)
+				if app_context == 'cli' and INFERENCE_POOL_SET.get('ui').get(inference_context):
+					INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
+				if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
+					INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
+				if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
+					register_inference_usage(inference_context, model_source_set, execution_providers, execution_precision, inference_contexts)
+					INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(model_source_set, execution_device_id, execution_providers, execution_precision)
+				inference_contexts.append(inference_context)
 
-	current_inference_context = get_inference_context(module_name, model_names, random.choice(execution_device_ids), execution_providers)
-	return INFERENCE_POOL_SET.get(app_context).get(current_inference_context)
+		current_inference_context = dispatch_inference_context(module_name, app_context, inference_contexts)
+		update_inference_usage(current_inference_context)
+		return INFERENCE_POOL_SET.get(app_context).get(current_inference_context)
 
 
-def create_inference_pool(model_source_set : DownloadSet, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferencePool:
+def collect_inference_pools(module_name : str) -> List[InferencePool]:
+	app_context = detect_app_context()
+
+	with INFERENCE_POOL_LOCK:
+		return [ inference_pool for inference_context, inference_pool in INFERENCE_POOL_SET.get(app_context).items() if inference_context.startswith(module_name + '.') ]
+
+
+def register_inference_usage(inference_context : str, model_source_set : DownloadSet, execution_providers : List[ExecutionProvider], execution_precision : ExecutionPrecision, keep_inference_contexts : List[str]) -> None:
+	inference_memory = resolve_inference_memory(execution_providers)
+	inference_size = estimate_inference_size(model_source_set, execution_precision)
+
+	evict_inference_pools(inference_memory, inference_size, keep_inference_contexts + [ inference_context ])
+	INFERENCE_USAGE_SET[inference_context] =\
+	{
+		'memory': inference_memory,
+		'size': inference_size,
+		'access_time': time()
+	}
+
+
+def update_inference_usage(inference_context : str) -> None:
+	if inference_context in INFERENCE_USAGE_SET:
+		INFERENCE_USAGE_SET[inference_context]['access_time'] = time()
+
+
+def resolve_inference_memory(execution_providers : List[ExecutionProvider]) -> InferenceMemory:
+	if any(execution_provider != 'cpu' for execution_provider in execution_providers):
+		return 'video'
+	return 'system'
+
+
+def estimate_inference_size(model_source_set : DownloadSet, execution_precision : ExecutionPrecision) -> int:
+	return sum(get_file_size(resolve_precision_model_path(model_source.get('path'), execution_precision)) for model_source in model_source_set.values())
+
+
+def evict_inference_pools(inference_memory : InferenceMemory, inference_size : int, keep_inference_contexts : List[str]) -> None:
+	memory_budget = resolve_memory_budget(inference_memory)
+
+	with INFERENCE_POOL_LOCK:
+		inference_usages = [ (inference_context, inference_usage) for inference_context, inference_usage in INFERENCE_USAGE_SET.items() if inference_usage.get('memory') == inference_memory ]
+		memory_usage = sum(inference_usage.get('size') for _, inference_usage in inference_usages)
+
+		if memory_budget > 0:
+			for inference_context, inference_usage in sorted(inference_usages, key = lambda inference_item: inference_item[1].get('access_time')):
+				if memory_usage + inference_size <= memory_budget:
+					break
+
+				if inference_context not in keep_inference_contexts:
+					remove_inference_pool(inference_context)
+					memory_usage -= inference_usage.get('size')
+					logger.debug(wording.get('evicting_inference_pool').format(inference_context = inference_context, memory = inference_memory), __name__)
+
+
+def resolve_memory_budget(inference_memory : InferenceMemory) -> int:
+	if inference_memory == 'video':
+		return (state_manager.get_item('video_memory_budget') or 0) * (1024 ** 2)
+	return (state_manager.get_item('system_memory_budget') or 0) * (1024 ** 2)
+
+
+def remove_inference_pool(inference_context : str) -> None:
+	with INFERENCE_POOL_LOCK:
+		for app_context in INFERENCE_POOL_SET.keys():
+			inference_pool = INFERENCE_POOL_SET.get(app_context).pop(inference_context, None)
+
+			if inference_pool:
+				for inference_session in inference_pool.values():
+					INFERENCE_BINDING_SET.pop(id(inference_session), None)
+
+		INFERENCE_USAGE_SET.pop(inference_context, None)
+
+
+def dispatch_inference_context(module_name : str, app_context : AppContext, inference_contexts : List[str]) -> str:
+	with INFERENCE_LOCK:
+		dispatch_index = INFERENCE_DISPATCH_SET.get(module_name, 0) % len(inference_contexts)
+		INFERENCE_DISPATCH_SET[module_name] = dispatch_index + 1
+		inference_contexts = inference_contexts[dispatch_index:] + inference_contexts[:dispatch_index]
+
+		if state_manager.get_item('execution_dispatch_mode') == 'round_robin':
+			return get_first(inference_contexts)
+		return min(inference_contexts, key = lambda inference_context: calculate_inference_load(INFERENCE_POOL_SET.get(app_context).get(inference_context)))
+
+
+def calculate_inference_load(inference_pool : InferencePool) -> int:
+	return sum(INFERENCE_LOAD_SET.get(id(inference_session), 0) for inference_session in inference_pool.values())
+
+
+def create_inference_pool(model_source_set : DownloadSet, execution_device_id : str, execution_providers : List[ExecutionProvider], execution_precision : ExecutionPrecision) -> InferencePool:
 	inference_pool : InferencePool = {}
+	model_paths = {}
 
 	for model_name in model_source_set.keys():
-		model_path = model_source_set.get(model_name).get('path')
+		model_path = resolve_precision_model_path(model_source_set.get(model_name).get('path'), execution_precision)
 		if is_file(model_path):
-			inference_pool[model_name] = create_inference_session(model_path, execution_device_id, execution_providers)
+			model_paths[model_name] = model_path
+
+	inference_sessions = run_parallel([ partial(create_inference_session, model_path, execution_device_id, execution_providers) for model_path in model_paths.values() ])
 
+	for model_name, inference_session in zip(model_paths.keys(), inference_sessions):
+		inference_pool[model_name] = inference_session
 	return inference_pool
 
 
 def clear_inference_pool(module_name : str, model_names : List[str]) -> None:
 	execution_device_ids = state_manager.get_item('execution_device_ids')
+	execution_session_replica_count = state_manager.get_item('execution_session_replica_count') or 1
 	execution_providers = resolve_execution_providers(module_name)
 	app_context = detect_app_context()
 
-	for execution_device_id in execution_device_ids:
-		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
+	if resolve_memory_budget(resolve_inference_memory(execution_providers)) > 0:
+		return
 
-		if INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			del INFERENCE_POOL_SET[app_context][inference_context]
+	with INFERENCE_POOL_LOCK:
+		for execution_device_id in execution_device_ids:
+			for replica_index in range(execution_session_replica_count):
+				inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers, replica_index)
+
+				if INFERENCE_POOL_SET.get(app_context).get(inference_context):
+					del INFERENCE_POOL_SET[app_context][inference_context]
+				if not INFERENCE_POOL_SET.get('cli').get(inference_context) and not INFERENCE_POOL_SET.get('ui').get(inference_context):
+					INFERENCE_USAGE_SET.pop(inference_context, None)
+
+		INFERENCE_BINDING_SET.clear()
+		INFERENCE_LOAD_SET.clear()
+		INFERENCE_BATCH_SET.clear()
 
 
 def create_inference_session(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferenceSession:
 	model_file_name = get_file_name(model_path)
+	execution_thread_count = state_manager.get_item('execution_thread_count') or 1
+	execution_session_thread_count = state_manager.get_item('execution_session_thread_count') or 0
+	tune_options = get_tune_options(model_path, execution_providers)
+	profile_file_prefix = profiler.create_profile_file_prefix(model_path)
+	temp_model_path = None
 	start_time = time()
 
 	try:
 		# Ensure device id is a string for downstream provider configs
-		inference_session_providers = create_inference_session_providers(str(execution_device_id), execution_providers)
-		inference_session = InferenceSession(model_path, providers = inference_session_providers)
+		inference_session_providers = create_inference_session_providers(str(execution_device_id), execution_providers, tune_options)
+		optimized_model_path = get_optimized_model_path(model_path, execution_providers, tune_options.get('graph_optimization_level'))
+		shared_model_path = resolve_shared_model_path(model_path) if state_manager.get_item('execution_share_weights') else None
+
+		if shared_model_path:
+			inference_session_options = create_inference_session_options(execution_thread_count, execution_session_thread_count, None, tune_options, profile_file_prefix, True)
+			inference_session = InferenceSession(shared_model_path, sess_options = inference_session_options, providers = inference_session_providers)
+		elif is_file(optimized_model_path):
+			inference_session_options = create_inference_session_options(execution_thread_count, execution_session_thread_count, None, tune_options, profile_file_prefix)
+			inference_session_options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+			inference_session = InferenceSession(optimized_model_path, sess_options = inference_session_options, providers = inference_session_providers)
+		elif optimized_model_path and create_directory(os.path.dirname(optimized_model_path)):
+			temp_model_file, temp_model_path = tempfile.mkstemp(dir = os.path.dirname(optimized_model_path), suffix = '.onnx')
+			os.close(temp_model_file)
+			inference_session_options = create_inference_session_options(execution_thread_count, execution_session_thread_count, temp_model_path, tune_options, profile_file_prefix)
+			inference_session = InferenceSession(model_path, sess_options = inference_session_options, providers = inference_session_providers)
+			move_file(temp_model_path, optimized_model_path)
+		else:
+			inference_session_options = create_inference_session_options(execution_thread_count, execution_session_thread_count, None, tune_options, profile_file_prefix)
+			inference_session = InferenceSession(model_path, sess_options = inference_session_options, providers = inference_session_providers)
+		if profile_file_prefix:
+			profiler.register_inference_session(model_path, inference_session)
 		logger.debug(wording.get('loading_model_succeeded').format(model_name = model_file_name, seconds = calculate_end_time(start_time)), __name__)
 		return inference_session
 
 	except Exception:
+		if temp_model_path:
+			remove_file(temp_model_path)
 		logger.error(wording.get('loading_model_failed').format(model_name = model_file_name), __name__)
 		fatal_exit(1)
 
 
+def run_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> Any:
+	update_inference_load(inference_session, 1)
+
+	if id(inference_session) in INFERENCE_CAPTURE_SET:
+		INFERENCE_CAPTURE_SET[id(inference_session)].append(inference_inputs)
+
+	try:
+		if has_inference_batch(inference_session, inference_inputs):
+			return run_inference_batch(inference_session, inference_inputs)
+		return forward_inference(inference_session, inference_inputs)
+	finally:
+		update_inference_load(inference_session, -1)
+
+
+def forward_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> Any:
+	if has_inference_binding(inference_session):
+		return run_inference_binding(inference_session, inference_inputs)
+	return inference_session.run(None, inference_inputs)
+
+
+def capture_inference(inference_session : InferenceSession) -> None:
+	INFERENCE_CAPTURE_SET[id(inference_session)] = []
+
+
+def release_inference_capture(inference_session : InferenceSession) -> List[InferenceInputs]:
+	return INFERENCE_CAPTURE_SET.pop(id(inference_session), [])
+
+
+def update_inference_load(inference_session : InferenceSession, inference_load : int) -> None:
+	with INFERENCE_LOCK:
+		INFERENCE_LOAD_SET[id(inference_session)] = INFERENCE_LOAD_SET.get(id(inference_session), 0) + inference_load
+
+
+def has_inference_batch(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> bool:
+	execution_batch_size = state_manager.get_item('execution_batch_size') or 1
+
+	if execution_batch_size > 1 and all(isinstance(input_value, numpy.ndarray) and input_value.ndim > 0 for input_value in inference_inputs.values()):
+		return all(model_value.shape and not isinstance(get_first(model_value.shape), int) for model_value in inference_session.get_inputs() + inference_session.get_outputs())
+	return False
+
 
-def get_inference_context(module_name : str, model_names : List[str], execution_device_id : str, execution_providers : List[ExecutionProvider]) -> str:
+def run_inference_batch(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> Any:
+	execution_batch_size = state_manager.get_item('execution_batch_size')
+	execution_batch_timeout = state_manager.get_item('execution_batch_timeout') or 0
+	inference_batch_key = str(id(inference_session)) + '.' + '.'.join(input_name + str(input_value.shape[1:]) + input_value.dtype.str for input_name, input_value in inference_inputs.items())
+	inference_request : InferenceRequest =\
+	{
+		'inference_inputs': inference_inputs,
+		'inference_outputs': [],
+		'event': threading.Event()
+	}
+
+	with INFERENCE_LOCK:
+		inference_requests = INFERENCE_BATCH_SET.get(inference_batch_key)
+
+		if inference_requests:
+			inference_requests.append(inference_request)
+
+			if len(inference_requests) >= execution_batch_size:
+				del INFERENCE_BATCH_SET[inference_batch_key]
+				get_first(inference_requests).get('event').set()
+		else:
+			inference_requests = [ inference_request ]
+			INFERENCE_BATCH_SET[inference_batch_key] = inference_requests
+
+	if inference_request is get_first(inference_requests):
+		inference_request.get('event').wait(execution_batch_timeout / 1000)
+
+		with INFERENCE_LOCK:
+			if INFERENCE_BATCH_SET.get(inference_batch_key) is inference_requests:
+				del INFERENCE_BATCH_SET[inference_batch_key]
+
+		forward_inference_batch(inference_session, inference_requests)
+	else:
+		inference_request.get('event').wait()
+
+	if inference_request.get('inference_outputs'):
+		return inference_request.get('inference_outputs')
+	return forward_inference(inference_session, inference_inputs)
+
+
+def forward_inference_batch(inference_session : InferenceSession, inference_requests : List[InferenceRequest]) -> None:
+	input_names = get_first(inference_requests).get('inference_inputs').keys()
+	batch_index = 0
+
+	try:
+		batch_inputs = { input_name: numpy.concatenate([ inference_request.get('inference_inputs').get(input_name) for inference_request in inference_requests ]) for input_name in input_names }
+		batch_total = len(get_first(list(batch_inputs.values())))
+		batch_outputs = forward_inference(inference_session, batch_inputs)
+
+		if any(len(batch_output) != batch_total for batch_output in batch_outputs):
+			return
+
+		for inference_request in inference_requests:
+			batch_size = len(get_first(list(inference_request.get('inference_inputs').values())))
+			inference_request['inference_outputs'] = [ batch_output[batch_index:batch_index + batch_size] for batch_output in batch_outputs ]
+			batch_index += batch_size
+	finally:
+		for inference_request in inference_requests:
+			inference_request.get('event').set()
+
+
+def has_inference_binding(inference_session : InferenceSession) -> bool:
+	return get_first(inference_session.get_providers()) in [ 'CUDAExecutionProvider', 'TensorrtExecutionProvider' ]
+
+
+def run_inference_binding(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> Any:
+	inference_binding_pool = get_inference_binding_pool(inference_session)
+	inference_binding = acquire_inference_binding(inference_session, inference_binding_pool)
+
+	try:
+		return forward_inference_binding(inference_session, inference_binding, inference_inputs)
+	finally:
+		release_inference_binding(inference_binding_pool, inference_binding)
+
+
+def forward_inference_binding(inference_session : InferenceSession, inference_binding : InferenceBinding, inference_inputs : InferenceInputs) -> Any:
+	io_binding = inference_binding.get('io_binding')
+	input_signature = '.'.join(input_name + str(numpy.shape(input_value)) for input_name, input_value in inference_inputs.items())
+	output_static = has_static_outputs(inference_session)
+	output_values = inference_binding.get('output_values').get(input_signature) if output_static else None
+
+	if not output_values and len(inference_binding.get('output_values')) >= INFERENCE_BINDING_SHAPE_LIMIT:
+		inference_binding.get('input_values').clear()
+		inference_binding.get('output_values').clear()
+
+	for input_name, input_value in inference_inputs.items():
+		io_binding.bind_ortvalue_input(input_name, get_device_input_value(inference_binding, input_name, input_value))
+
+	for index, model_output in enumerate(inference_session.get_outputs()):
+		if output_values:
+			io_binding.bind_ortvalue_output(model_output.name, output_values[index])
+		else:
+			io_binding.bind_output(model_output.name, 'cuda', inference_binding.get('device_id'))
+
+	inference_session.run_with_iobinding(io_binding)
+
+	if output_static and not output_values:
+		inference_binding['output_values'][input_signature] = io_binding.get_outputs()
+	return io_binding.copy_outputs_to_cpu()
+
+
+def has_static_outputs(inference_session : InferenceSession) -> bool:
+	return all(isinstance(output_dim, int) for model_output in inference_session.get_outputs() for output_dim in model_output.shape)
+
+
+def get_inference_binding_pool(inference_session : InferenceSession) -> InferenceBindingPool:
+	with INFERENCE_BINDING_CONDITION:
+		return INFERENCE_BINDING_SET.setdefault(id(inference_session),
+		{
+			'inference_bindings': [],
+			'binding_total': 0
+		})
+
+
+def acquire_inference_binding(inference_session : InferenceSession, inference_binding_pool : InferenceBindingPool) -> InferenceBinding:
+	binding_limit = state_manager.get_item('execution_thread_count') or 1
+
+	with INFERENCE_BINDING_CONDITION:
+		while not inference_binding_pool.get('inference_bindings') and inference_binding_pool.get('binding_total') >= binding_limit:
+			INFERENCE_BINDING_CONDITION.wait()
+
+		if inference_binding_pool.get('inference_bindings'):
+			return inference_binding_pool.get('inference_bindings').pop()
+		inference_binding_pool['binding_total'] += 1
+
+	return create_inference_binding(inference_session)
+
+
+def release_inference_binding(inference_binding_pool : InferenceBindingPool, inference_binding : InferenceBinding) -> None:
+	with INFERENCE_BINDING_CONDITION:
+		inference_binding_pool.get('inference_bindings').append(inference_binding)
+		INFERENCE_BINDING_CONDITION.notify()
+
+
+def create_inference_binding(inference_session : InferenceSession) -> InferenceBinding:
+	provider_options = inference_session.get_provider_options().get(get_first(inference_session.get_providers()))
+
+	return\
+	{
+		'io_binding': inference_session.io_binding(),
+		'device_id': int(provider_options.get('device_id', 0)),
+		'input_values': {},
+		'output_values': {}
+	}
+
+
+def get_device_input_value(inference_binding : InferenceBinding, input_name : str, model_input : ModelInput) -> OrtValue:
+	model_input = numpy.ascontiguousarray(model_input)
+	input_key = input_name + str(model_input.shape) + model_input.dtype.str
+	input_value = inference_binding.get('input_values').get(input_key)
+
+	if input_value is not None:
+		input_value.update_inplace(model_input)
+	else:
+		input_value = OrtValue.ortvalue_from_numpy(model_input, 'cuda', inference_binding.get('device_id'))
+		inference_binding['input_values'][input_key] = input_value
+	return input_value
+
+
+def get_inference_context(module_name : str, model_names : List[str], execution_device_id : str, execution_providers : List[ExecutionProvider], replica_index : int = 0) -> str:
 	# Cast all parts to strings to avoid join errors when device id is an int
 	provider_ids = [ str(provider) for provider in execution_providers ]
 	inference_context = '.'.join([ module_name ] + model_names + [ str(execution_device_id) ] + provider_ids)
+
+	if replica_index > 0:
+		inference_context += '.' + str(replica_index)
 	return inference_context
 
 
+def resolve_execution_precision(module_name : str) -> ExecutionPrecision:
+	if module_name == 'facefusion.content_analyser':
+		return 'fp32'
+	return state_manager.get_item('execution_precision')
+
+
 def resolve_execution_providers(module_name : str) -> List[ExecutionProvider]:
 	module = importlib.import_module(module_name)
 
@@ -1,4 +1,6 @@
-from facefusion.ffmpeg import concat_video
+from functools import partial
+
+from facefusion.app_context import run_in_app_context
 from facefusion.filesystem import are_images, are_videos, move_file, remove_file
 from facefusion.jobs import job_helper, job_manager
 from facefusion.types import JobOutputSet, JobStep, ProcessStep
@@ -55,7 +57,7 @@ def retry_jobs(process_step : ProcessStep, halt_on_error : bool) -> bool:
 def run_step(job_id : str, step_index : int, step : JobStep, process_step : ProcessStep) -> bool:
 	step_args = step.get('args')
 
-	if job_manager.set_step_status(job_id, step_index, 'started') and process_step(job_id, step_index, step_args):
+	if job_manager.set_step_status(job_id, step_index, 'started') and run_in_app_context('cli', partial(process_step, job_id, step_index, step_args)):
 		output_path = step_args.get('output_path')
 		step_output_path = job_helper.get_step_output_path(job_id, step_index, output_path)
 
@@ -76,6 +78,8 @@ def run_steps(job_id : str, process_step : ProcessStep) -> bool:
 
 
 def finalize_steps(job_id : str) -> bool:
+	from facefusion.ffmpeg import concat_video
+
 	output_set = collect_output_set(job_id)
 
 	for output_path, temp_output_paths in output_set.items():
@@ -1,11 +1,186 @@
+import os
+import tempfile
 from functools import lru_cache
+from types import ModuleType
+from typing import List, Optional
 
+import cv2
+import numpy
 import onnx
+import onnxruntime
+from onnxruntime import InferenceSession, NodeArg
 
-from facefusion.types import ModelInitializer
+import facefusion.choices
+from facefusion import state_manager
+from facefusion.filesystem import get_file_name, is_file, move_file, remove_directory, remove_file, resolve_relative_path
+from facefusion.hash_helper import create_hash, get_hash_path, validate_hash
+from facefusion.types import ExecutionPrecision, ExecutionProvider, GraphOptimizationLevelName, ModelInitializer, ModelInputs, QuantizePrecision, Resolution, VisionFrame
 
 
 @lru_cache()
 def get_static_model_initializer(model_path : str) -> ModelInitializer:
+	initializer_path = get_model_initializer_path(model_path)
+
+	if initializer_path and is_file(initializer_path):
+		return numpy.load(initializer_path, mmap_mode = 'r')
+
 	model = onnx.load(model_path)
-	return onnx.numpy_helper.to_array(model.graph.initializer[-1])
+	model_initializer = onnx.numpy_helper.to_array(model.graph.initializer[-1])
+
+	if initializer_path:
+		write_model_initializer(initializer_path, model_initializer)
+	return model_initializer
+
+
+def get_model_hash(model_path : str) -> Optional[str]:
+	hash_path = get_hash_path(model_path)
+
+	if is_file(hash_path):
+		with open(hash_path) as hash_file:
+			return hash_file.read().strip()
+	return None
+
+
+def get_model_initializer_path(model_path : str) -> Optional[str]:
+	model_hash = get_model_hash(model_path)
+
+	if model_hash:
+		model_directory_path, model_file_name_and_extension = os.path.split(model_path)
+		model_file_name = get_file_name(model_file_name_and_extension)
+
+		return os.path.join(model_directory_path, model_file_name + '.' + model_hash + '.npy')
+	return None
+
+
+def get_optimized_model_path(model_path : str, execution_providers : List[ExecutionProvider], graph_optimization_level : Optional[GraphOptimizationLevelName]) -> Optional[str]:
+	model_hash = get_model_hash(model_path)
+
+	if model_hash and set(execution_providers).issubset(facefusion.choices.execution_optimize_providers):
+		model_file_name = get_file_name(model_path)
+		optimized_hash = create_hash('.'.join([ model_hash ] + execution_providers + [ graph_optimization_level or 'extended', onnxruntime.__version__ ]).encode())
+
+		return resolve_relative_path('../.caches/' + model_file_name + '.' + optimized_hash + '.onnx')
+	return None
+
+
+def get_shared_model_path(model_path : str) -> Optional[str]:
+	model_hash = get_model_hash(model_path)
+
+	if model_hash:
+		model_directory_path, model_file_name_and_extension = os.path.split(model_path)
+		model_file_name = get_file_name(model_file_name_and_extension)
+
+		return os.path.join(model_directory_path, model_file_name + '.' + model_hash + '.shared.onnx')
+	return None
+
+
+def resolve_shared_model_path(model_path : str) -> Optional[str]:
+	shared_model_path = get_shared_model_path(model_path)
+
+	if shared_model_path and not is_file(shared_model_path):
+		write_shared_model(model_path, shared_model_path)
+	if shared_model_path and is_file(shared_model_path):
+		return shared_model_path
+	return None
+
+
+def write_shared_model(model_path : str, shared_model_path : str) -> bool:
+	shared_model_directory_path, shared_model_file_name = os.path.split(shared_model_path)
+	shared_data_file_name = shared_model_file_name + '.data'
+	temp_directory_path = tempfile.mkdtemp(dir = shared_model_directory_path)
+
+	try:
+		onnx.save_model(onnx.load(model_path), os.path.join(temp_directory_path, shared_model_file_name), save_as_external_data = True, all_tensors_to_one_file = True, location = shared_data_file_name, size_threshold = 1024)
+	except (OSError, ValueError):
+		remove_directory(temp_directory_path)
+		return False
+
+	move_file(os.path.join(temp_directory_path, shared_data_file_name), os.path.join(shared_model_directory_path, shared_data_file_name))
+	move_file(os.path.join(temp_directory_path, shared_model_file_name), shared_model_path)
+	remove_directory(temp_directory_path)
+	return is_file(shared_model_path)
+
+
+def write_model_initializer(initializer_path : str, model_initializer : ModelInitializer) -> bool:
+	temp_initializer_file, temp_initializer_path = tempfile.mkstemp(dir = os.path.dirname(initializer_path), suffix = '.npy')
+
+	try:
+		with os.fdopen(temp_initializer_file, 'wb') as temp_file:
+			numpy.save(temp_file, model_initializer)
+		return move_file(temp_initializer_path, initializer_path)
+	except OSError:
+		return False
+	finally:
+		remove_file(temp_initializer_path)
+
+
+def get_precision_model_path(model_path : str, precision : QuantizePrecision) -> str:
+	model_directory_path, model_file_name_and_extension = os.path.split(model_path)
+	model_file_name = get_file_name(model_file_name_and_extension)
+	return os.path.join(model_directory_path, model_file_name + '.' + precision + '.onnx')
+
+
+def resolve_precision_model_path(model_path : str, execution_precision : ExecutionPrecision) -> str:
+	if execution_precision in [ 'fp16', 'int8' ]:
+		precision_model_path = get_precision_model_path(model_path, execution_precision) #type:ignore[arg-type]
+
+		if is_file(precision_model_path) and validate_hash(precision_model_path):
+			return precision_model_path
+	return model_path
+
+
+def collect_model_modules() -> List[ModuleType]:
+	from facefusion import content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, voice_extractor
+	from facefusion.processors.core import get_processors_modules
+
+	common_modules =\
+	[
+		content_analyser,
+		face_classifier,
+		face_detector,
+		face_landmarker,
+		face_masker,
+		face_recognizer,
+		voice_extractor
+	]
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	return common_modules + processor_modules
+
+
+def create_model_inputs(inference_session : InferenceSession, vision_frame : VisionFrame, model_resolution : Optional[Resolution] = None) -> ModelInputs:
+	random_generator = numpy.random.default_rng(0)
+	model_inputs : ModelInputs = {}
+
+	for model_input in inference_session.get_inputs():
+		model_shape = resolve_model_shape(model_input, model_resolution)
+		model_type = 'float32'
+
+		if model_input.type == 'tensor(float16)':
+			model_type = 'float16'
+		if model_input.type == 'tensor(int64)':
+			model_type = 'int64'
+
+		if len(model_shape) == 4 and model_shape[1] == 3:
+			crop_vision_frame = cv2.resize(vision_frame, (model_shape[3], model_shape[2]))
+			prepare_vision_frame = crop_vision_frame[:, :, ::-1].transpose(2, 0, 1) / 255.0
+			model_inputs[model_input.name] = numpy.repeat(numpy.expand_dims(prepare_vision_frame, axis = 0), model_shape[0], axis = 0).astype(model_type)
+		else:
+			model_inputs[model_input.name] = random_generator.standard_normal(model_shape).astype(model_type)
+
+	return model_inputs
+
+
+def resolve_model_shape(model_input : NodeArg, model_resolution : Optional[Resolution] = None) -> List[int]:
+	model_shape = []
+
+	for index, model_dimension in enumerate(model_input.shape):
+		if isinstance(model_dimension, int) and model_dimension > 0:
+			model_shape.append(model_dimension)
+		elif index == 0:
+			model_shape.append(1)
+		elif model_resolution and len(model_input.shape) == 4 and index > 1:
+			model_shape.append(model_resolution[3 - index])
+		else:
+			model_shape.append(256)
+
+	return model_shape
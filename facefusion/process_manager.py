@@ -1,6 +1,10 @@
+import threading
+
 from facefusion.types import ProcessState
 
 PROCESS_STATE : ProcessState = 'pending'
+PROCESS_CHECK_TOTAL : int = 0
+PROCESS_LOCK : threading.Lock = threading.Lock()
 
 
 def get_process_state() -> ProcessState:
@@ -30,7 +34,11 @@ def is_pending() -> bool:
 
 
 def check() -> None:
-	set_process_state('checking')
+	global PROCESS_CHECK_TOTAL
+
+	with PROCESS_LOCK:
+		PROCESS_CHECK_TOTAL += 1
+		set_process_state('checking')
 
 
 def start() -> None:
@@ -42,4 +50,10 @@ def stop() -> None:
 
 
 def end() -> None:
-	set_process_state('pending')
+	global PROCESS_CHECK_TOTAL
+
+	with PROCESS_LOCK:
+		PROCESS_CHECK_TOTAL = max(0, PROCESS_CHECK_TOTAL - 1)
+
+		if PROCESS_CHECK_TOTAL == 0:
+			set_process_state('pending')
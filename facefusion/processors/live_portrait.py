@@ -1,9 +1,11 @@
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy
-import scipy
 
-from facefusion.processors.types import LivePortraitExpression, LivePortraitPitch, LivePortraitRoll, LivePortraitRotation, LivePortraitYaw
+from facefusion import inference_manager
+from facefusion.processors.types import LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotion, LivePortraitPitch, LivePortraitRoll, LivePortraitRotation, LivePortraitYaw
+from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.types import InferencePool, VisionFrame
 
 EXPRESSION_MIN = numpy.array(
 [
@@ -96,6 +98,75 @@ def calculate_euler_limits(pitch : LivePortraitPitch, yaw : LivePortraitYaw, rol
 
 
 def create_rotation(pitch : LivePortraitPitch, yaw : LivePortraitYaw, roll : LivePortraitRoll) -> LivePortraitRotation:
-	rotation = scipy.spatial.transform.Rotation.from_euler('xyz', [ pitch, yaw, roll ], degrees = True).as_matrix()
-	rotation = rotation.astype(numpy.float32)
+	pitch_sin, yaw_sin, roll_sin = numpy.sin(numpy.radians([ pitch, yaw, roll ])).ravel()
+	pitch_cos, yaw_cos, roll_cos = numpy.cos(numpy.radians([ pitch, yaw, roll ])).ravel()
+	rotation = numpy.array(
+	[
+		[ yaw_cos * roll_cos, pitch_sin * yaw_sin * roll_cos - pitch_cos * roll_sin, pitch_cos * yaw_sin * roll_cos + pitch_sin * roll_sin ],
+		[ yaw_cos * roll_sin, pitch_sin * yaw_sin * roll_sin + pitch_cos * roll_cos, pitch_cos * yaw_sin * roll_sin - pitch_sin * roll_cos ],
+		[ -yaw_sin, pitch_sin * yaw_cos, pitch_cos * yaw_cos ]
+	]).astype(numpy.float32)
 	return rotation
+
+
+def copy_motion(motion : LivePortraitMotion) -> LivePortraitMotion:
+	return tuple(numpy.copy(motion_value) for motion_value in motion) #type:ignore[return-value]
+
+
+def extract_motions(inference_pool : InferencePool, crop_vision_frames : List[VisionFrame]) -> List[LivePortraitMotion]:
+	extract_vision_frames : List[VisionFrame] = []
+	extract_positions = []
+
+	for crop_vision_frame in crop_vision_frames:
+		extract_position = len(extract_vision_frames)
+
+		for index, extract_vision_frame in enumerate(extract_vision_frames):
+			if numpy.array_equal(crop_vision_frame, extract_vision_frame):
+				extract_position = index
+
+		if extract_position == len(extract_vision_frames):
+			extract_vision_frames.append(crop_vision_frame)
+		extract_positions.append(extract_position)
+
+	motions = forward_extract_motions(inference_pool, extract_vision_frames)
+	return [ copy_motion(motions[extract_position]) for extract_position in extract_positions ]
+
+
+def forward_extract_feature(inference_pool : InferencePool, crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
+	feature_extractor = inference_pool.get('feature_extractor')
+
+	with conditional_thread_semaphore():
+		feature_volume = inference_manager.run_inference(feature_extractor,
+		{
+			'input': crop_vision_frame
+		})[0]
+
+	return feature_volume
+
+
+def forward_extract_motion(inference_pool : InferencePool, crop_vision_frame : VisionFrame) -> LivePortraitMotion:
+	motion_extractor = inference_pool.get('motion_extractor')
+
+	with conditional_thread_semaphore():
+		pitch, yaw, roll, scale, translation, expression, motion_points = inference_manager.run_inference(motion_extractor,
+		{
+			'input': crop_vision_frame
+		})
+
+	return pitch, yaw, roll, scale, translation, expression, motion_points
+
+
+def forward_extract_motions(inference_pool : InferencePool, crop_vision_frames : List[VisionFrame]) -> List[LivePortraitMotion]:
+	motion_extractor = inference_pool.get('motion_extractor')
+	batch_size = motion_extractor.get_inputs()[0].shape[0]
+
+	if len(crop_vision_frames) == 1 or isinstance(batch_size, int):
+		return [ forward_extract_motion(inference_pool, crop_vision_frame) for crop_vision_frame in crop_vision_frames ]
+
+	with conditional_thread_semaphore():
+		motion_outputs = inference_manager.run_inference(motion_extractor,
+		{
+			'input': numpy.concatenate(crop_vision_frames)
+		})
+
+	return [ tuple(motion_output[index:index + 1] for motion_output in motion_outputs) for index in range(len(crop_vision_frames)) ] #type:ignore[misc]
@@ -12,14 +12,14 @@ from facefusion.common_helper import create_int_metavar, is_macos
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
 from facefusion.face_analyser import scale_face
-from facefusion.face_helper import merge_matrix, paste_back, scale_face_landmark_5, warp_face_by_face_landmark_5
-from facefusion.face_masker import create_box_mask, create_occlusion_mask
+from facefusion.face_helper import merge_matrix, paste_back_in_place, scale_face_landmark_5, warp_face_by_face_landmark_5
+from facefusion.face_masker import create_box_mask, create_occlusion_mask, merge_masks
 from facefusion.face_selector import select_faces
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import AgeModifierDirection, AgeModifierInputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
+from facefusion.thread_helper import inference_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import match_frame_color, read_static_image, read_static_video_frame
 
@@ -152,9 +152,9 @@ def modify_age(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFra
 	extend_vision_frame = normalize_extend_frame(extend_vision_frame)
 	extend_vision_frame = match_frame_color(extend_vision_frame_raw, extend_vision_frame)
 	extend_affine_matrix *= (model_sizes.get('target')[0] * 4) / model_sizes.get('target_with_background')[0]
-	crop_mask = numpy.minimum.reduce(crop_masks).clip(0, 1)
+	crop_mask = merge_masks(crop_masks)
 	crop_mask = cv2.resize(crop_mask, (model_sizes.get('target')[0] * 4, model_sizes.get('target')[1] * 4))
-	paste_vision_frame = paste_back(temp_vision_frame, extend_vision_frame, crop_mask, extend_affine_matrix)
+	paste_vision_frame = paste_back_in_place(temp_vision_frame, extend_vision_frame, crop_mask, extend_affine_matrix)
 	return paste_vision_frame
 
 
@@ -173,8 +173,8 @@ def forward(crop_vision_frame : VisionFrame, extend_vision_frame : VisionFrame,
 		if age_modifier_input.name == 'direction':
 			age_modifier_inputs[age_modifier_input.name] = age_modifier_direction
 
-	with thread_semaphore():
-		crop_vision_frame = age_modifier.run(None, age_modifier_inputs)[0][0]
+	with inference_semaphore(__name__):
+		crop_vision_frame = inference_manager.run_inference(age_modifier, age_modifier_inputs)[0][0]
 
 	return crop_vision_frame
 
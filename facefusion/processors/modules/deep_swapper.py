@@ -12,14 +12,14 @@ from facefusion import config, content_analyser, face_classifier, face_detector,
 from facefusion.common_helper import create_int_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url_by_provider
 from facefusion.face_analyser import scale_face
-from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
-from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
+from facefusion.face_helper import paste_back_in_place, warp_face_by_face_landmark_5
+from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask, merge_masks
 from facefusion.face_selector import select_faces
 from facefusion.filesystem import get_file_name, in_directory, is_image, is_video, resolve_file_paths, resolve_relative_path, same_file_extension
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import DeepSwapperInputs, DeepSwapperMorph
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
+from facefusion.thread_helper import inference_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, Mask, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import conditional_match_frame_color, read_static_image, read_static_video_frame
 
@@ -353,8 +353,8 @@ def swap_face(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFram
 		region_mask = create_region_mask(crop_vision_frame, state_manager.get_item('face_mask_regions'))
 		crop_masks.append(region_mask)
 
-	crop_mask = numpy.minimum.reduce(crop_masks).clip(0, 1)
-	paste_vision_frame = paste_back(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+	crop_mask = merge_masks(crop_masks)
+	paste_vision_frame = paste_back_in_place(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
 	return paste_vision_frame
 
 
@@ -368,8 +368,8 @@ def forward(crop_vision_frame : VisionFrame, deep_swapper_morph : DeepSwapperMor
 		if deep_swapper_input.name == 'morph_value:0':
 			deep_swapper_inputs[deep_swapper_input.name] = deep_swapper_morph
 
-	with thread_semaphore():
-		crop_target_mask, crop_vision_frame, crop_source_mask = deep_swapper.run(None, deep_swapper_inputs)
+	with inference_semaphore(__name__):
+		crop_target_mask, crop_vision_frame, crop_source_mask = inference_manager.run_inference(deep_swapper, deep_swapper_inputs)
 
 	return crop_vision_frame[0], crop_source_mask[0], crop_target_mask[0]
 
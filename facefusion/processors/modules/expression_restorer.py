@@ -1,6 +1,5 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import Tuple
 
 import cv2
 import numpy
@@ -11,15 +10,15 @@ from facefusion import config, content_analyser, face_classifier, face_detector,
 from facefusion.common_helper import create_int_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_analyser import scale_face
-from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
-from facefusion.face_masker import create_box_mask, create_occlusion_mask
+from facefusion.face_helper import paste_back_in_place, warp_face_by_face_landmark_5
+from facefusion.face_masker import create_box_mask, create_occlusion_mask, merge_masks
 from facefusion.face_selector import select_faces
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.live_portrait import create_rotation, limit_expression
-from facefusion.processors.types import ExpressionRestorerInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
+from facefusion.processors.live_portrait import create_rotation, extract_motions, forward_extract_feature, limit_expression
+from facefusion.processors.types import ExpressionRestorerInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
+from facefusion.thread_helper import inference_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
@@ -162,15 +161,16 @@ def restore_expression(target_face : Face, target_vision_frame : VisionFrame, te
 	temp_crop_vision_frame = prepare_crop_frame(temp_crop_vision_frame)
 	temp_crop_vision_frame = apply_restore(target_crop_vision_frame, temp_crop_vision_frame, expression_restorer_factor)
 	temp_crop_vision_frame = normalize_crop_frame(temp_crop_vision_frame)
-	crop_mask = numpy.minimum.reduce(crop_masks).clip(0, 1)
-	paste_vision_frame = paste_back(temp_vision_frame, temp_crop_vision_frame, crop_mask, affine_matrix)
+	crop_mask = merge_masks(crop_masks)
+	paste_vision_frame = paste_back_in_place(temp_vision_frame, temp_crop_vision_frame, crop_mask, affine_matrix)
 	return paste_vision_frame
 
 
 def apply_restore(target_crop_vision_frame : VisionFrame, temp_crop_vision_frame : VisionFrame, expression_restorer_factor : float) -> VisionFrame:
-	feature_volume = forward_extract_feature(temp_crop_vision_frame)
-	target_expression = forward_extract_motion(target_crop_vision_frame)[5]
-	pitch, yaw, roll, scale, translation, temp_expression, motion_points = forward_extract_motion(temp_crop_vision_frame)
+	feature_volume = forward_extract_feature(get_inference_pool(), temp_crop_vision_frame)
+	target_motion, temp_motion = extract_motions(get_inference_pool(), [ target_crop_vision_frame, temp_crop_vision_frame ])
+	target_expression = target_motion[5]
+	pitch, yaw, roll, scale, translation, temp_expression, motion_points = temp_motion
 	rotation = create_rotation(pitch, yaw, roll)
 	target_expression = restrict_expression_areas(temp_expression, target_expression)
 	target_expression = target_expression * expression_restorer_factor + temp_expression * (1 - expression_restorer_factor)
@@ -194,35 +194,11 @@ def restrict_expression_areas(temp_expression : LivePortraitExpression, target_e
 	return target_expression
 
 
-def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
-	feature_extractor = get_inference_pool().get('feature_extractor')
-
-	with conditional_thread_semaphore():
-		feature_volume = feature_extractor.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
-
-	return feature_volume
-
-
-def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]:
-	motion_extractor = get_inference_pool().get('motion_extractor')
-
-	with conditional_thread_semaphore():
-		pitch, yaw, roll, scale, translation, expression, motion_points = motion_extractor.run(None,
-		{
-			'input': crop_vision_frame
-		})
-
-	return pitch, yaw, roll, scale, translation, expression, motion_points
-
-
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, target_motion_points : LivePortraitMotionPoints, temp_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
-	with thread_semaphore():
-		crop_vision_frame = generator.run(None,
+	with inference_semaphore(__name__):
+		crop_vision_frame = inference_manager.run_inference(generator,
 		{
 			'feature_volume': feature_volume,
 			'source': target_motion_points,
@@ -1,6 +1,5 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import Tuple
 
 import cv2
 import numpy
@@ -8,18 +7,18 @@ import numpy
 import facefusion.jobs.job_manager
 import facefusion.jobs.job_store
 from facefusion import config, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, inference_manager, logger, state_manager, video_manager, wording
-from facefusion.common_helper import create_float_metavar
+from facefusion.common_helper import create_float_metavar, get_first
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_analyser import scale_face
-from facefusion.face_helper import paste_back, scale_face_landmark_5, warp_face_by_face_landmark_5
+from facefusion.face_helper import paste_back_in_place, scale_face_landmark_5, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_box_mask
 from facefusion.face_selector import select_faces
 from facefusion.filesystem import in_directory, is_image, is_video, resolve_relative_path, same_file_extension
 from facefusion.processors import choices as processors_choices
-from facefusion.processors.live_portrait import create_rotation, limit_angle, limit_expression
-from facefusion.processors.types import FaceEditorInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitRotation, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
+from facefusion.processors.live_portrait import create_rotation, extract_motions, forward_extract_feature, limit_angle, limit_expression
+from facefusion.processors.types import FaceEditorDelta, FaceEditorInputs, LivePortraitAngles, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitRotation, LivePortraitYaw
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
+from facefusion.thread_helper import conditional_thread_semaphore, inference_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceLandmark68, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
@@ -102,6 +101,28 @@ def create_static_model_set(download_scope : DownloadScope) -> ModelSet:
 	}
 
 
+@lru_cache()
+def create_static_edit_delta() -> FaceEditorDelta:
+	expression = numpy.zeros((1, 21, 3)).astype(numpy.float32)
+	expression = edit_eye_gaze(expression, state_manager.get_item('face_editor_eye_gaze_horizontal'), state_manager.get_item('face_editor_eye_gaze_vertical'))
+	expression = edit_mouth_grim(expression, state_manager.get_item('face_editor_mouth_grim'))
+	expression = edit_mouth_position(expression, state_manager.get_item('face_editor_mouth_position_horizontal'), state_manager.get_item('face_editor_mouth_position_vertical'))
+	expression = edit_mouth_pout(expression, state_manager.get_item('face_editor_mouth_pout'))
+	expression = edit_mouth_purse(expression, state_manager.get_item('face_editor_mouth_purse'))
+	expression = edit_mouth_smile(expression, state_manager.get_item('face_editor_mouth_smile'))
+	expression = edit_eyebrow_direction(expression, state_manager.get_item('face_editor_eyebrow_direction'))
+	expression.setflags(write = False)
+	edit_pitch = float(numpy.interp(state_manager.get_item('face_editor_head_pitch'), [ -1, 1 ], [ 20, -20 ]))
+	edit_yaw = float(numpy.interp(state_manager.get_item('face_editor_head_yaw'), [ -1, 1 ], [ 60, -60 ]))
+	edit_roll = float(numpy.interp(state_manager.get_item('face_editor_head_roll'), [ -1, 1 ], [ -15, 15 ]))
+
+	return\
+	{
+		'expression': expression,
+		'angles': (edit_pitch, edit_yaw, edit_roll)
+	}
+
+
 def get_inference_pool() -> InferencePool:
 	model_names = [ state_manager.get_item('face_editor_model') ]
 	model_source_set = get_model_options().get('sources')
@@ -175,12 +196,15 @@ def pre_process(mode : ProcessMode) -> bool:
 	if mode == 'output' and not same_file_extension(state_manager.get_item('target_path'), state_manager.get_item('output_path')):
 		logger.error(wording.get('match_target_and_output_extension') + wording.get('exclamation_mark'), __name__)
 		return False
+	create_static_edit_delta.cache_clear()
+	create_static_edit_delta()
 	return True
 
 
 def post_process() -> None:
 	read_static_image.cache_clear()
 	read_static_video_frame.cache_clear()
+	create_static_edit_delta.cache_clear()
 	video_manager.clear_video_pool()
 	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
 		clear_inference_pool()
@@ -202,24 +226,18 @@ def edit_face(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFram
 	crop_vision_frame = prepare_crop_frame(crop_vision_frame)
 	crop_vision_frame = apply_edit(crop_vision_frame, target_face.landmark_set.get('68'))
 	crop_vision_frame = normalize_crop_frame(crop_vision_frame)
-	paste_vision_frame = paste_back(temp_vision_frame, crop_vision_frame, box_mask, affine_matrix)
+	paste_vision_frame = paste_back_in_place(temp_vision_frame, crop_vision_frame, box_mask, affine_matrix)
 	return paste_vision_frame
 
 
 def apply_edit(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLandmark68) -> VisionFrame:
-	feature_volume = forward_extract_feature(crop_vision_frame)
-	pitch, yaw, roll, scale, translation, expression, motion_points = forward_extract_motion(crop_vision_frame)
+	feature_volume = forward_extract_feature(get_inference_pool(), crop_vision_frame)
+	pitch, yaw, roll, scale, translation, expression, motion_points = get_first(extract_motions(get_inference_pool(), [ crop_vision_frame ]))
 	rotation = create_rotation(pitch, yaw, roll)
 	motion_points_target = scale * (motion_points @ rotation.T + expression) + translation
-	expression = edit_eye_gaze(expression)
-	expression = edit_mouth_grim(expression)
-	expression = edit_mouth_position(expression)
-	expression = edit_mouth_pout(expression)
-	expression = edit_mouth_purse(expression)
-	expression = edit_mouth_smile(expression)
-	expression = edit_eyebrow_direction(expression)
-	expression = limit_expression(expression)
-	rotation = edit_head_rotation(pitch, yaw, roll)
+	edit_delta = create_static_edit_delta()
+	expression = limit_expression(expression + edit_delta.get('expression'))
+	rotation = edit_head_rotation(pitch, yaw, roll, edit_delta.get('angles'))
 	motion_points_source = motion_points @ rotation.T
 	motion_points_source += expression
 	motion_points_source *= scale
@@ -231,35 +249,11 @@ def apply_edit(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLandmark6
 	return crop_vision_frame
 
 
-def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
-	feature_extractor = get_inference_pool().get('feature_extractor')
-
-	with conditional_thread_semaphore():
-		feature_volume = feature_extractor.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
-
-	return feature_volume
-
-
-def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]:
-	motion_extractor = get_inference_pool().get('motion_extractor')
-
-	with conditional_thread_semaphore():
-		pitch, yaw, roll, scale, translation, expression, motion_points = motion_extractor.run(None,
-		{
-			'input': crop_vision_frame
-		})
-
-	return pitch, yaw, roll, scale, translation, expression, motion_points
-
-
 def forward_retarget_eye(eye_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	eye_retargeter = get_inference_pool().get('eye_retargeter')
 
 	with conditional_thread_semaphore():
-		eye_motion_points = eye_retargeter.run(None,
+		eye_motion_points = inference_manager.run_inference(eye_retargeter,
 		{
 			'input': eye_motion_points
 		})[0]
@@ -271,7 +265,7 @@ def forward_retarget_lip(lip_motion_points : LivePortraitMotionPoints) -> LivePo
 	lip_retargeter = get_inference_pool().get('lip_retargeter')
 
 	with conditional_thread_semaphore():
-		lip_motion_points = lip_retargeter.run(None,
+		lip_motion_points = inference_manager.run_inference(lip_retargeter,
 		{
 			'input': lip_motion_points
 		})[0]
@@ -282,8 +276,8 @@ def forward_retarget_lip(lip_motion_points : LivePortraitMotionPoints) -> LivePo
 def forward_stitch_motion_points(source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	stitcher = get_inference_pool().get('stitcher')
 
-	with thread_semaphore():
-		motion_points = stitcher.run(None,
+	with inference_semaphore(__name__):
+		motion_points = inference_manager.run_inference(stitcher,
 		{
 			'source': source_motion_points,
 			'target': target_motion_points
@@ -295,8 +289,8 @@ def forward_stitch_motion_points(source_motion_points : LivePortraitMotionPoints
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
-	with thread_semaphore():
-		crop_vision_frame = generator.run(None,
+	with inference_semaphore(__name__):
+		crop_vision_frame = inference_manager.run_inference(generator,
 		{
 			'feature_volume': feature_volume,
 			'source': source_motion_points,
@@ -306,9 +300,7 @@ def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, source_mo
 	return crop_vision_frame
 
 
-def edit_eyebrow_direction(expression : LivePortraitExpression) -> LivePortraitExpression:
-	face_editor_eyebrow = state_manager.get_item('face_editor_eyebrow_direction')
-
+def edit_eyebrow_direction(expression : LivePortraitExpression, face_editor_eyebrow : float) -> LivePortraitExpression:
 	if face_editor_eyebrow > 0:
 		expression[0, 1, 1] += numpy.interp(face_editor_eyebrow, [ -1, 1 ], [ -0.015, 0.015 ])
 		expression[0, 2, 1] -= numpy.interp(face_editor_eyebrow, [ -1, 1 ], [ -0.020, 0.020 ])
@@ -320,10 +312,7 @@ def edit_eyebrow_direction(expression : LivePortraitExpression) -> LivePortraitE
 	return expression
 
 
-def edit_eye_gaze(expression : LivePortraitExpression) -> LivePortraitExpression:
-	face_editor_eye_gaze_horizontal = state_manager.get_item('face_editor_eye_gaze_horizontal')
-	face_editor_eye_gaze_vertical = state_manager.get_item('face_editor_eye_gaze_vertical')
-
+def edit_eye_gaze(expression : LivePortraitExpression, face_editor_eye_gaze_horizontal : float, face_editor_eye_gaze_vertical : float) -> LivePortraitExpression:
 	if face_editor_eye_gaze_horizontal > 0:
 		expression[0, 11, 0] += numpy.interp(face_editor_eye_gaze_horizontal, [ -1, 1 ], [ -0.015, 0.015 ])
 		expression[0, 15, 0] += numpy.interp(face_editor_eye_gaze_horizontal, [ -1, 1 ], [ -0.020, 0.020 ])
@@ -368,8 +357,7 @@ def edit_lip_open(motion_points : LivePortraitMotionPoints, face_landmark_68 : F
 	return lip_motion_points
 
 
-def edit_mouth_grim(expression : LivePortraitExpression) -> LivePortraitExpression:
-	face_editor_mouth_grim = state_manager.get_item('face_editor_mouth_grim')
+def edit_mouth_grim(expression : LivePortraitExpression, face_editor_mouth_grim : float) -> LivePortraitExpression:
 	if face_editor_mouth_grim > 0:
 		expression[0, 17, 2] -= numpy.interp(face_editor_mouth_grim, [ -1, 1 ], [ -0.005, 0.005 ])
 		expression[0, 19, 2] += numpy.interp(face_editor_mouth_grim, [ -1, 1 ], [ -0.01, 0.01 ])
@@ -382,9 +370,7 @@ def edit_mouth_grim(expression : LivePortraitExpression) -> LivePortraitExpressi
 	return expression
 
 
-def edit_mouth_position(expression : LivePortraitExpression) -> LivePortraitExpression:
-	face_editor_mouth_position_horizontal = state_manager.get_item('face_editor_mouth_position_horizontal')
-	face_editor_mouth_position_vertical = state_manager.get_item('face_editor_mouth_position_vertical')
+def edit_mouth_position(expression : LivePortraitExpression, face_editor_mouth_position_horizontal : float, face_editor_mouth_position_vertical : float) -> LivePortraitExpression:
 	expression[0, 19, 0] += numpy.interp(face_editor_mouth_position_horizontal, [ -1, 1 ], [ -0.05, 0.05 ])
 	expression[0, 20, 0] += numpy.interp(face_editor_mouth_position_horizontal, [ -1, 1 ], [ -0.04, 0.04 ])
 	if face_editor_mouth_position_vertical > 0:
@@ -396,8 +382,7 @@ def edit_mouth_position(expression : LivePortraitExpression) -> LivePortraitExpr
 	return expression
 
 
-def edit_mouth_pout(expression : LivePortraitExpression) -> LivePortraitExpression:
-	face_editor_mouth_pout = state_manager.get_item('face_editor_mouth_pout')
+def edit_mouth_pout(expression : LivePortraitExpression, face_editor_mouth_pout : float) -> LivePortraitExpression:
 	if face_editor_mouth_pout > 0:
 		expression[0, 19, 1] -= numpy.interp(face_editor_mouth_pout, [ -1, 1 ], [ -0.022, 0.022 ])
 		expression[0, 19, 2] += numpy.interp(face_editor_mouth_pout, [ -1, 1 ], [ -0.025, 0.025 ])
@@ -409,8 +394,7 @@ def edit_mouth_pout(expression : LivePortraitExpression) -> LivePortraitExpressi
 	return expression
 
 
-def edit_mouth_purse(expression : LivePortraitExpression) -> LivePortraitExpression:
-	face_editor_mouth_purse = state_manager.get_item('face_editor_mouth_purse')
+def edit_mouth_purse(expression : LivePortraitExpression, face_editor_mouth_purse : float) -> LivePortraitExpression:
 	if face_editor_mouth_purse > 0:
 		expression[0, 19, 1] -= numpy.interp(face_editor_mouth_purse, [ -1, 1 ], [ -0.04, 0.04 ])
 		expression[0, 19, 2] -= numpy.interp(face_editor_mouth_purse, [ -1, 1 ], [ -0.02, 0.02 ])
@@ -422,8 +406,7 @@ def edit_mouth_purse(expression : LivePortraitExpression) -> LivePortraitExpress
 	return expression
 
 
-def edit_mouth_smile(expression : LivePortraitExpression) -> LivePortraitExpression:
-	face_editor_mouth_smile = state_manager.get_item('face_editor_mouth_smile')
+def edit_mouth_smile(expression : LivePortraitExpression, face_editor_mouth_smile : float) -> LivePortraitExpression:
 	if face_editor_mouth_smile > 0:
 		expression[0, 20, 1] -= numpy.interp(face_editor_mouth_smile, [ -1, 1 ], [ -0.015, 0.015 ])
 		expression[0, 14, 1] -= numpy.interp(face_editor_mouth_smile, [ -1, 1 ], [ -0.025, 0.025 ])
@@ -442,13 +425,10 @@ def edit_mouth_smile(expression : LivePortraitExpression) -> LivePortraitExpress
 	return expression
 
 
-def edit_head_rotation(pitch : LivePortraitPitch, yaw : LivePortraitYaw, roll : LivePortraitRoll) -> LivePortraitRotation:
-	face_editor_head_pitch = state_manager.get_item('face_editor_head_pitch')
-	face_editor_head_yaw = state_manager.get_item('face_editor_head_yaw')
-	face_editor_head_roll = state_manager.get_item('face_editor_head_roll')
-	edit_pitch = pitch + float(numpy.interp(face_editor_head_pitch, [ -1, 1 ], [ 20, -20 ]))
-	edit_yaw = yaw + float(numpy.interp(face_editor_head_yaw, [ -1, 1 ], [ 60, -60 ]))
-	edit_roll = roll + float(numpy.interp(face_editor_head_roll, [ -1, 1 ], [ -15, 15 ]))
+def edit_head_rotation(pitch : LivePortraitPitch, yaw : LivePortraitYaw, roll : LivePortraitRoll, edit_angles : LivePortraitAngles) -> LivePortraitRotation:
+	edit_pitch = pitch + edit_angles[0]
+	edit_yaw = yaw + edit_angles[1]
+	edit_roll = roll + edit_angles[2]
 	edit_pitch, edit_yaw, edit_roll = limit_angle(pitch, yaw, roll, edit_pitch, edit_yaw, edit_roll)
 	rotation = create_rotation(edit_pitch, edit_yaw, edit_roll)
 	return rotation
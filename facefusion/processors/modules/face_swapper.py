@@ -13,8 +13,8 @@ from facefusion.common_helper import get_first, is_macos
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
 from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face, scale_face
-from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
-from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
+from facefusion.face_helper import paste_back_in_place, warp_face_by_face_landmark_5
+from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask, merge_masks
 from facefusion.face_selector import select_faces, sort_faces_by_order
 from facefusion.filesystem import filter_image_paths, has_image, in_directory, is_image, is_video, resolve_relative_path, same_file_extension
 from facefusion.model_helper import get_static_model_initializer
@@ -533,8 +533,8 @@ def swap_face(source_face : Face, target_face : Face, temp_vision_frame : Vision
 		region_mask = create_region_mask(crop_vision_frame, state_manager.get_item('face_mask_regions'))
 		crop_masks.append(region_mask)
 
-	crop_mask = numpy.minimum.reduce(crop_masks).clip(0, 1)
-	paste_vision_frame = paste_back(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+	crop_mask = merge_masks(crop_masks)
+	paste_vision_frame = paste_back_in_place(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
 	return paste_vision_frame
 
 
@@ -558,7 +558,7 @@ def forward_swap_face(source_face : Face, target_face : Face, crop_vision_frame
 			face_swapper_inputs[face_swapper_input.name] = crop_vision_frame
 
 	with conditional_thread_semaphore():
-		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0][0]
+		crop_vision_frame = inference_manager.run_inference(face_swapper, face_swapper_inputs)[0][0]
 
 	return crop_vision_frame
 
@@ -567,7 +567,7 @@ def forward_convert_embedding(face_embedding : Embedding) -> Embedding:
 	embedding_converter = get_inference_pool().get('embedding_converter')
 
 	with conditional_thread_semaphore():
-		face_embedding = embedding_converter.run(None,
+		face_embedding = inference_manager.run_inference(embedding_converter,
 		{
 			'input': face_embedding
 		})[0]
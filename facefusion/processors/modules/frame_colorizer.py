@@ -15,7 +15,7 @@ from facefusion.filesystem import in_directory, is_image, is_video, resolve_rela
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import FrameColorizerInputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
+from facefusion.thread_helper import inference_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, ExecutionProvider, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import blend_frame, read_static_image, read_static_video_frame, unpack_resolution
 
@@ -206,8 +206,8 @@ def colorize_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
 def forward(color_vision_frame : VisionFrame) -> VisionFrame:
 	frame_colorizer = get_inference_pool().get('frame_colorizer')
 
-	with thread_semaphore():
-		color_vision_frame = frame_colorizer.run(None,
+	with inference_semaphore(__name__):
+		color_vision_frame = inference_manager.run_inference(frame_colorizer,
 		{
 			'input': color_vision_frame
 		})[0][0]
@@ -497,7 +497,7 @@ def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
 	frame_enhancer = get_inference_pool().get('frame_enhancer')
 
 	with conditional_thread_semaphore():
-		tile_vision_frame = frame_enhancer.run(None,
+		tile_vision_frame = inference_manager.run_inference(frame_enhancer,
 		{
 			'input': tile_vision_frame
 		})[0]
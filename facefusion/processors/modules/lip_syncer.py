@@ -11,8 +11,8 @@ from facefusion.audio import read_static_voice
 from facefusion.common_helper import create_float_metavar
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_analyser import scale_face
-from facefusion.face_helper import create_bounding_box, paste_back, warp_face_by_bounding_box, warp_face_by_face_landmark_5
-from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask
+from facefusion.face_helper import create_bounding_box, paste_back_in_place, warp_face_by_bounding_box, warp_face_by_face_landmark_5
+from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, merge_masks
 from facefusion.face_selector import select_faces
 from facefusion.filesystem import has_audio, resolve_relative_path
 from facefusion.processors import choices as processors_choices
@@ -184,8 +184,8 @@ def sync_lip(target_face : Face, source_voice_frame : AudioFrame, temp_vision_fr
 		area_vision_frame = normalize_crop_frame(area_vision_frame)
 		crop_vision_frame = cv2.warpAffine(area_vision_frame, cv2.invertAffineTransform(area_matrix), (512, 512), borderMode = cv2.BORDER_REPLICATE)
 
-	crop_mask = numpy.minimum.reduce(crop_masks)
-	paste_vision_frame = paste_back(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+	crop_mask = merge_masks(crop_masks)
+	paste_vision_frame = paste_back_in_place(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
 	return paste_vision_frame
 
 
@@ -193,7 +193,7 @@ def forward_edtalk(temp_audio_frame : AudioFrame, crop_vision_frame : VisionFram
 	lip_syncer = get_inference_pool().get('lip_syncer')
 
 	with conditional_thread_semaphore():
-		crop_vision_frame = lip_syncer.run(None,
+		crop_vision_frame = inference_manager.run_inference(lip_syncer,
 		{
 			'source': temp_audio_frame,
 			'target': crop_vision_frame,
@@ -207,7 +207,7 @@ def forward_wav2lip(temp_audio_frame : AudioFrame, area_vision_frame : VisionFra
 	lip_syncer = get_inference_pool().get('lip_syncer')
 
 	with conditional_thread_semaphore():
-		area_vision_frame = lip_syncer.run(None,
+		area_vision_frame = inference_manager.run_inference(lip_syncer,
 		{
 			'source': temp_audio_frame,
 			'target': area_vision_frame
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Literal, TypeAlias, TypedDict
+from typing import Any, Dict, List, Literal, Tuple, TypeAlias, TypedDict
 
 from numpy.typing import NDArray
 
@@ -88,12 +88,19 @@ LipSyncerWeight : TypeAlias = NDArray[Any]
 LivePortraitPitch : TypeAlias = float
 LivePortraitYaw : TypeAlias = float
 LivePortraitRoll : TypeAlias = float
+LivePortraitAngles : TypeAlias = Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll]
 LivePortraitExpression : TypeAlias = NDArray[Any]
 LivePortraitFeatureVolume : TypeAlias = NDArray[Any]
 LivePortraitMotionPoints : TypeAlias = NDArray[Any]
 LivePortraitRotation : TypeAlias = NDArray[Any]
 LivePortraitScale : TypeAlias = NDArray[Any]
 LivePortraitTranslation : TypeAlias = NDArray[Any]
+LivePortraitMotion : TypeAlias = Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]
+FaceEditorDelta = TypedDict('FaceEditorDelta',
+{
+	'expression' : LivePortraitExpression,
+	'angles' : LivePortraitAngles
+})
 
 ProcessorStateKey = Literal\
 [
@@ -0,0 +1,97 @@
+import csv
+import os
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+import numpy
+
+from facefusion import logger, state_manager, wording
+from facefusion.filesystem import create_directory, get_file_name, is_file
+from facefusion.json import read_json, write_json
+from facefusion.types import ProfileMetric, ProfileReport, ProfileTimeSet
+
+if TYPE_CHECKING:
+	from onnxruntime import InferenceSession
+
+PROFILE_SESSION_SET : Dict[str, List['InferenceSession']] = {}
+PROCESS_TIME_SET : ProfileTimeSet = {}
+
+
+def is_profiling() -> bool:
+	return bool(state_manager.get_item('execution_profile_path'))
+
+
+def create_profile_file_prefix(model_path : str) -> Optional[str]:
+	execution_profile_path = state_manager.get_item('execution_profile_path')
+
+	if execution_profile_path and create_directory(execution_profile_path):
+		return os.path.join(execution_profile_path, get_file_name(model_path))
+	return None
+
+
+def register_inference_session(model_path : str, inference_session : 'InferenceSession') -> None:
+	PROFILE_SESSION_SET.setdefault(get_file_name(model_path), []).append(inference_session)
+
+
+def record_process_time(processor_name : str, process_time : float) -> None:
+	if is_profiling():
+		PROCESS_TIME_SET.setdefault(processor_name, []).append(process_time * 1000)
+
+
+def create_report() -> ProfileReport:
+	model_time_set : ProfileTimeSet = {}
+	operator_time_set : ProfileTimeSet = {}
+
+	for model_name, inference_sessions in PROFILE_SESSION_SET.items():
+		for inference_session in inference_sessions:
+			profile_file_path = inference_session.end_profiling()
+			profile_events : List[Dict[str, Any]] = read_json(profile_file_path) or [] #type:ignore[assignment]
+
+			for profile_event in profile_events:
+				profile_event_time = profile_event.get('dur', 0) / 1000
+
+				if profile_event.get('cat') == 'Session' and profile_event.get('name') == 'model_run':
+					model_time_set.setdefault(model_name, []).append(profile_event_time)
+				if profile_event.get('cat') == 'Node' and profile_event.get('name', '').endswith('_kernel_time'):
+					operator_name = profile_event.get('args').get('op_name')
+					operator_time_set.setdefault(operator_name, []).append(profile_event_time)
+
+	PROFILE_SESSION_SET.clear()
+	report : ProfileReport =\
+	{
+		'models': { model_name: create_profile_metric(model_times) for model_name, model_times in model_time_set.items() },
+		'operators': { operator_name: create_profile_metric(operator_times) for operator_name, operator_times in operator_time_set.items() },
+		'processors': { processor_name: create_profile_metric(process_times) for processor_name, process_times in PROCESS_TIME_SET.items() }
+	}
+	return report
+
+
+def create_profile_metric(profile_times : List[float]) -> ProfileMetric:
+	return\
+	{
+		'total': round(float(numpy.sum(profile_times)), 3),
+		'calls': len(profile_times),
+		'mean': round(float(numpy.mean(profile_times)), 3),
+		'p95': round(float(numpy.percentile(profile_times, 95)), 3)
+	}
+
+
+def write_report() -> bool:
+	execution_profile_path = state_manager.get_item('execution_profile_path')
+
+	if is_profiling() and create_directory(execution_profile_path):
+		report = create_report()
+		report_json_path = os.path.join(execution_profile_path, 'report.json')
+		report_csv_path = os.path.join(execution_profile_path, 'report.csv')
+
+		with open(report_csv_path, 'w', newline = '') as report_csv_file:
+			csv_writer = csv.writer(report_csv_file)
+			csv_writer.writerow([ 'category', 'name', 'total', 'calls', 'mean', 'p95' ])
+
+			for report_category in [ 'models', 'operators', 'processors' ]:
+				for report_name, profile_metric in report.get(report_category).items(): #type:ignore[attr-defined]
+					csv_writer.writerow([ report_category, report_name, profile_metric.get('total'), profile_metric.get('calls'), profile_metric.get('mean'), profile_metric.get('p95') ])
+
+		if write_json(report_json_path, report) and is_file(report_csv_path): #type:ignore[arg-type]
+			logger.info(wording.get('writing_profile_succeeded').format(profile_path = execution_profile_path), __name__)
+			return True
+	return False
@@ -1,11 +1,10 @@
 import tempfile
 from argparse import ArgumentParser, HelpFormatter
+from typing import List, Optional
 
 import facefusion.choices
 from facefusion import config, metadata, state_manager, wording
 from facefusion.common_helper import create_float_metavar, create_int_metavar, get_first, get_last
-from facefusion.execution import get_available_execution_providers
-from facefusion.ffmpeg import get_available_encoder_set
 from facefusion.filesystem import get_file_name, resolve_file_paths
 from facefusion.jobs import job_store
 from facefusion.processors.core import get_processors_modules
@@ -164,6 +163,8 @@ def create_frame_extraction_program() -> ArgumentParser:
 
 
 def create_output_creation_program() -> ArgumentParser:
+	from facefusion.ffmpeg import get_available_encoder_set
+
 	program = ArgumentParser(add_help = False)
 	available_encoder_set = get_available_encoder_set()
 	group_output_creation = program.add_argument_group('output creation')
@@ -206,7 +207,9 @@ def create_download_providers_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_download = program.add_argument_group('download')
 	group_download.add_argument('--download-providers', help = wording.get('help.download_providers').format(choices = ', '.join(facefusion.choices.download_providers)), default = config.get_str_list('download', 'download_providers', ' '.join(facefusion.choices.download_providers)), choices = facefusion.choices.download_providers, nargs = '+', metavar = 'DOWNLOAD_PROVIDERS')
-	job_store.register_job_keys([ 'download_providers' ])
+	group_download.add_argument('--download-thread-count', help = wording.get('help.download_thread_count'), type = int, default = config.get_int_value('download', 'download_thread_count', '4'), choices = facefusion.choices.download_thread_count_range, metavar = create_int_metavar(facefusion.choices.download_thread_count_range))
+	group_download.add_argument('--download-force-validation', help = wording.get('help.download_force_validation'), action = 'store_true', default = config.get_bool_value('download', 'download_force_validation'))
+	job_store.register_job_keys([ 'download_providers', 'download_thread_count', 'download_force_validation' ])
 	return program
 
 
@@ -227,14 +230,47 @@ def create_benchmark_program() -> ArgumentParser:
 	return program
 
 
+def create_quantize_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_quantize = program.add_argument_group('quantize')
+	group_quantize.add_argument('--quantize-precisions', help = wording.get('help.quantize_precisions').format(choices = ', '.join(facefusion.choices.quantize_precisions)), default = config.get_str_list('quantize', 'quantize_precisions', ' '.join(facefusion.choices.quantize_precisions)), choices = facefusion.choices.quantize_precisions, nargs = '+', metavar = 'QUANTIZE_PRECISIONS')
+	group_quantize.add_argument('--quantize-calibration-path', help = wording.get('help.quantize_calibration_path'), default = config.get_str_value('quantize', 'quantize_calibration_path'))
+	return program
+
+
+def create_tune_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_tune = program.add_argument_group('tune')
+	group_tune.add_argument('--tune-cycle-count', help = wording.get('help.tune_cycle_count'), type = int, default = config.get_int_value('tune', 'tune_cycle_count', '5'), choices = facefusion.choices.tune_cycle_count_range, metavar = create_int_metavar(facefusion.choices.tune_cycle_count_range))
+	return program
+
+
+def create_warm_up_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_warm_up = program.add_argument_group('warm up')
+	group_warm_up.add_argument('--warm-up-cycle-count', help = wording.get('help.warm_up_cycle_count'), type = int, default = config.get_int_value('warm_up', 'warm_up_cycle_count', '3'), choices = facefusion.choices.warm_up_cycle_count_range, metavar = create_int_metavar(facefusion.choices.warm_up_cycle_count_range))
+	return program
+
+
 def create_execution_program() -> ArgumentParser:
+	from facefusion.execution import get_available_execution_providers
+
 	program = ArgumentParser(add_help = False)
 	available_execution_providers = get_available_execution_providers()
 	group_execution = program.add_argument_group('execution')
 	group_execution.add_argument('--execution-device-ids', help = wording.get('help.execution_device_ids'), default = config.get_str_list('execution', 'execution_device_ids', '0'), nargs = '+', metavar = 'EXECUTION_DEVICE_IDS')
 	group_execution.add_argument('--execution-providers', help = wording.get('help.execution_providers').format(choices = ', '.join(available_execution_providers)), default = config.get_str_list('execution', 'execution_providers', get_first(available_execution_providers)), choices = available_execution_providers, nargs = '+', metavar = 'EXECUTION_PROVIDERS')
 	group_execution.add_argument('--execution-thread-count', help = wording.get('help.execution_thread_count'), type = int, default = config.get_int_value('execution', 'execution_thread_count', '4'), choices = facefusion.choices.execution_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_thread_count_range))
-	job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count' ])
+	group_execution.add_argument('--execution-session-thread-count', help = wording.get('help.execution_session_thread_count'), type = int, default = config.get_int_value('execution', 'execution_session_thread_count', '0'), choices = facefusion.choices.execution_session_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_session_thread_count_range))
+	group_execution.add_argument('--execution-session-replica-count', help = wording.get('help.execution_session_replica_count'), type = int, default = config.get_int_value('execution', 'execution_session_replica_count', '1'), choices = facefusion.choices.execution_session_replica_count_range, metavar = create_int_metavar(facefusion.choices.execution_session_replica_count_range))
+	group_execution.add_argument('--execution-dispatch-mode', help = wording.get('help.execution_dispatch_mode'), default = config.get_str_value('execution', 'execution_dispatch_mode', 'least_busy'), choices = facefusion.choices.execution_dispatch_modes)
+	group_execution.add_argument('--execution-batch-size', help = wording.get('help.execution_batch_size'), type = int, default = config.get_int_value('execution', 'execution_batch_size', '1'), choices = facefusion.choices.execution_batch_size_range, metavar = create_int_metavar(facefusion.choices.execution_batch_size_range))
+	group_execution.add_argument('--execution-batch-timeout', help = wording.get('help.execution_batch_timeout'), type = int, default = config.get_int_value('execution', 'execution_batch_timeout', '2'), choices = facefusion.choices.execution_batch_timeout_range, metavar = create_int_metavar(facefusion.choices.execution_batch_timeout_range))
+	group_execution.add_argument('--execution-load-thread-count', help = wording.get('help.execution_load_thread_count'), type = int, default = config.get_int_value('execution', 'execution_load_thread_count', '4'), choices = facefusion.choices.execution_load_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_load_thread_count_range))
+	group_execution.add_argument('--execution-profile-path', help = wording.get('help.execution_profile_path'), default = config.get_str_value('execution', 'execution_profile_path'))
+	group_execution.add_argument('--execution-share-weights', help = wording.get('help.execution_share_weights'), action = 'store_true', default = config.get_bool_value('execution', 'execution_share_weights'))
+	group_execution.add_argument('--execution-precision', help = wording.get('help.execution_precision'), default = config.get_str_value('execution', 'execution_precision', 'fp32'), choices = facefusion.choices.execution_precisions)
+	job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count', 'execution_session_thread_count', 'execution_session_replica_count', 'execution_dispatch_mode', 'execution_batch_size', 'execution_batch_timeout', 'execution_load_thread_count', 'execution_share_weights', 'execution_precision' ])
 	return program
 
 
@@ -243,7 +279,9 @@ def create_memory_program() -> ArgumentParser:
 	group_memory = program.add_argument_group('memory')
 	group_memory.add_argument('--video-memory-strategy', help = wording.get('help.video_memory_strategy'), default = config.get_str_value('memory', 'video_memory_strategy', 'strict'), choices = facefusion.choices.video_memory_strategies)
 	group_memory.add_argument('--system-memory-limit', help = wording.get('help.system_memory_limit'), type = int, default = config.get_int_value('memory', 'system_memory_limit', '0'), choices = facefusion.choices.system_memory_limit_range, metavar = create_int_metavar(facefusion.choices.system_memory_limit_range))
-	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit' ])
+	group_memory.add_argument('--system-memory-budget', help = wording.get('help.system_memory_budget'), type = int, default = config.get_int_value('memory', 'system_memory_budget', '0'), choices = facefusion.choices.system_memory_budget_range, metavar = create_int_metavar(facefusion.choices.system_memory_budget_range))
+	group_memory.add_argument('--video-memory-budget', help = wording.get('help.video_memory_budget'), type = int, default = config.get_int_value('memory', 'video_memory_budget', '0'), choices = facefusion.choices.video_memory_budget_range, metavar = create_int_metavar(facefusion.choices.video_memory_budget_range))
+	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit', 'system_memory_budget', 'video_memory_budget' ])
 	return program
 
 
@@ -290,33 +328,91 @@ def collect_job_program() -> ArgumentParser:
 	return ArgumentParser(parents = [ create_execution_program(), create_download_providers_program(), create_memory_program(), create_log_level_program() ], add_help = False)
 
 
-def create_program() -> ArgumentParser:
+def resolve_command_programs(command : str, program_command : Optional[str]) -> List[ArgumentParser]:
+	if program_command == command:
+		return collect_command_programs(command)
+	return []
+
+
+def collect_command_programs(command : str) -> List[ArgumentParser]:
+	if command == 'run':
+		return [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_uis_program(), create_benchmark_program(), collect_job_program() ]
+	if command == 'headless-run':
+		return [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), collect_job_program() ]
+	if command == 'batch-run':
+		return [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_pattern_program(), create_target_pattern_program(), create_output_pattern_program(), collect_step_program(), collect_job_program() ]
+	if command == 'force-download':
+		return [ create_download_providers_program(), create_download_scope_program(), create_log_level_program() ]
+	if command == 'benchmark':
+		return [ create_temp_path_program(), collect_step_program(), create_benchmark_program(), collect_job_program() ]
+	if command == 'tune':
+		return [ create_config_path_program(), collect_step_program(), create_tune_program(), collect_job_program() ]
+	if command == 'warm-up':
+		return [ create_config_path_program(), collect_step_program(), create_warm_up_program(), collect_job_program() ]
+	if command == 'quantize':
+		return [ create_config_path_program(), create_source_paths_program(), create_target_path_program(), collect_step_program(), create_download_scope_program(), create_quantize_program(), collect_job_program() ]
+	if command == 'job-list':
+		return [ create_job_status_program(), create_jobs_path_program(), create_log_level_program() ]
+	if command == 'job-create':
+		return [ create_job_id_program(), create_jobs_path_program(), create_log_level_program() ]
+	if command == 'job-submit':
+		return [ create_job_id_program(), create_jobs_path_program(), create_log_level_program() ]
+	if command == 'job-submit-all':
+		return [ create_jobs_path_program(), create_log_level_program(), create_halt_on_error_program() ]
+	if command == 'job-delete':
+		return [ create_job_id_program(), create_jobs_path_program(), create_log_level_program() ]
+	if command == 'job-delete-all':
+		return [ create_jobs_path_program(), create_log_level_program(), create_halt_on_error_program() ]
+	if command == 'job-add-step':
+		return [ create_job_id_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_log_level_program() ]
+	if command == 'job-remix-step':
+		return [ create_job_id_program(), create_step_index_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_output_path_program(), collect_step_program(), create_log_level_program() ]
+	if command == 'job-insert-step':
+		return [ create_job_id_program(), create_step_index_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_log_level_program() ]
+	if command == 'job-remove-step':
+		return [ create_job_id_program(), create_step_index_program(), create_jobs_path_program(), create_log_level_program() ]
+	if command == 'job-run':
+		return [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ]
+	if command == 'job-run-all':
+		return [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_halt_on_error_program() ]
+	if command == 'job-retry':
+		return [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ]
+	if command == 'job-retry-all':
+		return [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_halt_on_error_program() ]
+	return []
+
+
+def create_program(program_command : Optional[str]) -> ArgumentParser:
+	apply_config_path(create_config_path_program())
 	program = ArgumentParser(formatter_class = create_help_formatter_large, add_help = False)
 	program._positionals.title = 'commands'
 	program.add_argument('-v', '--version', version = metadata.get('name') + ' ' + metadata.get('version'), action = 'version')
 	sub_program = program.add_subparsers(dest = 'command')
 	# general
-	sub_program.add_parser('run', help = wording.get('help.run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_uis_program(), create_benchmark_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('headless-run', help = wording.get('help.headless_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('batch-run', help = wording.get('help.batch_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_pattern_program(), create_target_pattern_program(), create_output_pattern_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('force-download', help = wording.get('help.force_download'), parents = [ create_download_providers_program(), create_download_scope_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('benchmark', help = wording.get('help.benchmark'), parents = [ create_temp_path_program(), collect_step_program(), create_benchmark_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('run', help = wording.get('help.run'), parents = resolve_command_programs('run', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('headless-run', help = wording.get('help.headless_run'), parents = resolve_command_programs('headless-run', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('batch-run', help = wording.get('help.batch_run'), parents = resolve_command_programs('batch-run', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('force-download', help = wording.get('help.force_download'), parents = resolve_command_programs('force-download', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('benchmark', help = wording.get('help.benchmark'), parents = resolve_command_programs('benchmark', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('tune', help = wording.get('help.tune'), parents = resolve_command_programs('tune', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('warm-up', help = wording.get('help.warm_up'), parents = resolve_command_programs('warm-up', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('quantize', help = wording.get('help.quantize'), parents = resolve_command_programs('quantize', program_command), formatter_class = create_help_formatter_large)
 	# job manager
-	sub_program.add_parser('job-list', help = wording.get('help.job_list'), parents = [ create_job_status_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-create', help = wording.get('help.job_create'), parents = [ create_job_id_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-submit', help = wording.get('help.job_submit'), parents = [ create_job_id_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-submit-all', help = wording.get('help.job_submit_all'), parents = [ create_jobs_path_program(), create_log_level_program(), create_halt_on_error_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-delete', help = wording.get('help.job_delete'), parents = [ create_job_id_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-delete-all', help = wording.get('help.job_delete_all'), parents = [ create_jobs_path_program(), create_log_level_program(), create_halt_on_error_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-add-step', help = wording.get('help.job_add_step'), parents = [ create_job_id_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-remix-step', help = wording.get('help.job_remix_step'), parents = [ create_job_id_program(), create_step_index_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_output_path_program(), collect_step_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-insert-step', help = wording.get('help.job_insert_step'), parents = [ create_job_id_program(), create_step_index_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-remove-step', help = wording.get('help.job_remove_step'), parents = [ create_job_id_program(), create_step_index_program(), create_jobs_path_program(), create_log_level_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-list', help = wording.get('help.job_list'), parents = resolve_command_programs('job-list', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-create', help = wording.get('help.job_create'), parents = resolve_command_programs('job-create', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-submit', help = wording.get('help.job_submit'), parents = resolve_command_programs('job-submit', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-submit-all', help = wording.get('help.job_submit_all'), parents = resolve_command_programs('job-submit-all', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-delete', help = wording.get('help.job_delete'), parents = resolve_command_programs('job-delete', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-delete-all', help = wording.get('help.job_delete_all'), parents = resolve_command_programs('job-delete-all', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-add-step', help = wording.get('help.job_add_step'), parents = resolve_command_programs('job-add-step', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-remix-step', help = wording.get('help.job_remix_step'), parents = resolve_command_programs('job-remix-step', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-insert-step', help = wording.get('help.job_insert_step'), parents = resolve_command_programs('job-insert-step', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-remove-step', help = wording.get('help.job_remove_step'), parents = resolve_command_programs('job-remove-step', program_command), formatter_class = create_help_formatter_large)
 	# job runner
-	sub_program.add_parser('job-run', help = wording.get('help.job_run'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-run-all', help = wording.get('help.job_run_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_halt_on_error_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-retry', help = wording.get('help.job_retry'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-retry-all', help = wording.get('help.job_retry_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program(), create_halt_on_error_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-run', help = wording.get('help.job_run'), parents = resolve_command_programs('job-run', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-run-all', help = wording.get('help.job_run_all'), parents = resolve_command_programs('job-run-all', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-retry', help = wording.get('help.job_retry'), parents = resolve_command_programs('job-retry', program_command), formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-retry-all', help = wording.get('help.job_retry_all'), parents = resolve_command_programs('job-retry-all', program_command), formatter_class = create_help_formatter_large)
 	return ArgumentParser(parents = [ program ], formatter_class = create_help_formatter_small)
 
 
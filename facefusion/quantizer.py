@@ -0,0 +1,234 @@
+from typing import List, Optional, Tuple
+
+import numpy
+import onnx
+from onnxruntime import InferenceSession
+from onnxruntime.quantization import CalibrationDataReader, QuantType, quantize_dynamic, quantize_static
+from onnxruntime.transformers.float16 import convert_float_to_float16
+
+import facefusion.choices
+from facefusion import content_analyser, inference_manager, logger, state_manager, wording
+from facefusion.audio import create_empty_audio_frame
+from facefusion.face_analyser import get_many_faces
+from facefusion.filesystem import filter_image_paths, get_file_name, is_directory, is_image, is_video, remove_file, resolve_file_paths
+from facefusion.hash_helper import get_hash_path, write_hash
+from facefusion.model_helper import collect_model_modules, get_precision_model_path
+from facefusion.processors.core import get_processors_modules
+from facefusion.types import DownloadSet, ErrorCode, InferenceInputs, ModelOutput, QuantizeInputsSet, QuantizeMetric, QuantizePrecision, VisionFrame
+from facefusion.vision import count_video_frame_total, read_image, read_static_image, read_static_images, read_video_frame
+
+QUANTIZE_FRAME_TOTAL : int = 4
+QUANTIZE_INPUT_LIMIT : int = 32
+
+
+class QuantizeDataReader(CalibrationDataReader):
+	def __init__(self, model_inputs_list : List[InferenceInputs]) -> None:
+		self.model_inputs = iter(model_inputs_list)
+
+	def get_next(self) -> Optional[InferenceInputs]:
+		return next(self.model_inputs, None)
+
+
+def run() -> ErrorCode:
+	error_code : ErrorCode = 0
+	quantize_precisions = state_manager.get_item('quantize_precisions')
+	quantize_calibration_path = state_manager.get_item('quantize_calibration_path')
+	state_manager.set_item('execution_precision', 'fp32')
+	state_manager.set_item('execution_session_replica_count', 1)
+	model_sessions = collect_model_sessions()
+	quantize_inputs_set = capture_model_inputs(model_sessions, collect_vision_frames(quantize_calibration_path))
+
+	for model_path, quantize_metric, _ in model_sessions:
+		model_inputs_list = quantize_inputs_set.get(model_path)
+
+		if model_inputs_list:
+			for quantize_precision in quantize_precisions:
+				if not quantize_model(model_path, quantize_precision, quantize_metric, model_inputs_list, is_directory(quantize_calibration_path)):
+					error_code = 1
+		else:
+			logger.warn(wording.get('quantizing_model_skipped').format(model_name = get_file_name(model_path)), __name__)
+
+	return error_code
+
+
+def collect_model_sessions() -> List[Tuple[str, QuantizeMetric, InferenceSession]]:
+	model_sessions : List[Tuple[str, QuantizeMetric, InferenceSession]] = []
+
+	for module in collect_model_modules():
+		if hasattr(module, 'get_inference_pool') and module is not content_analyser:
+			quantize_metric = resolve_quantize_metric(module.__name__)
+			model_source_set : DownloadSet = {}
+
+			if hasattr(module, 'collect_model_downloads'):
+				_, model_source_set = module.collect_model_downloads()
+			elif hasattr(module, 'get_model_options'):
+				model_source_set = module.get_model_options().get('sources')
+
+			for model_name, inference_session in module.get_inference_pool().items():
+				model_path = model_source_set.get(model_name).get('path')
+
+				if model_path.endswith('.onnx') and model_path not in [ model_session[0] for model_session in model_sessions ]:
+					model_sessions.append((model_path, quantize_metric, inference_session))
+
+	return model_sessions
+
+
+def capture_model_inputs(model_sessions : List[Tuple[str, QuantizeMetric, InferenceSession]], vision_frames : List[VisionFrame]) -> QuantizeInputsSet:
+	source_vision_frames = read_static_images(filter_image_paths(state_manager.get_item('source_paths') or []))
+	quantize_inputs_set : QuantizeInputsSet = {}
+
+	for _, _, inference_session in model_sessions:
+		inference_manager.capture_inference(inference_session)
+
+	for vision_frame in vision_frames:
+		process_calibration_frame(vision_frame, source_vision_frames)
+
+	for model_path, _, inference_session in model_sessions:
+		quantize_inputs_set[model_path] = inference_manager.release_inference_capture(inference_session)[:QUANTIZE_INPUT_LIMIT]
+
+	return quantize_inputs_set
+
+
+def process_calibration_frame(vision_frame : VisionFrame, source_vision_frames : List[VisionFrame]) -> VisionFrame:
+	temp_vision_frame = vision_frame.copy()
+	get_many_faces([ vision_frame ])
+
+	for processor_module in get_processors_modules(state_manager.get_item('processors')):
+		if processor_module.pre_process('preview'):
+			temp_vision_frame = processor_module.process_frame(
+			{
+				'reference_vision_frame': vision_frame,
+				'source_audio_frame': create_empty_audio_frame(),
+				'source_voice_frame': create_empty_audio_frame(),
+				'source_vision_frames': source_vision_frames,
+				'target_vision_frame': vision_frame,
+				'temp_vision_frame': temp_vision_frame
+			})
+
+	return temp_vision_frame
+
+
+def collect_vision_frames(quantize_calibration_path : Optional[str]) -> List[VisionFrame]:
+	target_path = state_manager.get_item('target_path')
+
+	if is_directory(quantize_calibration_path):
+		image_paths = filter_image_paths(resolve_file_paths(quantize_calibration_path))
+		vision_frames = [ read_image(image_path) for image_path in image_paths ]
+		return [ vision_frame for vision_frame in vision_frames if vision_frame is not None ]
+
+	if is_image(target_path):
+		return [ read_static_image(target_path) ]
+
+	if is_video(target_path):
+		video_frame_total = count_video_frame_total(target_path)
+		vision_frames = [ read_video_frame(target_path, frame_number) for frame_number in range(0, video_frame_total, max(1, video_frame_total // QUANTIZE_FRAME_TOTAL)) ]
+		return [ vision_frame for vision_frame in vision_frames if vision_frame is not None ]
+
+	return []
+
+
+def resolve_quantize_metric(module_name : str) -> QuantizeMetric:
+	if module_name in [ 'facefusion.face_classifier', 'facefusion.face_recognizer' ]:
+		return 'cosine'
+	if module_name in [ 'facefusion.face_detector', 'facefusion.face_landmarker' ]:
+		return 'error'
+	if module_name == 'facefusion.face_masker':
+		return 'iou'
+	return 'psnr'
+
+
+def quantize_model(model_path : str, quantize_precision : QuantizePrecision, quantize_metric : QuantizeMetric, model_inputs_list : List[InferenceInputs], use_calibration : bool = False) -> bool:
+	model_file_name = get_file_name(model_path)
+	precision_model_path = get_precision_model_path(model_path, quantize_precision)
+
+	try:
+		if quantize_precision == 'fp16':
+			model = convert_float_to_float16(onnx.load(model_path), keep_io_types = True)
+			onnx.save(model, precision_model_path)
+		if quantize_precision == 'int8' and use_calibration:
+			quantize_static(model_path, precision_model_path, QuantizeDataReader(model_inputs_list))
+		if quantize_precision == 'int8' and not use_calibration:
+			quantize_dynamic(model_path, precision_model_path, weight_type = QuantType.QInt8)
+		score = validate_model(model_path, precision_model_path, quantize_metric, model_inputs_list)
+
+	except Exception:
+		remove_precision_model(precision_model_path)
+		logger.error(wording.get('quantizing_model_failed').format(model_name = model_file_name, precision = quantize_precision), __name__)
+		return False
+
+	if is_score_accepted(quantize_metric, score) and write_hash(precision_model_path):
+		logger.info(wording.get('quantizing_model_succeeded').format(model_name = model_file_name, precision = quantize_precision, metric = quantize_metric, score = round(score, 4)), __name__)
+		return True
+
+	remove_precision_model(precision_model_path)
+	logger.warn(wording.get('quantizing_model_rejected').format(model_name = model_file_name, precision = quantize_precision, metric = quantize_metric, score = round(score, 4)), __name__)
+	return False
+
+
+def remove_precision_model(precision_model_path : str) -> bool:
+	hash_path = get_hash_path(precision_model_path)
+
+	if hash_path:
+		remove_file(hash_path)
+	return remove_file(precision_model_path)
+
+
+def validate_model(model_path : str, precision_model_path : str, quantize_metric : QuantizeMetric, model_inputs_list : List[InferenceInputs]) -> float:
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	precision_inference_session = InferenceSession(precision_model_path, providers = [ 'CPUExecutionProvider' ])
+	output_scores : List[List[float]] = [ [] for _ in inference_session.get_outputs() ]
+
+	for model_inputs in model_inputs_list:
+		model_outputs = inference_session.run(None, model_inputs)
+		precision_model_outputs = precision_inference_session.run(None, model_inputs)
+
+		for output_index, (model_output, precision_model_output) in enumerate(zip(model_outputs, precision_model_outputs)):
+			output_scores[output_index].append(calculate_score(quantize_metric, model_output, precision_model_output))
+
+	scores = [ float(numpy.mean(output_score)) for output_score in output_scores ]
+
+	if quantize_metric == 'error':
+		return max(scores)
+	return min(scores)
+
+
+def calculate_score(quantize_metric : QuantizeMetric, model_output : ModelOutput, precision_model_output : ModelOutput) -> float:
+	model_output = model_output.astype(numpy.float64)
+	precision_model_output = precision_model_output.astype(numpy.float64)
+	output_range = float(numpy.ptp(model_output)) or 1.0
+
+	if quantize_metric == 'cosine':
+		return float(numpy.dot(model_output.ravel(), precision_model_output.ravel()) / (numpy.linalg.norm(model_output) * numpy.linalg.norm(precision_model_output) + 1e-8))
+	if quantize_metric == 'error':
+		return float(numpy.mean(numpy.abs(model_output - precision_model_output)) / output_range)
+	if quantize_metric == 'iou':
+		return calculate_mask_iou(model_output, precision_model_output)
+	mean_square_error = float(numpy.mean(numpy.square(model_output - precision_model_output)))
+	if mean_square_error == 0:
+		return float('inf')
+	return float(10 * numpy.log10(output_range ** 2 / mean_square_error))
+
+
+def calculate_mask_iou(model_output : ModelOutput, precision_model_output : ModelOutput) -> float:
+	if model_output.ndim == 4 and model_output.shape[1] > 1:
+		model_labels = model_output.argmax(axis = 1)
+		precision_model_labels = precision_model_output.argmax(axis = 1)
+		mask_ious = []
+
+		for label in numpy.unique(model_labels):
+			mask_ious.append(calculate_mask_iou(model_labels == label, precision_model_labels == label))
+		return float(numpy.mean(mask_ious))
+
+	model_mask = model_output > 0.5
+	precision_model_mask = precision_model_output > 0.5
+	mask_union = numpy.logical_or(model_mask, precision_model_mask).sum()
+
+	if mask_union == 0:
+		return 1.0
+	return float(numpy.logical_and(model_mask, precision_model_mask).sum() / mask_union)
+
+
+def is_score_accepted(quantize_metric : QuantizeMetric, score : float) -> bool:
+	if quantize_metric == 'error':
+		return score <= facefusion.choices.quantize_metric_set.get(quantize_metric)
+	return score >= facefusion.choices.quantize_metric_set.get(quantize_metric)
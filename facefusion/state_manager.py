@@ -1,14 +1,17 @@
-from typing import Any, Union
+from contextvars import ContextVar
+from types import MappingProxyType
+from typing import Any, Optional, Union
 
 from facefusion.app_context import detect_app_context
 from facefusion.processors.types import ProcessorState, ProcessorStateKey, ProcessorStateSet
-from facefusion.types import State, StateKey, StateSet
+from facefusion.types import State, StateKey, StateSet, StateSnapshot
 
 STATE_SET : Union[StateSet, ProcessorStateSet] =\
 {
 	'cli': {}, #type:ignore[assignment]
 	'ui': {} #type:ignore[assignment]
 }
+STATE_SNAPSHOT : ContextVar[Optional[StateSnapshot]] = ContextVar('state_snapshot', default = None)
 
 
 def get_state() -> Union[State, ProcessorState]:
@@ -20,17 +23,27 @@ def sync_state() -> None:
 	STATE_SET['cli'] = STATE_SET.get('ui') #type:ignore[assignment]
 
 
+def bind_state_snapshot() -> None:
+	STATE_SNAPSHOT.set(MappingProxyType(dict(get_state())))
+
+
 def init_item(key : Union[StateKey, ProcessorStateKey], value : Any) -> None:
+	STATE_SNAPSHOT.set(None)
 	STATE_SET['cli'][key] = value #type:ignore[literal-required]
 	STATE_SET['ui'][key] = value #type:ignore[literal-required]
 
 
 def get_item(key : Union[StateKey, ProcessorStateKey]) -> Any:
+	state_snapshot = STATE_SNAPSHOT.get()
+
+	if state_snapshot is not None:
+		return state_snapshot.get(key)
 	return get_state().get(key) #type:ignore[literal-required]
 
 
 def set_item(key : Union[StateKey, ProcessorStateKey], value : Any) -> None:
 	app_context = detect_app_context()
+	STATE_SNAPSHOT.set(None)
 	STATE_SET[app_context][key] = value #type:ignore[literal-required]
 
 
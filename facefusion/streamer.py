@@ -2,6 +2,7 @@ import os
 import subprocess
 from collections import deque
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Deque, Generator
 
 import cv2
@@ -9,6 +10,7 @@ import numpy
 from tqdm import tqdm
 
 from facefusion import ffmpeg_builder, logger, state_manager, wording
+from facefusion.app_context import detect_app_context, run_in_app_context
 from facefusion.audio import create_empty_audio_frame
 from facefusion.content_analyser import analyse_stream
 from facefusion.ffmpeg import open_ffmpeg
@@ -20,6 +22,7 @@ from facefusion.vision import read_static_images
 
 def multi_process_capture(camera_capture : cv2.VideoCapture, camera_fps : Fps) -> Generator[VisionFrame, None, None]:
 	capture_deque : Deque[VisionFrame] = deque()
+	app_context = detect_app_context()
 
 	with tqdm(desc = wording.get('streaming'), unit = 'frame', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 		with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
@@ -31,7 +34,7 @@ def multi_process_capture(camera_capture : cv2.VideoCapture, camera_fps : Fps) -
 					camera_capture.release()
 
 				if numpy.any(capture_frame):
-					future = executor.submit(process_stream_frame, capture_frame)
+					future = executor.submit(run_in_app_context, app_context, partial(process_stream_frame, capture_frame))
 					futures.append(future)
 
 				for future_done in [ future for future in futures if future.done() ]:
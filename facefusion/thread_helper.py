@@ -1,12 +1,18 @@
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
-from typing import ContextManager, Union
+from functools import partial
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Union
 
+from facefusion import state_manager
+from facefusion.app_context import detect_app_context, run_in_app_context
 from facefusion.common_helper import is_linux, is_windows
 from facefusion.execution import has_execution_provider
 
 THREAD_LOCK : threading.Lock = threading.Lock()
 THREAD_SEMAPHORE : threading.Semaphore = threading.Semaphore()
+INFERENCE_SEMAPHORE_LOCK : threading.Lock = threading.Lock()
+INFERENCE_SEMAPHORE_SET : Dict[str, threading.Semaphore] = {}
 NULL_CONTEXT : ContextManager[None] = nullcontext()
 
 
@@ -18,7 +24,25 @@ def thread_semaphore() -> threading.Semaphore:
 	return THREAD_SEMAPHORE
 
 
+def inference_semaphore(module_name : str) -> threading.Semaphore:
+	inference_limit = (state_manager.get_item('execution_session_replica_count') or 1) * (state_manager.get_item('execution_batch_size') or 1)
+	semaphore_key = module_name + '.' + str(inference_limit)
+
+	with INFERENCE_SEMAPHORE_LOCK:
+		if semaphore_key not in INFERENCE_SEMAPHORE_SET:
+			INFERENCE_SEMAPHORE_SET[semaphore_key] = threading.Semaphore(inference_limit)
+		return INFERENCE_SEMAPHORE_SET[semaphore_key]
+
+
 def conditional_thread_semaphore() -> Union[threading.Semaphore, ContextManager[None]]:
 	if is_windows() and has_execution_provider('directml') or is_linux() and has_execution_provider('migraphx') or is_linux() and has_execution_provider('rocm'):
 		return THREAD_SEMAPHORE
 	return NULL_CONTEXT
+
+
+def run_parallel(functions : List[Callable[[], Any]], thread_count : Optional[int] = None) -> List[Any]:
+	app_context = detect_app_context()
+	thread_count = thread_count or state_manager.get_item('execution_load_thread_count') or 1
+
+	with ThreadPoolExecutor(max_workers = thread_count) as executor:
+		return list(executor.map(partial(run_in_app_context, app_context), functions))
@@ -0,0 +1,130 @@
+import bisect
+import os
+import threading
+from typing import Optional
+
+import cv2
+
+from facefusion.filesystem import create_directory, is_directory, is_video, remove_directory, resolve_file_paths, resolve_relative_path
+from facefusion.hash_helper import create_hash
+from facefusion.json import read_json, write_json
+from facefusion.types import Resolution, ThumbnailIndex, ThumbnailIndexSet, VisionFrame
+from facefusion.vision import read_image, restrict_frame, write_image
+
+THUMBNAIL_INDEX_SET : ThumbnailIndexSet = {}
+THUMBNAIL_LOCK : threading.Lock = threading.Lock()
+THUMBNAIL_SEMAPHORE : threading.Semaphore = threading.Semaphore(2)
+THUMBNAIL_LIMIT : int = 32
+THUMBNAIL_INTERVAL : int = 25
+THUMBNAIL_RESOLUTION : Resolution = (640, 640)
+
+
+def get_thumbnails_directory() -> str:
+	return resolve_relative_path('../.caches/thumbnails')
+
+
+def get_thumbnail_directory(video_path : str) -> str:
+	video_stat = os.stat(video_path)
+	thumbnail_key = create_hash('{path}:{size}:{mtime}'.format(path = os.path.abspath(video_path), size = video_stat.st_size, mtime = video_stat.st_mtime_ns).encode())
+	return os.path.join(get_thumbnails_directory(), thumbnail_key)
+
+
+def get_thumbnail_index_path(video_path : str) -> str:
+	return os.path.join(get_thumbnail_directory(video_path), 'index.json')
+
+
+def get_thumbnail_path(video_path : str, frame_position : int) -> str:
+	return os.path.join(get_thumbnail_directory(video_path), str(frame_position) + '.jpg')
+
+
+def get_thumbnail_index(video_path : str) -> ThumbnailIndex:
+	return THUMBNAIL_INDEX_SET.get(get_thumbnail_directory(video_path), [])
+
+
+def prepare_thumbnails(video_path : str) -> bool:
+	if is_video(video_path):
+		thumbnail_directory = get_thumbnail_directory(video_path)
+
+		with THUMBNAIL_LOCK:
+			if thumbnail_directory in THUMBNAIL_INDEX_SET:
+				return True
+
+			thumbnail_index = read_json(get_thumbnail_index_path(video_path))
+
+			if thumbnail_index:
+				THUMBNAIL_INDEX_SET[thumbnail_directory] = thumbnail_index #type:ignore[assignment]
+				os.utime(thumbnail_directory)
+				return True
+
+			THUMBNAIL_INDEX_SET[thumbnail_directory] = []
+
+		threading.Thread(target = create_thumbnails, args = (video_path,), daemon = True).start()
+		return True
+	return False
+
+
+def create_thumbnails(video_path : str) -> bool:
+	thumbnail_directory = get_thumbnail_directory(video_path)
+
+	with THUMBNAIL_SEMAPHORE:
+		thumbnail_index = THUMBNAIL_INDEX_SET.setdefault(thumbnail_directory, [])
+		video_capture = cv2.VideoCapture(video_path)
+		frame_position = 0
+
+		if video_capture.isOpened() and create_directory(thumbnail_directory):
+			evict_thumbnails()
+
+			while video_capture.grab():
+				if frame_position % THUMBNAIL_INTERVAL == 0:
+					has_vision_frame, vision_frame = video_capture.retrieve()
+
+					if has_vision_frame and write_image(get_thumbnail_path(video_path, frame_position), restrict_frame(vision_frame, THUMBNAIL_RESOLUTION)):
+						thumbnail_index.append(frame_position)
+				frame_position += 1
+
+		video_capture.release()
+
+		if thumbnail_index and write_json(get_thumbnail_index_path(video_path), thumbnail_index): #type:ignore[arg-type]
+			return True
+
+	with THUMBNAIL_LOCK:
+		THUMBNAIL_INDEX_SET.pop(thumbnail_directory, None)
+	remove_directory(thumbnail_directory)
+	return False
+
+
+def evict_thumbnails() -> None:
+	thumbnail_directories = [ thumbnail_directory for thumbnail_directory in resolve_file_paths(get_thumbnails_directory()) if is_directory(thumbnail_directory) ]
+	thumbnail_directories.sort(key = os.path.getmtime)
+
+	for thumbnail_directory in thumbnail_directories[:-THUMBNAIL_LIMIT]:
+		with THUMBNAIL_LOCK:
+			THUMBNAIL_INDEX_SET.pop(thumbnail_directory, None)
+		remove_directory(thumbnail_directory)
+
+
+def find_thumbnail_position(thumbnail_index : ThumbnailIndex, frame_position : int) -> Optional[int]:
+	if thumbnail_index:
+		thumbnail_cursor = bisect.bisect_left(thumbnail_index, frame_position)
+
+		if thumbnail_cursor == len(thumbnail_index):
+			return thumbnail_index[-1]
+		if thumbnail_cursor > 0 and frame_position - thumbnail_index[thumbnail_cursor - 1] <= thumbnail_index[thumbnail_cursor] - frame_position:
+			return thumbnail_index[thumbnail_cursor - 1]
+		return thumbnail_index[thumbnail_cursor]
+	return None
+
+
+def read_thumbnail_frame(video_path : str, frame_number : int = 0) -> Optional[VisionFrame]:
+	if prepare_thumbnails(video_path):
+		thumbnail_position = find_thumbnail_position(get_thumbnail_index(video_path), max(0, frame_number - 1))
+
+		if thumbnail_position is not None:
+			return read_image(get_thumbnail_path(video_path, thumbnail_position))
+
+	return None
+
+
+def clear_thumbnail_index() -> None:
+	with THUMBNAIL_LOCK:
+		THUMBNAIL_INDEX_SET.clear()
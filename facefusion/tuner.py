@@ -0,0 +1,113 @@
+import statistics
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+import numpy
+from onnxruntime import InferenceSession
+
+from facefusion import logger, state_manager, wording
+from facefusion.common_helper import get_first
+from facefusion.execution import create_inference_session_options, create_inference_session_providers, get_tune_key, get_tune_path, read_static_tune_set, resolve_session_thread_count
+from facefusion.filesystem import create_directory, get_file_name, is_file, resolve_relative_path
+from facefusion.inference_manager import resolve_execution_precision
+from facefusion.json import write_json
+from facefusion.model_helper import collect_model_modules, create_model_inputs, resolve_precision_model_path
+from facefusion.types import DownloadSet, ErrorCode, ExecutionProvider, Resolution, TuneOptions, TuneSet
+from facefusion.warmer import resolve_model_resolution
+
+
+def run() -> ErrorCode:
+	execution_device_id = get_first(state_manager.get_item('execution_device_ids'))
+	execution_providers = state_manager.get_item('execution_providers')
+	tune_set : TuneSet = dict(read_static_tune_set())
+
+	for model_path, model_resolution in collect_model_paths().items():
+		try:
+			tune_options = tune_model(model_path, execution_device_id, execution_providers, model_resolution)
+		except Exception:
+			logger.error(wording.get('tuning_model_failed').format(model_name = get_file_name(model_path)), __name__)
+			continue
+
+		tune_set[get_tune_key(model_path, execution_providers)] = tune_options
+		logger.info(wording.get('tuning_model_succeeded').format(model_name = get_file_name(model_path), tune_options = tune_options), __name__)
+
+	if create_directory(resolve_relative_path('../.caches')) and write_json(get_tune_path(), tune_set):
+		read_static_tune_set.cache_clear()
+		return 0
+	return 1
+
+
+def collect_model_paths() -> Dict[str, Optional[Resolution]]:
+	model_paths : Dict[str, Optional[Resolution]] = {}
+
+	for module in collect_model_modules():
+		model_source_set : DownloadSet = {}
+
+		if hasattr(module, 'collect_model_downloads'):
+			_, model_source_set = module.collect_model_downloads()
+		elif hasattr(module, 'get_model_options'):
+			model_source_set = module.get_model_options().get('sources')
+
+		for model_source in model_source_set.values():
+			model_path = resolve_precision_model_path(model_source.get('path'), resolve_execution_precision(module.__name__))
+
+			if model_path.endswith('.onnx') and is_file(model_path) and model_path not in model_paths:
+				model_paths[model_path] = resolve_model_resolution(module)
+
+	return model_paths
+
+
+def create_tune_candidates(execution_providers : List[ExecutionProvider]) -> Dict[str, List[Any]]:
+	session_thread_count = resolve_session_thread_count(state_manager.get_item('execution_thread_count'), 0)
+	tune_candidates : Dict[str, List[Any]] =\
+	{
+		'intra_op_num_threads': sorted({ session_thread_count, max(1, session_thread_count // 2), 1 }, reverse = True),
+		'graph_optimization_level': [ 'all', 'extended', 'basic' ]
+	}
+
+	if 'cuda' in execution_providers:
+		tune_candidates['cudnn_conv_algo_search'] = [ 'EXHAUSTIVE', 'HEURISTIC', 'DEFAULT' ]
+		tune_candidates['arena_extend_strategy'] = [ 'kNextPowerOfTwo', 'kSameAsRequested' ]
+	if 'openvino' in execution_providers:
+		tune_candidates['openvino_precision'] = [ 'FP32', 'FP16' ]
+	return tune_candidates
+
+
+def tune_model(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider], model_resolution : Optional[Resolution] = None) -> TuneOptions:
+	tune_options : TuneOptions = {}
+	tune_time = measure_model(model_path, execution_device_id, execution_providers, tune_options, model_resolution)
+
+	for tune_name, tune_values in create_tune_candidates(execution_providers).items():
+		for tune_value in tune_values:
+			candidate_options = dict(tune_options)
+			candidate_options[tune_name] = tune_value
+
+			try:
+				candidate_time = measure_model(model_path, execution_device_id, execution_providers, candidate_options, model_resolution)
+			except Exception:
+				logger.warn(wording.get('tuning_candidate_skipped').format(model_name = get_file_name(model_path), tune_name = tune_name, tune_value = tune_value), __name__)
+				continue
+
+			if candidate_time < tune_time:
+				tune_options = candidate_options
+				tune_time = candidate_time
+
+	return tune_options
+
+
+def measure_model(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider], tune_options : TuneOptions, model_resolution : Optional[Resolution] = None) -> float:
+	inference_session_providers = create_inference_session_providers(execution_device_id, execution_providers, tune_options)
+	inference_session_options = create_inference_session_options(state_manager.get_item('execution_thread_count'), 0, None, tune_options)
+	inference_session = InferenceSession(model_path, sess_options = inference_session_options, providers = inference_session_providers)
+	vision_frame = numpy.random.default_rng(0).integers(0, 255, (512, 512, 3)).astype(numpy.uint8)
+	model_inputs = create_model_inputs(inference_session, vision_frame, model_resolution)
+	process_times = []
+
+	inference_session.run(None, model_inputs)
+
+	for _ in range(state_manager.get_item('tune_cycle_count')):
+		start_time = perf_counter()
+		inference_session.run(None, model_inputs)
+		process_times.append(perf_counter() - start_time)
+
+	return statistics.median(process_times)
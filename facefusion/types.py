@@ -1,10 +1,13 @@
+import threading
 from collections import namedtuple
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypeAlias, TypedDict
+from typing import Any, Callable, Dict, List, Literal, Mapping, Optional, TYPE_CHECKING, Tuple, TypeAlias, TypedDict
 
-import cv2
 import numpy
 from numpy.typing import NDArray
-from onnxruntime import InferenceSession
+
+if TYPE_CHECKING:
+	import cv2
+	from onnxruntime import IOBinding, InferenceSession, OrtValue
 
 Scale : TypeAlias = float
 Score : TypeAlias = float
@@ -45,14 +48,10 @@ Face = namedtuple('Face',
 	'race'
 ])
 FaceSet : TypeAlias = Dict[str, List[Face]]
-FaceStore = TypedDict('FaceStore',
-{
-	'static_faces' : FaceSet
-})
 
-VideoCaptureSet : TypeAlias = Dict[str, cv2.VideoCapture]
-VideoWriterSet : TypeAlias = Dict[str, cv2.VideoWriter]
-CameraCaptureSet : TypeAlias = Dict[str, cv2.VideoCapture]
+VideoCaptureSet : TypeAlias = Dict[str, 'cv2.VideoCapture']
+VideoWriterSet : TypeAlias = Dict[str, 'cv2.VideoWriter']
+CameraCaptureSet : TypeAlias = Dict[str, 'cv2.VideoCapture']
 VideoPoolSet = TypedDict('VideoPoolSet',
 {
 	'capture': VideoCaptureSet,
@@ -62,6 +61,8 @@ CameraPoolSet = TypedDict('CameraPoolSet',
 {
 	'capture': CameraCaptureSet
 })
+ThumbnailIndex : TypeAlias = List[int]
+ThumbnailIndexSet : TypeAlias = Dict[str, ThumbnailIndex]
 
 VisionFrame : TypeAlias = NDArray[Any]
 Mask : TypeAlias = NDArray[Any]
@@ -70,6 +71,12 @@ Distance : TypeAlias = NDArray[Any]
 Matrix : TypeAlias = NDArray[Any]
 Anchors : TypeAlias = NDArray[Any]
 Translation : TypeAlias = NDArray[Any]
+MaskSet : TypeAlias = Dict[str, Mask]
+FaceStore = TypedDict('FaceStore',
+{
+	'static_faces' : FaceSet,
+	'static_masks' : MaskSet
+})
 
 AudioBuffer : TypeAlias = bytes
 Audio : TypeAlias = NDArray[Any]
@@ -158,10 +165,37 @@ StreamMode = Literal['udp', 'v4l2']
 ModelOptions : TypeAlias = Dict[str, Any]
 ModelSet : TypeAlias = Dict[str, ModelOptions]
 ModelInitializer : TypeAlias = NDArray[Any]
+ModelInput : TypeAlias = NDArray[Any]
+ModelInputs : TypeAlias = Dict[str, ModelInput]
+ModelOutput : TypeAlias = NDArray[Any]
 
 ExecutionProvider = Literal['cpu', 'coreml', 'cuda', 'directml', 'openvino', 'migraphx', 'rocm', 'tensorrt']
 ExecutionProviderValue = Literal['CPUExecutionProvider', 'CoreMLExecutionProvider', 'CUDAExecutionProvider', 'DmlExecutionProvider', 'OpenVINOExecutionProvider', 'MIGraphXExecutionProvider', 'ROCMExecutionProvider', 'TensorrtExecutionProvider']
 ExecutionProviderSet : TypeAlias = Dict[ExecutionProvider, ExecutionProviderValue]
+ExecutionPrecision = Literal['fp32', 'fp16', 'int8']
+ExecutionDispatchMode = Literal['least_busy', 'round_robin']
+GraphOptimizationLevelName = Literal['basic', 'extended', 'all']
+TuneOptions : TypeAlias = Dict[str, Any]
+WarmUpSet : TypeAlias = Dict[str, float]
+ProfileTimeSet : TypeAlias = Dict[str, List[float]]
+ProfileMetric = TypedDict('ProfileMetric',
+{
+	'total' : float,
+	'calls' : int,
+	'mean' : float,
+	'p95' : float
+})
+ProfileReport = TypedDict('ProfileReport',
+{
+	'models' : Dict[str, ProfileMetric],
+	'operators' : Dict[str, ProfileMetric],
+	'processors' : Dict[str, ProfileMetric]
+})
+TuneSet : TypeAlias = Dict[str, TuneOptions]
+
+QuantizePrecision = Literal['fp16', 'int8']
+QuantizeMetric = Literal['cosine', 'error', 'iou', 'psnr']
+QuantizeMetricSet : TypeAlias = Dict[QuantizeMetric, float]
 InferenceSessionProvider : TypeAlias = Any
 ValueAndUnit = TypedDict('ValueAndUnit',
 {
@@ -217,12 +251,46 @@ Download = TypedDict('Download',
 	'path' : str
 })
 DownloadSet : TypeAlias = Dict[str, Download]
+HashManifest : TypeAlias = Dict[str, str]
 
 VideoMemoryStrategy = Literal['strict', 'moderate', 'tolerant']
 AppContext = Literal['cli', 'ui']
 
-InferencePool : TypeAlias = Dict[str, InferenceSession]
+InferencePool : TypeAlias = Dict[str, 'InferenceSession']
 InferencePoolSet : TypeAlias = Dict[AppContext, Dict[str, InferencePool]]
+InferenceLoadSet : TypeAlias = Dict[int, int]
+InferenceDispatchSet : TypeAlias = Dict[str, int]
+InferenceMemory = Literal['system', 'video']
+InferenceUsage = TypedDict('InferenceUsage',
+{
+	'memory' : InferenceMemory,
+	'size' : int,
+	'access_time' : float
+})
+InferenceUsageSet : TypeAlias = Dict[str, InferenceUsage]
+InferenceInputs : TypeAlias = Dict[str, Any]
+InferenceRequest = TypedDict('InferenceRequest',
+{
+	'inference_inputs' : InferenceInputs,
+	'inference_outputs' : List[Any],
+	'event' : threading.Event
+})
+InferenceBatchSet : TypeAlias = Dict[str, List[InferenceRequest]]
+InferenceBinding = TypedDict('InferenceBinding',
+{
+	'io_binding' : 'IOBinding',
+	'device_id' : int,
+	'input_values' : Dict[str, 'OrtValue'],
+	'output_values' : Dict[str, List['OrtValue']]
+})
+InferenceBindingPool = TypedDict('InferenceBindingPool',
+{
+	'inference_bindings' : List[InferenceBinding],
+	'binding_total' : int
+})
+InferenceBindingSet : TypeAlias = Dict[int, InferenceBindingPool]
+InferenceCaptureSet : TypeAlias = Dict[int, List[InferenceInputs]]
+QuantizeInputsSet : TypeAlias = Dict[str, List[InferenceInputs]]
 
 UiWorkflow = Literal['instant_runner', 'job_runner', 'job_manager']
 
@@ -262,9 +330,15 @@ StateKey = Literal\
 	'output_pattern',
 	'download_providers',
 	'download_scope',
+	'download_thread_count',
+	'download_force_validation',
 	'benchmark_mode',
 	'benchmark_resolutions',
 	'benchmark_cycle_count',
+	'quantize_precisions',
+	'quantize_calibration_path',
+	'tune_cycle_count',
+	'warm_up_cycle_count',
 	'face_detector_model',
 	'face_detector_size',
 	'face_detector_angles',
@@ -309,8 +383,19 @@ StateKey = Literal\
 	'execution_device_ids',
 	'execution_providers',
 	'execution_thread_count',
+	'execution_session_thread_count',
+	'execution_session_replica_count',
+	'execution_dispatch_mode',
+	'execution_batch_size',
+	'execution_batch_timeout',
+	'execution_load_thread_count',
+	'execution_profile_path',
+	'execution_share_weights',
+	'execution_precision',
 	'video_memory_strategy',
 	'system_memory_limit',
+	'system_memory_budget',
+	'video_memory_budget',
 	'log_level',
 	'halt_on_error',
 	'job_id',
@@ -331,9 +416,15 @@ State = TypedDict('State',
 	'output_pattern' : str,
 	'download_providers' : List[DownloadProvider],
 	'download_scope' : DownloadScope,
+	'download_thread_count' : int,
+	'download_force_validation' : bool,
 	'benchmark_mode' : BenchmarkMode,
 	'benchmark_resolutions' : List[BenchmarkResolution],
 	'benchmark_cycle_count' : int,
+	'quantize_precisions' : List[QuantizePrecision],
+	'quantize_calibration_path' : str,
+	'tune_cycle_count' : int,
+	'warm_up_cycle_count' : int,
 	'face_detector_model' : FaceDetectorModel,
 	'face_detector_size' : str,
 	'face_detector_angles' : List[Angle],
@@ -378,8 +469,19 @@ State = TypedDict('State',
 	'execution_device_ids' : List[str],
 	'execution_providers' : List[ExecutionProvider],
 	'execution_thread_count' : int,
+	'execution_session_thread_count' : int,
+	'execution_session_replica_count' : int,
+	'execution_dispatch_mode' : ExecutionDispatchMode,
+	'execution_batch_size' : int,
+	'execution_batch_timeout' : int,
+	'execution_load_thread_count' : int,
+	'execution_profile_path' : Optional[str],
+	'execution_share_weights' : bool,
+	'execution_precision' : ExecutionPrecision,
 	'video_memory_strategy' : VideoMemoryStrategy,
 	'system_memory_limit' : int,
+	'system_memory_budget' : int,
+	'video_memory_budget' : int,
 	'log_level' : LogLevel,
 	'halt_on_error' : bool,
 	'job_id' : str,
@@ -388,4 +490,5 @@ State = TypedDict('State',
 })
 ApplyStateItem : TypeAlias = Callable[[Any, Any], None]
 StateSet : TypeAlias = Dict[AppContext, State]
+StateSnapshot : TypeAlias = Mapping[str, Any]
 
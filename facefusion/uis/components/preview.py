@@ -14,6 +14,7 @@ from facefusion.face_selector import select_faces
 from facefusion.face_store import clear_static_faces
 from facefusion.filesystem import filter_audio_paths, is_image, is_video
 from facefusion.processors.core import get_processors_modules
+from facefusion.thumbnail_manager import prepare_thumbnails, read_thumbnail_frame
 from facefusion.types import AudioFrame, Face, VisionFrame
 from facefusion.uis import choices as uis_choices
 from facefusion.uis.core import get_ui_component, get_ui_components, register_ui_component
@@ -72,7 +73,7 @@ def listen() -> None:
 
 	if preview_frame_slider:
 		preview_frame_slider.release(update_preview_image, inputs = [ preview_mode_dropdown, preview_resolution_dropdown, preview_frame_slider ], outputs = PREVIEW_IMAGE, show_progress = 'hidden')
-		preview_frame_slider.change(update_preview_image, inputs = [ preview_mode_dropdown, preview_resolution_dropdown, preview_frame_slider ], outputs = PREVIEW_IMAGE, show_progress = 'hidden', trigger_mode = 'once')
+		preview_frame_slider.change(update_preview_thumbnail, inputs = [ preview_mode_dropdown, preview_frame_slider ], outputs = PREVIEW_IMAGE, show_progress = 'hidden', trigger_mode = 'always_last').then(update_preview_image, inputs = [ preview_mode_dropdown, preview_resolution_dropdown, preview_frame_slider ], outputs = PREVIEW_IMAGE, show_progress = 'hidden', trigger_mode = 'once')
 
 		reference_face_position_gallery = get_ui_component('reference_face_position_gallery')
 		if reference_face_position_gallery:
@@ -195,6 +196,7 @@ def update_preview_image(preview_mode : PreviewMode, preview_resolution : str, f
 		return gradio.Image(value = preview_vision_frame, elem_classes = [ 'image-preview', 'is-' + detect_frame_orientation(preview_vision_frame) ])
 
 	if is_video(state_manager.get_item('target_path')):
+		prepare_thumbnails(state_manager.get_item('target_path'))
 		reference_vision_frame = read_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
 		temp_vision_frame = read_video_frame(state_manager.get_item('target_path'), frame_number)
 		preview_vision_frame = process_preview_frame(reference_vision_frame, source_vision_frames, source_audio_frame, source_voice_frame, temp_vision_frame, preview_mode, preview_resolution)
@@ -203,6 +205,20 @@ def update_preview_image(preview_mode : PreviewMode, preview_resolution : str, f
 	return gradio.Image(value = None, elem_classes = None)
 
 
+def update_preview_thumbnail(preview_mode : PreviewMode, frame_number : int = 0) -> gradio.Image:
+	if is_video(state_manager.get_item('target_path')) and preview_mode in [ 'default', 'frame-by-frame' ]:
+		thumbnail_vision_frame = read_thumbnail_frame(state_manager.get_item('target_path'), frame_number)
+
+		if numpy.any(thumbnail_vision_frame):
+			if analyse_frame(thumbnail_vision_frame):
+				thumbnail_vision_frame = obscure_frame(thumbnail_vision_frame)
+			if preview_mode == 'frame-by-frame':
+				thumbnail_vision_frame = numpy.hstack((thumbnail_vision_frame, thumbnail_vision_frame))
+			thumbnail_vision_frame = cv2.cvtColor(thumbnail_vision_frame, cv2.COLOR_BGR2RGB)
+			return gradio.Image(value = thumbnail_vision_frame, elem_classes = [ 'image-preview', 'is-' + detect_frame_orientation(thumbnail_vision_frame) ])
+	return gradio.skip()
+
+
 def clear_and_update_preview_image(preview_mode : PreviewMode, preview_resolution : str, frame_number : int = 0) -> gradio.Image:
 	clear_static_faces()
 	return update_preview_image(preview_mode, preview_resolution, frame_number)
@@ -1,3 +1,5 @@
+import threading
+
 import cv2
 
 from facefusion.types import VideoPoolSet
@@ -7,16 +9,51 @@ VIDEO_POOL_SET : VideoPoolSet =\
 	'capture': {},
 	'writer': {}
 }
+VIDEO_SKIP_LIMIT : int = 25
+VIDEO_CAPTURE_LIMIT : int = 8
+VIDEO_LOCK : threading.Lock = threading.Lock()
 
 
 def get_video_capture(video_path : str) -> cv2.VideoCapture:
-	if video_path not in VIDEO_POOL_SET.get('capture'):
-		video_capture = cv2.VideoCapture(video_path)
+	video_capture_key = get_video_capture_key(video_path)
+
+	with VIDEO_LOCK:
+		video_capture = VIDEO_POOL_SET.get('capture').pop(video_capture_key, None)
+
+		if video_capture is None:
+			release_video_captures(video_path)
+			video_capture = cv2.VideoCapture(video_path)
 
 		if video_capture.isOpened():
-			VIDEO_POOL_SET['capture'][video_path] = video_capture
+			VIDEO_POOL_SET['capture'][video_capture_key] = video_capture
+
+	return video_capture
+
+
+def get_video_capture_key(video_path : str) -> str:
+	return video_path + '.' + str(threading.get_ident())
+
+
+def release_video_captures(video_path : str) -> None:
+	thread_idents = [ thread.ident for thread in threading.enumerate() ]
+
+	for video_capture_key in list(VIDEO_POOL_SET.get('capture').keys()):
+		if int(video_capture_key.rsplit('.', 1)[-1]) not in thread_idents:
+			VIDEO_POOL_SET['capture'].pop(video_capture_key).release()
+
+	video_capture_keys = [ video_capture_key for video_capture_key in VIDEO_POOL_SET.get('capture') if video_capture_key.rsplit('.', 1)[0] == video_path ]
+
+	# captures of live threads are only dropped from the pool as the owning thread may still read from them
+	while len(video_capture_keys) >= VIDEO_CAPTURE_LIMIT:
+		VIDEO_POOL_SET['capture'].pop(video_capture_keys.pop(0))
+
+
+def seek_video_capture(video_capture : cv2.VideoCapture, frame_number : int) -> bool:
+	frame_skip_total = frame_number - int(video_capture.get(cv2.CAP_PROP_POS_FRAMES))
 
-	return VIDEO_POOL_SET.get('capture').get(video_path)
+	if 0 <= frame_skip_total <= VIDEO_SKIP_LIMIT:
+		return all(video_capture.grab() for _ in range(frame_skip_total))
+	return video_capture.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
 
 
 def get_video_writer(video_path : str) -> cv2.VideoWriter:
@@ -30,11 +67,12 @@ def get_video_writer(video_path : str) -> cv2.VideoWriter:
 
 
 def clear_video_pool() -> None:
-	for video_capture in VIDEO_POOL_SET.get('capture').values():
-		video_capture.release()
+	with VIDEO_LOCK:
+		for video_capture in VIDEO_POOL_SET.get('capture').values():
+			video_capture.release()
 
-	for video_writer in VIDEO_POOL_SET.get('writer').values():
-		video_writer.release()
+		for video_writer in VIDEO_POOL_SET.get('writer').values():
+			video_writer.release()
 
-	VIDEO_POOL_SET['capture'].clear()
-	VIDEO_POOL_SET['writer'].clear()
+		VIDEO_POOL_SET['capture'].clear()
+		VIDEO_POOL_SET['writer'].clear()
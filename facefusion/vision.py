@@ -10,7 +10,7 @@ from facefusion.common_helper import is_windows
 from facefusion.filesystem import get_file_extension, is_image, is_video
 from facefusion.thread_helper import thread_semaphore
 from facefusion.types import Duration, Fps, Orientation, Resolution, Scale, VisionFrame
-from facefusion.video_manager import get_video_capture
+from facefusion.video_manager import get_video_capture, seek_video_capture
 
 
 def read_static_images(image_paths : List[str]) -> List[VisionFrame]:
@@ -75,11 +75,9 @@ def read_video_frame(video_path : str, frame_number : int = 0) -> Optional[Visio
 		video_capture = get_video_capture(video_path)
 
 		if video_capture.isOpened():
-			frame_total = video_capture.get(cv2.CAP_PROP_FRAME_COUNT)
-
-			with thread_semaphore():
-				video_capture.set(cv2.CAP_PROP_POS_FRAMES, min(frame_total, frame_number - 1))
-				has_vision_frame, vision_frame = video_capture.read()
+			frame_total = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
+			seek_video_capture(video_capture, max(0, min(frame_total, frame_number - 1)))
+			has_vision_frame, vision_frame = video_capture.read()
 
 			if has_vision_frame:
 				return vision_frame
@@ -7,7 +7,7 @@ import scipy
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import thread_semaphore
+from facefusion.thread_helper import inference_semaphore
 from facefusion.types import Audio, AudioChunk, DownloadScope, DownloadSet, InferencePool, ModelSet, Voice, VoiceChunk
 
 
@@ -134,8 +134,8 @@ def extract_voice(temp_audio_chunk : AudioChunk) -> VoiceChunk:
 def forward(temp_audio_chunk : AudioChunk) -> AudioChunk:
 	voice_extractor = get_inference_pool().get(state_manager.get_item('voice_extractor_model'))
 
-	with thread_semaphore():
-		temp_audio_chunk = voice_extractor.run(None,
+	with inference_semaphore(__name__):
+		temp_audio_chunk = inference_manager.run_inference(voice_extractor,
 		{
 			'input': temp_audio_chunk
 		})[0]
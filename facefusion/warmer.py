@@ -0,0 +1,82 @@
+from time import perf_counter
+from types import ModuleType
+from typing import Optional
+
+import numpy
+
+from facefusion import inference_manager, logger, state_manager, wording
+from facefusion.common_helper import get_last
+from facefusion.model_helper import collect_model_modules, create_model_inputs
+from facefusion.types import ErrorCode, InferencePool, Resolution, WarmUpSet
+from facefusion.vision import unpack_resolution
+
+
+def run() -> ErrorCode:
+	warm_up_set = warm_up()
+
+	for model_name, warm_up_time in warm_up_set.items():
+		if warm_up_time >= 0:
+			logger.info(wording.get('warming_up_model_succeeded').format(model_name = model_name, seconds = round(warm_up_time, 2)), __name__)
+
+	if all(warm_up_time >= 0 for warm_up_time in warm_up_set.values()):
+		return 0
+	return 1
+
+
+def warm_up() -> WarmUpSet:
+	warm_up_set : WarmUpSet = {}
+
+	for module in collect_model_modules():
+		if hasattr(module, 'get_inference_pool'):
+			module_name = get_last(module.__name__.split('.'))
+			model_resolution = resolve_model_resolution(module)
+			module.get_inference_pool()
+
+			for pool_index, inference_pool in enumerate(inference_manager.collect_inference_pools(module.__name__)):
+				for model_name, warm_up_time in warm_up_inference_pool(inference_pool, model_resolution).items():
+					warm_up_key = module_name + '.' + model_name
+
+					if pool_index > 0:
+						warm_up_key += '.' + str(pool_index)
+					warm_up_set[warm_up_key] = warm_up_time
+
+	return warm_up_set
+
+
+def resolve_model_resolution(module : ModuleType) -> Optional[Resolution]:
+	module_name = get_last(module.__name__.split('.'))
+	module_resolution = state_manager.get_item(module_name + '_size') #type:ignore[arg-type]
+
+	if module_resolution:
+		return unpack_resolution(module_resolution)
+
+	if hasattr(module, 'get_model_options'):
+		model_size = module.get_model_options().get('size')
+
+		if model_size and len(model_size) == 3:
+			return model_size[0], model_size[0]
+		if model_size:
+			return model_size[0], model_size[1]
+	return None
+
+
+def warm_up_inference_pool(inference_pool : InferencePool, model_resolution : Optional[Resolution]) -> WarmUpSet:
+	warm_up_cycle_count = state_manager.get_item('warm_up_cycle_count') or 1
+	vision_frame = numpy.random.default_rng(0).integers(0, 255, (512, 512, 3)).astype(numpy.uint8)
+	warm_up_set : WarmUpSet = {}
+
+	for model_name, inference_session in inference_pool.items():
+		start_time = perf_counter()
+
+		try:
+			model_inputs = create_model_inputs(inference_session, vision_frame, model_resolution)
+
+			for _ in range(warm_up_cycle_count):
+				inference_manager.run_inference(inference_session, model_inputs)
+			warm_up_set[model_name] = perf_counter() - start_time
+
+		except Exception:
+			logger.error(wording.get('warming_up_model_failed').format(model_name = model_name), __name__)
+			warm_up_set[model_name] = -1
+
+	return warm_up_set
@@ -84,6 +84,17 @@ WORDING : Dict[str, Any] =\
 	'deleting_corrupt_source': 'Deleting corrupt source for {source_file_name}',
 	'loading_model_succeeded': 'Loading model {model_name} succeeded in {seconds} seconds',
 	'loading_model_failed': 'Loading model {model_name} failed',
+	'evicting_inference_pool': 'Evicting inference pool {inference_context} to stay within the {memory} memory budget',
+	'quantizing_model_succeeded': 'Quantizing model {model_name} to {precision} succeeded with {metric} of {score}',
+	'quantizing_model_rejected': 'Quantizing model {model_name} to {precision} rejected with {metric} of {score}',
+	'quantizing_model_skipped': 'Quantizing model {model_name} skipped as no calibration inputs were captured',
+	'tuning_model_succeeded': 'Tuning model {model_name} succeeded with {tune_options}',
+	'tuning_model_failed': 'Tuning model {model_name} failed',
+	'tuning_candidate_skipped': 'Tuning model {model_name} skipped {tune_name} of {tune_value}',
+	'warming_up_model_succeeded': 'Warming up model {model_name} succeeded in {seconds} seconds',
+	'warming_up_model_failed': 'Warming up model {model_name} failed',
+	'writing_profile_succeeded': 'Writing profile report to {profile_path} succeeded',
+	'quantizing_model_failed': 'Quantizing model {model_name} to {precision} failed',
 	'time_ago_now': 'just now',
 	'time_ago_minutes': '{minutes} minutes ago',
 	'time_ago_hours': '{hours} hours and {minutes} minutes ago',
@@ -198,17 +209,37 @@ WORDING : Dict[str, Any] =\
 		# download
 		'download_providers': 'download using different providers (choices: {choices}, ...)',
 		'download_scope': 'specify the download scope',
+		'download_thread_count': 'specify the amount of parallel model downloads',
+		'download_force_validation': 'validate the hash of every model instead of trusting the hash manifest',
 		# benchmark
 		'benchmark_mode': 'choose the benchmark mode',
 		'benchmark_resolutions': 'choose the resolutions for the benchmarks (choices: {choices}, ...)',
 		'benchmark_cycle_count': 'specify the amount of cycles per benchmark',
+		# quantize
+		'quantize_precisions': 'choose the precisions to quantize the models to (choices: {choices}, ...)',
+		'quantize_calibration_path': 'specify the directory of images to calibrate and validate the quantized models instead of the target',
+		# tune
+		'tune_cycle_count': 'specify the amount of cycles per tuning candidate',
+		# warm up
+		'warm_up_cycle_count': 'specify the amount of inference runs per model while warming up',
 		# execution
 		'execution_device_ids': 'specify the devices used for processing',
 		'execution_providers': 'inference using different providers (choices: {choices}, ...)',
 		'execution_thread_count': 'specify the amount of parallel threads while processing',
+		'execution_session_thread_count': 'specify the amount of threads per inference session or derive them from the available cores',
+		'execution_session_replica_count': 'specify the amount of inference sessions per model and device to run in parallel',
+		'execution_dispatch_mode': 'choose how inference calls are dispatched across the inference sessions',
+		'execution_batch_size': 'specify the maximum amount of concurrent inference calls merged into one batch',
+		'execution_batch_timeout': 'specify the milliseconds to wait for concurrent inference calls before running a batch',
+		'execution_load_thread_count': 'specify the amount of parallel threads while validating and loading models',
+		'execution_profile_path': 'specify the directory to write the inference profile report to',
+		'execution_share_weights': 'memory map the model weights to share them across processes',
+		'execution_precision': 'choose the precision of the models used for inference',
 		# memory
 		'video_memory_strategy': 'balance fast processing and low VRAM usage',
 		'system_memory_limit': 'limit the available RAM that can be used while processing',
+		'system_memory_budget': 'limit the RAM in MB used by loaded models before the least recently used are evicted, replaces the video memory strategy when set',
+		'video_memory_budget': 'limit the VRAM in MB used by loaded models before the least recently used are evicted, replaces the video memory strategy when set',
 		# misc
 		'log_level': 'adjust the message severity displayed in the terminal',
 		'halt_on_error': 'halt the program once an error occurred',
@@ -218,6 +249,9 @@ WORDING : Dict[str, Any] =\
 		'batch_run': 'run the program in batch mode',
 		'force_download': 'force automate downloads and exit',
 		'benchmark': 'benchmark the program',
+		'quantize': 'quantize the models and exit',
+		'tune': 'tune the inference sessions of the models and exit',
+		'warm_up': 'warm up the inference sessions of the models and exit',
 		# jobs
 		'job_id': 'specify the job id',
 		'job_status': 'specify the job status',
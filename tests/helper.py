@@ -1,7 +1,12 @@
 import os
 import tempfile
+from typing import Optional
+
+import numpy
+import onnx
 
 from facefusion.filesystem import create_directory, is_directory, is_file, remove_directory
+from facefusion.hash_helper import create_hash, get_hash_path
 from facefusion.types import JobStatus
 
 
@@ -42,3 +47,70 @@ def prepare_test_output_directory() -> bool:
 	remove_directory(test_outputs_directory)
 	create_directory(test_outputs_directory)
 	return is_directory(test_outputs_directory)
+
+
+def create_test_model(model_path : str, batch_size : Optional[int] = 1, frame_size : Optional[int] = 32) -> str:
+	model_weight = numpy.random.default_rng(0).standard_normal((8, 3, 3, 3)).astype(numpy.float32)
+	model_graph = onnx.helper.make_graph([ onnx.helper.make_node('Conv', [ 'input', 'weight' ], [ 'output' ], pads = [ 1, 1, 1, 1 ]) ], 'test',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ batch_size, 3, frame_size, frame_size ])
+	],
+	[
+		onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ batch_size, 8, frame_size, frame_size ])
+	],
+	[
+		onnx.numpy_helper.from_array(model_weight, 'weight')
+	])
+	onnx.save(onnx.helper.make_model(model_graph, ir_version = 9, opset_imports = [ onnx.helper.make_opsetid('', 17) ]), model_path)
+	return model_path
+
+
+def create_test_anchor_model(model_path : str, anchor_total : Optional[int] = 1024) -> str:
+	model_weight = numpy.random.default_rng(0).standard_normal((8, 3, 3, 3)).astype(numpy.float32)
+	model_graph = onnx.helper.make_graph(
+	[
+		onnx.helper.make_node('Conv', [ 'input', 'weight' ], [ 'convolution' ], pads = [ 1, 1, 1, 1 ]),
+		onnx.helper.make_node('Transpose', [ 'convolution' ], [ 'transpose' ], perm = [ 0, 2, 3, 1 ]),
+		onnx.helper.make_node('Reshape', [ 'transpose', 'shape' ], [ 'output' ])
+	], 'test',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ None, 3, 32, 32 ])
+	],
+	[
+		onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ anchor_total, 8 ])
+	],
+	[
+		onnx.numpy_helper.from_array(model_weight, 'weight'),
+		onnx.numpy_helper.from_array(numpy.array([ -1, 8 ], dtype = numpy.int64), 'shape')
+	])
+	onnx.save(onnx.helper.make_model(model_graph, ir_version = 9, opset_imports = [ onnx.helper.make_opsetid('', 17) ]), model_path)
+	return model_path
+
+
+def create_test_output_model(model_path : str, output_offset : float = 0.0) -> str:
+	model_graph = onnx.helper.make_graph(
+	[
+		onnx.helper.make_node('Identity', [ 'input' ], [ 'output_1' ]),
+		onnx.helper.make_node('Add', [ 'input', 'offset' ], [ 'output_2' ])
+	], 'test',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ 1, 3, 32, 32 ])
+	],
+	[
+		onnx.helper.make_tensor_value_info('output_1', onnx.TensorProto.FLOAT, [ 1, 3, 32, 32 ]),
+		onnx.helper.make_tensor_value_info('output_2', onnx.TensorProto.FLOAT, [ 1, 3, 32, 32 ])
+	],
+	[
+		onnx.numpy_helper.from_array(numpy.array(output_offset, dtype = numpy.float32), 'offset')
+	])
+	onnx.save(onnx.helper.make_model(model_graph, ir_version = 9, opset_imports = [ onnx.helper.make_opsetid('', 17) ]), model_path)
+	return model_path
+
+
+def create_test_model_hash(model_path : str) -> str:
+	with open(model_path, 'rb') as model_file:
+		model_hash = create_hash(model_file.read())
+
+	with open(os.path.splitext(model_path)[0] + '.hash', 'w') as hash_file:
+		hash_file.write(model_hash)
+	return get_hash_path(model_path)
@@ -1,5 +1,6 @@
 import subprocess
 import sys
+from time import perf_counter
 
 import pytest
 
@@ -87,6 +88,21 @@ def test_submit_all() -> None:
 	assert subprocess.run(commands).returncode == 1
 
 
+def test_job_startup_time() -> None:
+	commands_list =\
+	[
+		[ sys.executable, 'facefusion.py', 'job-create', 'test-job-startup-time', '--jobs-path', get_test_jobs_directory() ],
+		[ sys.executable, 'facefusion.py', 'job-list', 'drafted', '--jobs-path', get_test_jobs_directory() ],
+		[ sys.executable, 'facefusion.py', 'job-delete', 'test-job-startup-time', '--jobs-path', get_test_jobs_directory() ]
+	]
+
+	for commands in commands_list:
+		start_time = perf_counter()
+
+		assert subprocess.run(commands).returncode == 0
+		assert perf_counter() - start_time < 1.0
+
+
 def test_job_delete() -> None:
 	commands = [ sys.executable, 'facefusion.py', 'job-delete', 'test-job-delete', '--jobs-path', get_test_jobs_directory() ]
 
@@ -0,0 +1,28 @@
+import pytest
+
+from facefusion import state_manager
+from facefusion.core import PRE_CHECK_SET, create_pre_check_key, processors_pre_check
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	PRE_CHECK_SET.clear()
+	state_manager.init_item('processors', [ 'face_debugger' ])
+	state_manager.init_item('download_force_validation', False)
+
+
+def test_create_pre_check_key() -> None:
+	state_manager.init_item('face_swapper_model', 'hyperswap_1a_256')
+	state_manager.init_item('face_detector_model', 'yolo_face')
+
+	assert create_pre_check_key('processors', [ 'processors', 'face_swapper_model' ]) == 'processors:[\'face_debugger\'],hyperswap_1a_256'
+	assert create_pre_check_key('common', [ 'face_detector_model' ]) == 'common:yolo_face'
+
+
+def test_processors_pre_check() -> None:
+	assert processors_pre_check() is True
+	assert PRE_CHECK_SET.get('processors:[\'face_debugger\'],None') is True
+
+	PRE_CHECK_SET['processors:[\'face_debugger\'],None'] = False
+
+	assert processors_pre_check() is True
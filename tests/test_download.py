@@ -1,4 +1,104 @@
-from facefusion.download import get_static_download_size, ping_static_url, resolve_download_url_by_provider
+import os
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, List
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.download import conditional_download, get_static_download_size, ping_static_url, resolve_download_url_by_provider
+from facefusion.filesystem import create_directory
+from facefusion.hash_helper import create_hash, get_hash_manifest_entry
+from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
+
+RANGE_STARTS : List[int] = []
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+	def do_GET(self) -> None:
+		file_path = self.translate_path(self.path)
+		range_header = self.headers.get('Range')
+
+		if range_header and os.path.isfile(file_path):
+			range_start = int(range_header.split('=')[1].split('-')[0])
+			file_size = os.path.getsize(file_path)
+			RANGE_STARTS.append(range_start)
+
+			with open(file_path, 'rb') as file:
+				file.seek(range_start)
+				file_content = file.read()
+
+			self.send_response(206)
+			self.send_header('Content-Range', 'bytes ' + str(range_start) + '-' + str(file_size - 1) + '/' + str(file_size))
+			self.send_header('Content-Length', str(len(file_content)))
+			self.end_headers()
+			self.wfile.write(file_content)
+		else:
+			super().do_GET()
+
+	def log_message(self, *args : str) -> None:
+		pass
+
+
+@pytest.fixture(scope = 'module')
+def server_url() -> Iterator[str]:
+	create_directory(get_test_examples_directory())
+	file_content = numpy.random.default_rng(0).integers(0, 255, 3 * 1024 * 1024).astype(numpy.uint8).tobytes()
+
+	with open(get_test_example_file('test-download.bin'), 'wb') as file:
+		file.write(file_content)
+	with open(get_test_example_file('test-download.hash'), 'w') as file:
+		file.write(create_hash(file_content))
+
+	server = ThreadingHTTPServer(('127.0.0.1', 0), partial(RangeRequestHandler, directory = get_test_examples_directory()))
+	threading.Thread(target = server.serve_forever, daemon = True).start()
+	yield 'http://127.0.0.1:' + str(server.server_address[1])
+	server.shutdown()
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	prepare_test_output_directory()
+	RANGE_STARTS.clear()
+	state_manager.init_item('download_thread_count', 4)
+	state_manager.init_item('download_force_validation', False)
+	state_manager.init_item('log_level', 'error')
+
+
+def test_conditional_download(server_url : str) -> None:
+	conditional_download(os.path.dirname(get_test_output_file('test-download.bin')), [ server_url + '/test-download.hash', server_url + '/test-download.bin' ])
+
+	with open(get_test_example_file('test-download.bin'), 'rb') as source_file, open(get_test_output_file('test-download.bin'), 'rb') as output_file:
+		assert source_file.read() == output_file.read()
+	assert get_hash_manifest_entry(get_test_output_file('test-download.bin'))
+	assert RANGE_STARTS == []
+
+
+def test_conditional_download_resume(server_url : str) -> None:
+	with open(get_test_example_file('test-download.bin'), 'rb') as source_file:
+		source_content = source_file.read()
+
+	with open(get_test_output_file('test-download.bin'), 'wb') as output_file:
+		output_file.write(source_content[:1024 * 1024])
+
+	conditional_download(os.path.dirname(get_test_output_file('test-download.bin')), [ server_url + '/test-download.hash', server_url + '/test-download.bin' ])
+
+	with open(get_test_output_file('test-download.bin'), 'rb') as output_file:
+		assert output_file.read() == source_content
+	assert RANGE_STARTS == [ 1024 * 1024 ]
+
+
+def test_conditional_download_corrupt(server_url : str) -> None:
+	with open(get_test_output_file('test-download.bin'), 'wb') as output_file:
+		output_file.write(b'corrupt')
+	with open(get_test_output_file('test-download.hash'), 'w') as hash_file:
+		hash_file.write(create_hash(b'facefusion'))
+
+	conditional_download(os.path.dirname(get_test_output_file('test-download.bin')), [ server_url + '/test-download.bin' ])
+
+	assert not os.path.exists(get_test_output_file('test-download.bin'))
 
 
 def test_get_static_download_size() -> None:
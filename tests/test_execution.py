@@ -1,4 +1,8 @@
-from facefusion.execution import create_inference_session_providers, get_available_execution_providers, has_execution_provider
+from unittest.mock import patch
+
+from onnxruntime import GraphOptimizationLevel
+
+from facefusion.execution import create_inference_session_options, create_inference_session_providers, get_available_execution_providers, get_tune_options, has_execution_provider, resolve_session_thread_count
 
 
 def test_has_execution_provider() -> None:
@@ -22,3 +26,51 @@ def test_create_inference_session_providers() -> None:
 	]
 
 	assert create_inference_session_providers('1', [ 'cpu', 'cuda' ]) == inference_session_providers
+
+
+def test_resolve_session_thread_count() -> None:
+	with patch('facefusion.execution.detect_cpu_count', return_value = 64):
+		assert resolve_session_thread_count(16, 0) == 4
+		assert resolve_session_thread_count(1, 0) == 64
+		assert resolve_session_thread_count(16, 2) == 2
+
+	with patch('facefusion.execution.detect_cpu_count', return_value = 4):
+		assert resolve_session_thread_count(16, 0) == 1
+
+
+def test_create_inference_session_options() -> None:
+	with patch('facefusion.execution.detect_cpu_count', return_value = 64):
+		inference_session_options = create_inference_session_options(16, 0)
+
+	assert inference_session_options.intra_op_num_threads == 4
+	assert inference_session_options.inter_op_num_threads == 1
+	assert inference_session_options.get_session_config_entry('session.intra_op.allow_spinning') == '0'
+
+
+def test_create_inference_session_providers_with_tune_options() -> None:
+	tune_options =\
+	{
+		'cudnn_conv_algo_search': 'HEURISTIC',
+		'arena_extend_strategy': 'kSameAsRequested'
+	}
+	inference_session_providers =\
+	[
+		('CUDAExecutionProvider',
+		{
+			'device_id': '0',
+			'cudnn_conv_algo_search': 'HEURISTIC',
+			'arena_extend_strategy': 'kSameAsRequested'
+		})
+	]
+
+	assert create_inference_session_providers('0', [ 'cuda' ], tune_options) == inference_session_providers
+
+
+def test_get_tune_options() -> None:
+	with patch('facefusion.execution.read_static_tune_set', return_value = { 'model.cuda.cpu': { 'intra_op_num_threads': 2 } }):
+		assert get_tune_options('.assets/models/model.onnx', [ 'cuda', 'cpu' ]) == { 'intra_op_num_threads': 2 }
+		assert get_tune_options('.assets/models/model.onnx', [ 'cpu' ]) == {}
+
+	assert create_inference_session_options(1, 0, None, { 'intra_op_num_threads': 2, 'graph_optimization_level': 'basic' }).intra_op_num_threads == 2
+	assert create_inference_session_options(1, 0, 'optimized.onnx', { 'graph_optimization_level': 'basic' }).graph_optimization_level == GraphOptimizationLevel.ORT_ENABLE_BASIC
+	assert create_inference_session_options(1, 0, 'optimized.onnx').graph_optimization_level == GraphOptimizationLevel.ORT_ENABLE_EXTENDED
@@ -0,0 +1,27 @@
+import numpy
+
+from facefusion.face_helper import paste_back, paste_back_in_place
+
+
+def test_paste_back() -> None:
+	temp_vision_frame = numpy.zeros((64, 64, 3)).astype(numpy.uint8)
+	crop_vision_frame = numpy.full((16, 16, 3), 255).astype(numpy.uint8)
+	crop_mask = numpy.ones((16, 16)).astype(numpy.float32)
+	affine_matrix = numpy.array([ [ 1, 0, -8 ], [ 0, 1, -8 ] ]).astype(numpy.float64)
+	paste_vision_frame = paste_back(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+
+	assert numpy.all(paste_vision_frame[8:24, 8:24] == 255)
+	assert numpy.all(paste_vision_frame[24:, 24:] == 0)
+	assert numpy.all(temp_vision_frame == 0)
+
+
+def test_paste_back_in_place() -> None:
+	temp_vision_frame = numpy.zeros((64, 64, 3)).astype(numpy.uint8)
+	crop_vision_frame = numpy.full((16, 16, 3), 255).astype(numpy.uint8)
+	crop_mask = numpy.full((16, 16), 0.5).astype(numpy.float32)
+	affine_matrix = numpy.array([ [ 1, 0, -8 ], [ 0, 1, -8 ] ]).astype(numpy.float64)
+	paste_vision_frame = paste_back_in_place(temp_vision_frame, crop_vision_frame, crop_mask, affine_matrix)
+
+	assert paste_vision_frame is temp_vision_frame
+	assert numpy.all(temp_vision_frame[10:22, 10:22] == 127)
+	assert numpy.all(temp_vision_frame[24:, 24:] == 0)
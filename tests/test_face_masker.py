@@ -0,0 +1,70 @@
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+
+import numpy
+from onnxruntime import InferenceSession
+
+from facefusion import inference_manager
+from facefusion.face_masker import create_box_mask, forward_occlude_faces, merge_masks
+from facefusion.types import Mask, VisionFrame
+from .helper import create_test_model
+
+OCCLUDE_BARRIER : threading.Barrier = threading.Barrier(3, timeout = 5)
+
+
+def occlude_face_at_barrier(prepare_vision_frame : VisionFrame, model_name : str) -> Mask:
+	OCCLUDE_BARRIER.wait()
+	return prepare_vision_frame[0][0]
+
+
+def test_create_box_mask() -> None:
+	crop_vision_frame = numpy.zeros((128, 128, 3)).astype(numpy.uint8)
+	box_mask = create_box_mask(crop_vision_frame, 0.3, (0, 0, 0, 0))
+
+	assert box_mask.shape == (128, 128)
+	assert box_mask.dtype == numpy.float32
+	assert box_mask[64, 64] > 0.99
+	assert box_mask[0, 0] < 0.01
+	assert create_box_mask(crop_vision_frame, 0.3, (0, 0, 0, 0)) is box_mask
+	assert create_box_mask(crop_vision_frame, 0.3, (10, 0, 0, 0)) is not box_mask
+
+
+def test_merge_masks() -> None:
+	temp_masks =\
+	[
+		numpy.full((4, 4), 0.8).astype(numpy.float32),
+		numpy.full((4, 4), 1.5).astype(numpy.float32),
+		numpy.full((4, 4), 0.2).astype(numpy.float32)
+	]
+	crop_mask = merge_masks(temp_masks)
+
+	assert numpy.allclose(crop_mask, 0.2)
+	assert numpy.allclose(temp_masks[0], 0.8)
+	assert numpy.allclose(merge_masks(temp_masks[1:2]), 1.0)
+
+
+def test_forward_occlude_faces() -> None:
+	model_names = [ 'xseg_1', 'xseg_2', 'xseg_3' ]
+	inference_pool = { model_name: InferenceSession(create_test_model(os.path.join(tempfile.mkdtemp(), model_name + '.onnx')), providers = [ 'CPUExecutionProvider' ]) for model_name in model_names }
+	prepare_vision_frames = [ numpy.random.default_rng(0).random((1, 3, 32, 32)).astype(numpy.float32) for _ in model_names ]
+
+	with patch('facefusion.face_masker.get_inference_pool', return_value = inference_pool), patch('facefusion.inference_manager.run_inference', wraps = inference_manager.run_inference) as run_inference:
+		occlusion_masks = forward_occlude_faces(prepare_vision_frames, model_names)
+
+		assert run_inference.call_count == 3
+
+	for model_name, prepare_vision_frame, occlusion_mask in zip(model_names, prepare_vision_frames, occlusion_masks):
+		assert numpy.allclose(occlusion_mask, inference_pool.get(model_name).run(None, { 'input': prepare_vision_frame })[0][0])
+
+
+def test_forward_occlude_faces_concurrent() -> None:
+	model_names = [ 'xseg_1', 'xseg_2', 'xseg_3' ]
+	prepare_vision_frames = [ numpy.full((1, 3, 32, 32), index).astype(numpy.float32) for index in range(3) ]
+
+	with patch('facefusion.face_masker.forward_occlude_face', side_effect = occlude_face_at_barrier):
+		occlusion_masks = forward_occlude_faces(prepare_vision_frames, model_names)
+
+	for index, occlusion_mask in enumerate(occlusion_masks):
+		assert numpy.allclose(occlusion_mask, index)
@@ -0,0 +1,32 @@
+import numpy
+
+from facefusion import face_store
+from facefusion.face_store import clear_static_masks, get_static_mask, set_static_mask
+
+
+def test_get_static_mask() -> None:
+	clear_static_masks()
+	crop_vision_frame = numpy.zeros((8, 8, 3)).astype(numpy.uint8)
+	mask = numpy.ones((8, 8)).astype(numpy.float32)
+
+	assert get_static_mask(crop_vision_frame, 'xseg_1') is None
+
+	set_static_mask(crop_vision_frame, 'xseg_1', mask)
+
+	assert get_static_mask(crop_vision_frame, 'xseg_1') is mask
+	assert get_static_mask(crop_vision_frame, 'xseg_2') is None
+	assert get_static_mask(crop_vision_frame + 1, 'xseg_1') is None
+	assert mask.flags.writeable is False
+
+
+def test_set_static_mask() -> None:
+	clear_static_masks()
+	mask = numpy.ones((8, 8)).astype(numpy.float32)
+
+	for index in range(face_store.STATIC_MASK_LIMIT + 1):
+		crop_vision_frame = numpy.full((8, 8, 3), index).astype(numpy.uint8)
+		set_static_mask(crop_vision_frame, 'xseg_1', mask.copy())
+
+	assert len(face_store.get_face_store().get('static_masks')) == face_store.STATIC_MASK_LIMIT
+	assert get_static_mask(numpy.zeros((8, 8, 3)).astype(numpy.uint8), 'xseg_1') is None
+	assert get_static_mask(numpy.ones((8, 8, 3)).astype(numpy.uint8), 'xseg_1') is not None
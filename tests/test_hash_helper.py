@@ -0,0 +1,82 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from facefusion import hash_helper, state_manager
+from facefusion.filesystem import create_directory, resolve_relative_path
+from facefusion.hash_helper import create_hash, get_hash_manifest_entry, get_hash_manifest_path, read_hash_manifest, read_static_hash_manifest, validate_hash, write_hash_manifest
+from .helper import get_test_output_file, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	prepare_test_output_directory()
+	read_static_hash_manifest.cache_clear()
+	state_manager.init_item('download_force_validation', False)
+
+
+def create_test_file(file_path : str, content : bytes) -> str:
+	with open(file_path, 'wb') as test_file:
+		test_file.write(content)
+
+	with open(os.path.splitext(file_path)[0] + '.hash', 'w') as hash_file:
+		hash_file.write(create_hash(content))
+	return file_path
+
+
+def test_validate_hash() -> None:
+	file_path = create_test_file(get_test_output_file('test-validate-hash.bin'), b'facefusion')
+
+	assert validate_hash(file_path) is True
+	assert get_hash_manifest_entry(file_path)
+
+	with open(file_path, 'wb') as test_file:
+		test_file.write(b'corrupted')
+
+	assert validate_hash(file_path) is False
+
+
+def test_validate_hash_with_manifest() -> None:
+	file_path = create_test_file(get_test_output_file('test-validate-hash-with-manifest.bin'), b'facefusion')
+
+	assert validate_hash(file_path) is True
+
+	file_stat = os.stat(file_path)
+
+	with open(file_path, 'r+b') as test_file:
+		test_file.write(b'F')
+	os.utime(file_path, ns = (file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+	assert validate_hash(file_path) is True
+
+	state_manager.init_item('download_force_validation', True)
+
+	assert validate_hash(file_path) is False
+
+
+def test_update_hash_manifest() -> None:
+	file_path = create_test_file(get_test_output_file('test-update-hash-manifest.bin'), b'facefusion')
+
+	with patch('facefusion.hash_helper.read_hash_manifest', wraps = hash_helper.read_hash_manifest) as read_hash_manifest_mock:
+		assert validate_hash(file_path) is True
+		assert validate_hash(file_path) is True
+		assert read_hash_manifest_mock.call_count == 2
+
+	assert read_hash_manifest().get(os.path.abspath(file_path)) == get_hash_manifest_entry(file_path)
+	assert not any(file_name.startswith('tmp') for file_name in os.listdir(os.path.dirname(get_hash_manifest_path())))
+
+
+def test_write_hash_manifest() -> None:
+	create_directory(os.path.dirname(get_hash_manifest_path()))
+
+	assert get_hash_manifest_path() == resolve_relative_path('../.caches/hash_manifest.json')
+
+	with patch('facefusion.hash_helper.move_file', return_value = False):
+		assert write_hash_manifest({}) is False
+
+	with patch('facefusion.hash_helper.write_json', side_effect = OSError):
+		with pytest.raises(OSError):
+			write_hash_manifest({})
+
+	assert not any(file_name.startswith('tmp') for file_name in os.listdir(os.path.dirname(get_hash_manifest_path())))
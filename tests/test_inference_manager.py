@@ -1,10 +1,21 @@
-from unittest.mock import patch
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
+from typing import Any
+from unittest.mock import MagicMock, patch
 
+import numpy
 import pytest
-from onnxruntime import InferenceSession
+from onnxruntime import GraphOptimizationLevel, InferenceSession
 
 from facefusion import content_analyser, state_manager
-from facefusion.inference_manager import INFERENCE_POOL_SET, get_inference_pool
+from facefusion.common_helper import get_first
+from facefusion.filesystem import is_file
+from facefusion.inference_manager import INFERENCE_BINDING_SET, INFERENCE_LOAD_SET, INFERENCE_POOL_SET, INFERENCE_USAGE_SET, acquire_inference_binding, clear_inference_pool, collect_inference_pools, create_inference_session, dispatch_inference_context, evict_inference_pools, forward_inference_binding, get_inference_binding_pool, get_inference_pool, release_inference_binding, remove_inference_pool, resolve_execution_precision, run_inference
+from facefusion.model_helper import get_optimized_model_path
+from facefusion.types import InferenceBinding, InferencePool
+from .helper import create_test_anchor_model, create_test_model, create_test_model_hash
 
 
 @pytest.fixture(scope = 'module', autouse = True)
@@ -30,3 +41,279 @@ def test_get_inference_pool() -> None:
 		assert isinstance(INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1'), InferenceSession)
 
 	assert INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1') == INFERENCE_POOL_SET.get('ui').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1')
+
+
+def test_get_inference_pool_concurrent() -> None:
+	state_manager.init_item('execution_precision', 'fp32')
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'), patch('facefusion.inference_manager.create_inference_pool', side_effect = create_slow_inference_pool) as create_inference_pool:
+		with ThreadPoolExecutor(max_workers = 4) as executor:
+			inference_pools = list(executor.map(lambda _: get_inference_pool('facefusion.face_classifier', [ 'concurrent' ], {}), range(4)))
+
+		assert create_inference_pool.call_count == 1
+		assert all(inference_pool is get_first(inference_pools) for inference_pool in inference_pools)
+
+	remove_inference_pool('facefusion.face_classifier.concurrent.0.cpu')
+
+
+def create_slow_inference_pool(*_ : Any) -> InferencePool:
+	sleep(0.1)
+	return\
+	{
+		'concurrent': MagicMock()
+	}
+
+
+def test_create_inference_session() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'session.onnx'))
+	create_test_model_hash(model_path)
+	optimized_model_path = get_optimized_model_path(model_path, [ 'cpu' ], None)
+
+	assert isinstance(create_inference_session(model_path, '0', [ 'cpu' ]), InferenceSession)
+	assert is_file(optimized_model_path)
+	assert not any(file_name.startswith('tmp') for file_name in os.listdir(os.path.dirname(optimized_model_path)))
+
+	with patch('facefusion.inference_manager.InferenceSession', wraps = InferenceSession) as inference_session:
+		assert create_inference_session(model_path, '0', [ 'cpu' ])
+		assert inference_session.call_args.args[0] == optimized_model_path
+		assert inference_session.call_args.kwargs.get('sess_options').graph_optimization_level == GraphOptimizationLevel.ORT_DISABLE_ALL
+
+
+def test_create_inference_session_failed() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'session_failed.onnx'))
+	create_test_model_hash(model_path)
+	optimized_model_path = get_optimized_model_path(model_path, [ 'cpu' ], None)
+
+	with patch('facefusion.inference_manager.InferenceSession', side_effect = RuntimeError), patch('facefusion.inference_manager.fatal_exit') as fatal_exit:
+		create_inference_session(model_path, '0', [ 'cpu' ])
+
+		assert fatal_exit.call_count == 1
+
+	assert not is_file(optimized_model_path)
+	assert not any(file_name.startswith('tmp') for file_name in os.listdir(os.path.dirname(optimized_model_path)))
+
+
+def test_run_inference() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'inference.onnx'))
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	model_inputs =\
+	{
+		'input': numpy.random.default_rng(0).random((1, 3, 32, 32)).astype(numpy.float32)
+	}
+
+	assert numpy.allclose(run_inference(inference_session, model_inputs)[0], inference_session.run(None, model_inputs)[0])
+
+
+def test_resolve_execution_precision() -> None:
+	state_manager.init_item('execution_precision', 'int8')
+
+	assert resolve_execution_precision('facefusion.content_analyser') == 'fp32'
+	assert resolve_execution_precision('facefusion.face_detector') == 'int8'
+
+	state_manager.init_item('execution_precision', 'fp32')
+
+
+def test_dispatch_inference_context() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'dispatch.onnx'))
+	inference_contexts = [ 'test.dispatch.0.cpu', 'test.dispatch.0.cpu.1' ]
+
+	for inference_context in inference_contexts:
+		INFERENCE_POOL_SET['cli'][inference_context] =\
+		{
+			'dispatch': InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+		}
+
+	state_manager.init_item('execution_dispatch_mode', 'round_robin')
+
+	assert dispatch_inference_context('test.dispatch', 'cli', inference_contexts) == 'test.dispatch.0.cpu'
+	assert dispatch_inference_context('test.dispatch', 'cli', inference_contexts) == 'test.dispatch.0.cpu.1'
+	assert dispatch_inference_context('test.dispatch', 'cli', inference_contexts) == 'test.dispatch.0.cpu'
+
+	state_manager.init_item('execution_dispatch_mode', 'least_busy')
+	INFERENCE_LOAD_SET[id(INFERENCE_POOL_SET.get('cli').get('test.dispatch.0.cpu.1').get('dispatch'))] = 1
+
+	assert dispatch_inference_context('test.dispatch', 'cli', inference_contexts) == 'test.dispatch.0.cpu'
+	assert dispatch_inference_context('test.dispatch', 'cli', inference_contexts) == 'test.dispatch.0.cpu'
+
+	INFERENCE_LOAD_SET.clear()
+
+	for inference_context in inference_contexts:
+		del INFERENCE_POOL_SET['cli'][inference_context]
+
+
+def test_collect_inference_pools() -> None:
+	inference_contexts = [ 'test.collect.0.cpu', 'test.collect.0.cpu.1', 'test.collect.1.cpu', 'test.collector.0.cpu' ]
+
+	for inference_context in inference_contexts:
+		INFERENCE_POOL_SET['cli'][inference_context] = {}
+
+	assert len(collect_inference_pools('test.collect')) == 3
+	assert len(collect_inference_pools('test.collector')) == 1
+
+	for inference_context in inference_contexts:
+		del INFERENCE_POOL_SET['cli'][inference_context]
+
+
+def test_run_inference_batch() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'batch.onnx'), None)
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	random_generator = numpy.random.default_rng(0)
+	inference_inputs_list =\
+	[
+		{
+			'input': random_generator.random((1, 3, 32, 32)).astype(numpy.float32)
+		},
+		{
+			'input': random_generator.random((1, 3, 32, 32)).astype(numpy.float32)
+		}
+	]
+	state_manager.init_item('execution_batch_size', 2)
+	state_manager.init_item('execution_batch_timeout', 20)
+
+	with patch.object(inference_session, 'run', wraps = inference_session.run) as inference_run:
+		with ThreadPoolExecutor(max_workers = 2) as executor:
+			inference_outputs_list = list(executor.map(lambda inference_inputs: run_inference(inference_session, inference_inputs), inference_inputs_list))
+
+		assert inference_run.call_count == 1
+		assert inference_run.call_args[0][1].get('input').shape == (2, 3, 32, 32)
+
+	for inference_inputs, inference_outputs in zip(inference_inputs_list, inference_outputs_list):
+		assert numpy.allclose(inference_outputs[0], inference_session.run(None, inference_inputs)[0], atol = 1e-5)
+
+	state_manager.init_item('execution_batch_size', 1)
+
+
+@pytest.mark.parametrize('anchor_total, run_count', [ (1024, 2), (None, 3) ])
+def test_run_inference_batch_without_batch_output(anchor_total : int, run_count : int) -> None:
+	model_path = create_test_anchor_model(os.path.join(tempfile.mkdtemp(), 'anchor.onnx'), anchor_total)
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	random_generator = numpy.random.default_rng(0)
+	inference_inputs_list =\
+	[
+		{
+			'input': random_generator.random((1, 3, 32, 32)).astype(numpy.float32)
+		},
+		{
+			'input': random_generator.random((1, 3, 32, 32)).astype(numpy.float32)
+		}
+	]
+	state_manager.init_item('execution_batch_size', 2)
+	state_manager.init_item('execution_batch_timeout', 20)
+
+	with patch.object(inference_session, 'run', wraps = inference_session.run) as inference_run:
+		with ThreadPoolExecutor(max_workers = 2) as executor:
+			inference_outputs_list = list(executor.map(lambda inference_inputs: run_inference(inference_session, inference_inputs), inference_inputs_list))
+
+		assert inference_run.call_count == run_count
+
+	for inference_inputs, inference_outputs in zip(inference_inputs_list, inference_outputs_list):
+		assert inference_outputs[0].shape == (1024, 8)
+		assert numpy.allclose(inference_outputs[0], inference_session.run(None, inference_inputs)[0], atol = 1e-5)
+
+	state_manager.init_item('execution_batch_size', 1)
+
+
+def test_acquire_inference_binding() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'binding.onnx'))
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	state_manager.init_item('execution_thread_count', 2)
+	inference_binding_pool = get_inference_binding_pool(inference_session)
+	first_inference_binding = acquire_inference_binding(inference_session, inference_binding_pool)
+	second_inference_binding = acquire_inference_binding(inference_session, inference_binding_pool)
+
+	assert inference_binding_pool.get('binding_total') == 2
+
+	release_inference_binding(inference_binding_pool, first_inference_binding)
+
+	assert acquire_inference_binding(inference_session, inference_binding_pool) is first_inference_binding
+
+	with ThreadPoolExecutor(max_workers = 1) as executor:
+		future = executor.submit(acquire_inference_binding, inference_session, inference_binding_pool)
+		sleep(0.1)
+
+		assert not future.done()
+
+		release_inference_binding(inference_binding_pool, second_inference_binding)
+
+		assert future.result(timeout = 1) is second_inference_binding
+
+	assert inference_binding_pool.get('binding_total') == 2
+	assert get_inference_binding_pool(inference_session) is inference_binding_pool
+
+	INFERENCE_BINDING_SET.clear()
+
+
+def test_forward_inference_binding() -> None:
+	inference_inputs = { 'input': numpy.zeros((1, 3, 32, 32)).astype(numpy.float32) }
+
+	for batch_size, output_total in [ (1, 1), (None, 0) ]:
+		model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'binding.onnx'), batch_size)
+		inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+		inference_binding : InferenceBinding =\
+		{
+			'io_binding': MagicMock(),
+			'device_id': 0,
+			'input_values': {},
+			'output_values': {}
+		}
+
+		with patch('facefusion.inference_manager.get_device_input_value'), patch.object(inference_session, 'run_with_iobinding'):
+			forward_inference_binding(inference_session, inference_binding, inference_inputs)
+			forward_inference_binding(inference_session, inference_binding, inference_inputs)
+
+		assert len(inference_binding.get('output_values')) == output_total
+		assert inference_binding.get('io_binding').bind_ortvalue_output.call_count == output_total
+		assert inference_binding.get('io_binding').bind_output.call_count == 2 - output_total
+
+
+def test_evict_inference_pools() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'evict.onnx'))
+	inference_contexts = [ 'test.evict_1.0.cpu', 'test.evict_2.0.cpu', 'test.evict_3.0.cuda' ]
+
+	for access_time, inference_context in enumerate(inference_contexts):
+		INFERENCE_POOL_SET['cli'][inference_context] =\
+		{
+			'evict': InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+		}
+		INFERENCE_USAGE_SET[inference_context] =\
+		{
+			'memory': 'video' if inference_context.endswith('cuda') else 'system',
+			'size': 1024 ** 3,
+			'access_time': access_time
+		}
+
+	state_manager.init_item('system_memory_budget', 2048)
+	evict_inference_pools('system', 1024 ** 3, [])
+
+	assert 'test.evict_1.0.cpu' not in INFERENCE_POOL_SET.get('cli')
+	assert 'test.evict_1.0.cpu' not in INFERENCE_USAGE_SET
+	assert 'test.evict_2.0.cpu' in INFERENCE_POOL_SET.get('cli')
+	assert 'test.evict_3.0.cuda' in INFERENCE_POOL_SET.get('cli')
+
+	evict_inference_pools('system', 2 * 1024 ** 3, [ 'test.evict_2.0.cpu' ])
+
+	assert 'test.evict_2.0.cpu' in INFERENCE_POOL_SET.get('cli')
+
+	state_manager.init_item('system_memory_budget', 0)
+
+	for inference_context in inference_contexts[1:]:
+		del INFERENCE_POOL_SET['cli'][inference_context]
+		del INFERENCE_USAGE_SET[inference_context]
+
+
+def test_clear_inference_pool_with_memory_budget() -> None:
+	INFERENCE_POOL_SET['cli']['facefusion.face_classifier.budget.0.cpu'] =\
+	{
+		'budget': MagicMock()
+	}
+
+	with patch('facefusion.inference_manager.detect_app_context', return_value = 'cli'):
+		state_manager.init_item('system_memory_budget', 1024)
+		clear_inference_pool('facefusion.face_classifier', [ 'budget' ])
+
+		assert 'facefusion.face_classifier.budget.0.cpu' in INFERENCE_POOL_SET.get('cli')
+
+		state_manager.init_item('system_memory_budget', 0)
+		clear_inference_pool('facefusion.face_classifier', [ 'budget' ])
+
+		assert 'facefusion.face_classifier.budget.0.cpu' not in INFERENCE_POOL_SET.get('cli')
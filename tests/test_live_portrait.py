@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+import numpy
+import scipy
+
+from facefusion.processors.live_portrait import create_rotation, extract_motions
+
+
+def test_create_rotation() -> None:
+	for pitch, yaw, roll in [ (0, 0, 0), (15, -30, 5), (-20, 60, -15), (30, 45, 90) ]:
+		rotation = scipy.spatial.transform.Rotation.from_euler('xyz', [ pitch, yaw, roll ], degrees = True).as_matrix()
+
+		assert create_rotation(pitch, yaw, roll).dtype == numpy.float32
+		assert numpy.allclose(create_rotation(pitch, yaw, roll), rotation, atol = 1e-6)
+
+
+def test_extract_motions() -> None:
+	target_crop_vision_frame = numpy.zeros((1, 3, 256, 256), dtype = numpy.float32)
+	temp_crop_vision_frame = numpy.ones((1, 3, 256, 256), dtype = numpy.float32)
+
+	with patch('facefusion.processors.live_portrait.forward_extract_motions', side_effect = lambda inference_pool, crop_vision_frames: [ tuple(numpy.full((1, 3), index, dtype = numpy.float32) for _ in range(7)) for index in range(len(crop_vision_frames)) ]) as forward_extract_motions:
+		motions = extract_motions({}, [ target_crop_vision_frame, temp_crop_vision_frame, target_crop_vision_frame ])
+
+		assert forward_extract_motions.call_count == 1
+		assert len(forward_extract_motions.call_args.args[1]) == 2
+		assert numpy.array_equal(motions[0][5], motions[2][5])
+		assert numpy.array_equal(motions[1][5], numpy.ones((1, 3)))
+
+		motions[0][5].fill(9)
+
+		assert numpy.array_equal(motions[2][5], numpy.zeros((1, 3)))
@@ -0,0 +1,100 @@
+import os
+import tempfile
+from unittest.mock import patch
+
+import numpy
+import onnx
+from onnxruntime import InferenceSession
+
+from facefusion import content_analyser, state_manager
+from facefusion.filesystem import resolve_relative_path
+from facefusion.model_helper import collect_model_modules, get_model_hash, get_model_initializer_path, get_optimized_model_path, get_static_model_initializer, resolve_model_shape, resolve_shared_model_path, write_model_initializer
+from .helper import create_test_model, create_test_model_hash
+
+
+def test_get_static_model_initializer() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'initializer.onnx'))
+	initializer = onnx.numpy_helper.to_array(onnx.load(model_path).graph.initializer[-1])
+
+	assert get_model_initializer_path(model_path) is None
+	assert numpy.array_equal(get_static_model_initializer(model_path), initializer)
+
+	create_test_model_hash(model_path)
+	get_static_model_initializer.cache_clear()
+	initializer_path = get_model_initializer_path(model_path)
+
+	assert initializer_path == os.path.join(os.path.dirname(model_path), 'initializer.' + get_model_hash(model_path) + '.npy')
+	assert numpy.array_equal(get_static_model_initializer(model_path), initializer)
+	assert os.path.isfile(initializer_path)
+
+	get_static_model_initializer.cache_clear()
+	model_initializer = get_static_model_initializer(model_path)
+
+	assert isinstance(model_initializer, numpy.memmap)
+	assert numpy.array_equal(model_initializer, initializer)
+
+
+def test_write_model_initializer() -> None:
+	initializer_path = os.path.join(tempfile.mkdtemp(), 'initializer.npy')
+	model_initializer = numpy.arange(8).astype(numpy.float32)
+
+	assert write_model_initializer(initializer_path, model_initializer) is True
+	assert numpy.array_equal(numpy.load(initializer_path), model_initializer)
+
+	with patch('facefusion.model_helper.move_file', side_effect = OSError):
+		assert write_model_initializer(initializer_path, model_initializer) is False
+
+	assert os.listdir(os.path.dirname(initializer_path)) == [ 'initializer.npy' ]
+
+
+def test_get_optimized_model_path() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'optimized.onnx'))
+
+	assert get_optimized_model_path(model_path, [ 'cpu' ], None) is None
+
+	create_test_model_hash(model_path)
+
+	assert get_optimized_model_path(model_path, [ 'cpu' ], None).startswith(resolve_relative_path('../.caches/optimized.'))
+	assert get_optimized_model_path(model_path, [ 'cpu' ], None) != get_optimized_model_path(model_path, [ 'cuda', 'cpu' ], None)
+	assert get_optimized_model_path(model_path, [ 'cpu' ], None) == get_optimized_model_path(model_path, [ 'cpu' ], 'extended')
+	assert get_optimized_model_path(model_path, [ 'cpu' ], None) != get_optimized_model_path(model_path, [ 'cpu' ], 'basic')
+	assert get_optimized_model_path(model_path, [ 'tensorrt', 'cpu' ], None) is None
+
+
+def test_resolve_shared_model_path() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'shared.onnx'))
+
+	assert resolve_shared_model_path(model_path) is None
+
+	create_test_model_hash(model_path)
+	shared_model_path = resolve_shared_model_path(model_path)
+	model_inputs =\
+	{
+		'input': numpy.random.default_rng(0).random((1, 3, 32, 32)).astype(numpy.float32)
+	}
+
+	assert shared_model_path == os.path.join(os.path.dirname(model_path), 'shared.' + get_model_hash(model_path) + '.shared.onnx')
+	assert numpy.allclose(InferenceSession(shared_model_path, providers = [ 'CPUExecutionProvider' ]).run(None, model_inputs)[0], InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ]).run(None, model_inputs)[0])
+	assert resolve_shared_model_path(model_path) == shared_model_path
+
+
+def test_resolve_model_shape() -> None:
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'resolve_model_shape.onnx'), None, None)
+	model_input = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ]).get_inputs()[0]
+
+	assert resolve_model_shape(model_input) == [ 1, 3, 256, 256 ]
+	assert resolve_model_shape(model_input, (640, 480)) == [ 1, 3, 480, 640 ]
+
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'resolve_model_shape.onnx'))
+	model_input = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ]).get_inputs()[0]
+
+	assert resolve_model_shape(model_input, (640, 480)) == [ 1, 3, 32, 32 ]
+
+
+def test_collect_model_modules() -> None:
+	state_manager.init_item('processors', [ 'face_debugger' ])
+	model_modules = collect_model_modules()
+
+	assert len(model_modules) == 8
+	assert model_modules[0] is content_analyser
+	assert model_modules[-1].__name__ == 'facefusion.processors.modules.face_debugger'
@@ -1,4 +1,17 @@
-from facefusion.process_manager import end, is_pending, is_processing, is_stopping, set_process_state, start, stop
+from facefusion.process_manager import check, end, is_checking, is_pending, is_processing, is_stopping, set_process_state, start, stop
+
+
+def test_check() -> None:
+	set_process_state('pending')
+	check()
+	check()
+	end()
+
+	assert is_checking()
+
+	end()
+
+	assert is_pending()
 
 
 def test_start() -> None:
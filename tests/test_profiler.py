@@ -0,0 +1,39 @@
+import os
+import tempfile
+
+import numpy
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.execution import create_inference_session_options
+from facefusion.filesystem import is_file
+from facefusion.json import read_json
+from facefusion.profiler import create_profile_file_prefix, record_process_time, register_inference_session, write_report
+from .helper import create_test_model
+
+
+def test_write_report() -> None:
+	execution_profile_path = tempfile.mkdtemp()
+	state_manager.init_item('execution_profile_path', execution_profile_path)
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'profile.onnx'))
+	inference_session_options = create_inference_session_options(1, 1, None, None, create_profile_file_prefix(model_path))
+	inference_session = InferenceSession(model_path, sess_options = inference_session_options, providers = [ 'CPUExecutionProvider' ])
+	register_inference_session(model_path, inference_session)
+
+	for _ in range(2):
+		inference_session.run(None,
+		{
+			'input': numpy.zeros((1, 3, 32, 32)).astype(numpy.float32)
+		})
+	record_process_time('facefusion.processors.modules.face_swapper', 0.01)
+
+	assert write_report() is True
+	assert is_file(os.path.join(execution_profile_path, 'report.csv'))
+
+	report = read_json(os.path.join(execution_profile_path, 'report.json'))
+
+	assert report.get('models').get('profile').get('calls') == 2
+	assert 'Conv' in report.get('operators')
+	assert report.get('processors').get('facefusion.processors.modules.face_swapper').get('total') == 10
+
+	state_manager.init_item('execution_profile_path', None)
@@ -0,0 +1,7 @@
+from facefusion.program import create_program
+
+
+def test_create_program() -> None:
+	assert vars(create_program('job-list').parse_args([ 'job-list', 'queued' ])).get('job_status') == 'queued'
+	assert 'job_status' not in vars(create_program(None).parse_args([ 'job-list' ]))
+	assert 'job_status' not in vars(create_program('job-create').parse_args([ 'job-list' ]))
@@ -0,0 +1,103 @@
+import os
+import tempfile
+from typing import List
+from unittest.mock import patch
+
+import numpy
+import pytest
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.filesystem import is_file, remove_file
+from facefusion.hash_helper import get_hash_path
+from facefusion.inference_manager import capture_inference, release_inference_capture, run_inference
+from facefusion.model_helper import get_precision_model_path, resolve_precision_model_path
+from facefusion.quantizer import calculate_score, collect_vision_frames, is_score_accepted, quantize_model, validate_model
+from facefusion.types import InferenceInputs
+from facefusion.vision import write_image
+from .helper import create_test_model, create_test_output_model
+
+
+@pytest.fixture(scope = 'module')
+def model_path() -> str:
+	return create_test_model(os.path.join(tempfile.mkdtemp(), 'quantize.onnx'))
+
+
+@pytest.fixture(scope = 'module')
+def model_inputs_list(model_path : str) -> List[InferenceInputs]:
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	random_generator = numpy.random.default_rng(0)
+	capture_inference(inference_session)
+
+	for _ in range(4):
+		run_inference(inference_session,
+		{
+			'input': random_generator.random((1, 3, 32, 32)).astype(numpy.float32)
+		})
+
+	return release_inference_capture(inference_session)
+
+
+def test_quantize_model(model_path : str, model_inputs_list : List[InferenceInputs]) -> None:
+	assert resolve_precision_model_path(model_path, 'fp16') == model_path
+	assert quantize_model(model_path, 'fp16', 'psnr', model_inputs_list)
+	assert resolve_precision_model_path(model_path, 'fp16') == get_precision_model_path(model_path, 'fp16')
+	assert quantize_model(model_path, 'int8', 'cosine', model_inputs_list)
+	assert quantize_model(model_path, 'int8', 'cosine', model_inputs_list, True)
+	assert resolve_precision_model_path(model_path, 'int8') == get_precision_model_path(model_path, 'int8')
+	assert resolve_precision_model_path(model_path, 'fp32') == model_path
+
+
+def test_resolve_precision_model_path(model_path : str, model_inputs_list : List[InferenceInputs]) -> None:
+	assert quantize_model(model_path, 'fp16', 'psnr', model_inputs_list)
+	assert resolve_precision_model_path(model_path, 'fp16') == get_precision_model_path(model_path, 'fp16')
+
+	with open(get_precision_model_path(model_path, 'fp16'), 'ab') as precision_model_file:
+		precision_model_file.write(b'tampered')
+
+	assert resolve_precision_model_path(model_path, 'fp16') == model_path
+
+	remove_file(get_hash_path(get_precision_model_path(model_path, 'fp16')))
+
+	assert resolve_precision_model_path(model_path, 'fp16') == model_path
+
+
+def test_quantize_model_rejected(model_path : str, model_inputs_list : List[InferenceInputs]) -> None:
+	with patch('facefusion.quantizer.is_score_accepted', return_value = False):
+		assert quantize_model(model_path, 'fp16', 'psnr', model_inputs_list) is False
+
+	assert is_file(get_precision_model_path(model_path, 'fp16')) is False
+
+
+def test_validate_model(model_inputs_list : List[InferenceInputs]) -> None:
+	model_directory_path = tempfile.mkdtemp()
+	model_path = create_test_output_model(os.path.join(model_directory_path, 'validate.onnx'))
+	precision_model_path = create_test_output_model(os.path.join(model_directory_path, 'validate.fp16.onnx'), 0.5)
+
+	assert validate_model(model_path, model_path, 'psnr', model_inputs_list) == float('inf')
+	assert is_score_accepted('psnr', validate_model(model_path, precision_model_path, 'psnr', model_inputs_list)) is False
+	assert is_score_accepted('error', validate_model(model_path, precision_model_path, 'error', model_inputs_list)) is False
+
+
+def test_collect_vision_frames() -> None:
+	target_path = os.path.join(tempfile.mkdtemp(), 'target.jpg')
+	write_image(target_path, numpy.zeros((64, 64, 3), dtype = numpy.uint8))
+	state_manager.init_item('target_path', None)
+
+	assert collect_vision_frames(None) == []
+
+	state_manager.init_item('target_path', target_path)
+
+	assert len(collect_vision_frames(None)) == 1
+	assert collect_vision_frames(os.path.dirname(target_path))[0].shape == (64, 64, 3)
+
+
+def test_calculate_score() -> None:
+	model_output = numpy.linspace(0, 1, 64).reshape(1, 1, 8, 8)
+
+	assert calculate_score('cosine', model_output, model_output) > 0.99
+	assert calculate_score('error', model_output, model_output) == 0
+	assert calculate_score('iou', model_output, model_output) == 1.0
+	assert calculate_score('psnr', model_output, model_output + 0.1) == pytest.approx(20.0)
+	assert is_score_accepted('psnr', 40.0)
+	assert not is_score_accepted('error', 0.5)
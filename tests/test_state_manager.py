@@ -1,9 +1,12 @@
-from typing import Union
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Union
 
 import pytest
 
+from facefusion.app_context import run_in_app_context
 from facefusion.processors.types import ProcessorState
-from facefusion.state_manager import STATE_SET, get_item, init_item, set_item
+from facefusion.state_manager import STATE_SET, bind_state_snapshot, get_item, init_item, set_item
 from facefusion.types import AppContext, State
 
 
@@ -33,3 +36,24 @@ def test_get_item_and_set_item() -> None:
 
 	assert get_item('video_memory_strategy') == 'tolerant'
 	assert get_state('ui').get('video_memory_strategy') is None
+
+
+def test_get_item_in_app_context() -> None:
+	set_item('video_memory_strategy', 'tolerant')
+	run_in_app_context('ui', partial(set_item, 'video_memory_strategy', 'strict'))
+
+	assert get_item('video_memory_strategy') == 'tolerant'
+	assert run_in_app_context('ui', partial(get_item, 'video_memory_strategy')) == 'strict'
+
+
+def get_snapshot_item() -> Any:
+	bind_state_snapshot()
+	get_state('cli')['video_memory_strategy'] = 'strict' #type:ignore[typeddict-item]
+	return get_item('video_memory_strategy')
+
+
+def test_bind_state_snapshot() -> None:
+	set_item('video_memory_strategy', 'tolerant')
+
+	assert copy_context().run(get_snapshot_item) == 'tolerant'
+	assert get_item('video_memory_strategy') == 'strict'
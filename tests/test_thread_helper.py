@@ -0,0 +1,35 @@
+from functools import partial
+
+from facefusion import state_manager
+from facefusion.app_context import detect_app_context, run_in_app_context
+from facefusion.thread_helper import inference_semaphore, run_parallel
+
+
+def test_run_parallel() -> None:
+	assert run_parallel([ partial(pow, 2, exponent) for exponent in range(8) ]) == [ 1, 2, 4, 8, 16, 32, 64, 128 ]
+	assert run_parallel([]) == []
+	assert run_parallel([ partial(pow, 3, exponent) for exponent in range(4) ], 4) == [ 1, 3, 9, 27 ]
+
+
+def test_run_in_app_context() -> None:
+	assert run_parallel([ partial(run_in_app_context, 'ui', detect_app_context) ]) == [ 'ui' ]
+	assert run_parallel([ detect_app_context ]) == [ 'cli' ]
+
+
+def test_inference_semaphore() -> None:
+	state_manager.init_item('execution_session_replica_count', 2)
+	state_manager.init_item('execution_batch_size', 2)
+
+	assert inference_semaphore('facefusion.face_detector') is inference_semaphore('facefusion.face_detector')
+	assert inference_semaphore('facefusion.face_detector') is not inference_semaphore('facefusion.voice_extractor')
+
+	for _ in range(4):
+		assert inference_semaphore('facefusion.face_detector').acquire(blocking = False) is True
+	assert inference_semaphore('facefusion.face_detector').acquire(blocking = False) is False
+	assert inference_semaphore('facefusion.voice_extractor').acquire(blocking = False) is True
+
+	state_manager.init_item('execution_batch_size', 1)
+
+	assert inference_semaphore('facefusion.face_detector').acquire(blocking = False) is True
+
+	state_manager.init_item('execution_session_replica_count', 1)
@@ -0,0 +1,78 @@
+import os
+import subprocess
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from facefusion.download import conditional_download
+from facefusion.filesystem import create_directory, is_directory, is_file
+from facefusion.json import read_json
+from facefusion.thumbnail_manager import THUMBNAIL_INDEX_SET, THUMBNAIL_LIMIT, clear_thumbnail_index, create_thumbnails, evict_thumbnails, find_thumbnail_position, get_thumbnail_directory, get_thumbnail_index, get_thumbnail_index_path, prepare_thumbnails, read_thumbnail_frame
+from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, get_test_outputs_directory, prepare_test_output_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	conditional_download(get_test_examples_directory(),
+	[
+		'https://github.com/facefusion/facefusion-assets/releases/download/examples-3.0.0/target-240p.mp4'
+	])
+	subprocess.run([ 'ffmpeg', '-i', get_test_example_file('target-240p.mp4'), '-vf', 'fps=25', get_test_example_file('target-240p-25fps.mp4') ])
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> Iterator[None]:
+	prepare_test_output_directory()
+	clear_thumbnail_index()
+
+	with patch('facefusion.thumbnail_manager.get_thumbnails_directory', return_value = get_test_output_file('thumbnails')):
+		yield
+
+
+def test_create_thumbnails() -> None:
+	assert create_thumbnails(get_test_example_file('target-240p-25fps.mp4')) is True
+	assert get_thumbnail_directory(get_test_example_file('target-240p-25fps.mp4')).startswith(get_test_outputs_directory())
+	assert get_thumbnail_index(get_test_example_file('target-240p-25fps.mp4')) == list(range(0, 270, 25))
+	assert read_json(get_thumbnail_index_path(get_test_example_file('target-240p-25fps.mp4'))) == list(range(0, 270, 25))
+
+
+def test_create_thumbnails_failed() -> None:
+	with open(get_test_output_file('invalid.mp4'), 'wb') as invalid_file:
+		invalid_file.write(b'invalid')
+
+	assert create_thumbnails(get_test_output_file('invalid.mp4')) is False
+	assert get_thumbnail_directory(get_test_output_file('invalid.mp4')) not in THUMBNAIL_INDEX_SET
+	assert is_directory(get_thumbnail_directory(get_test_output_file('invalid.mp4'))) is False
+
+
+def test_evict_thumbnails() -> None:
+	thumbnail_directories = [ get_test_output_file(os.path.join('thumbnails', str(index))) for index in range(THUMBNAIL_LIMIT + 2) ]
+
+	for access_time, thumbnail_directory in enumerate(thumbnail_directories):
+		create_directory(thumbnail_directory)
+		os.utime(thumbnail_directory, (access_time, access_time))
+		THUMBNAIL_INDEX_SET[thumbnail_directory] = [ 0 ]
+
+	evict_thumbnails()
+
+	assert [ is_directory(thumbnail_directory) for thumbnail_directory in thumbnail_directories ] == [ False, False ] + [ True ] * THUMBNAIL_LIMIT
+	assert list(THUMBNAIL_INDEX_SET.keys()) == thumbnail_directories[2:]
+
+
+def test_find_thumbnail_position() -> None:
+	assert find_thumbnail_position([ 0, 25, 50 ], 0) == 0
+	assert find_thumbnail_position([ 0, 25, 50 ], 12) == 0
+	assert find_thumbnail_position([ 0, 25, 50 ], 13) == 25
+	assert find_thumbnail_position([ 0, 25, 50 ], 100) == 50
+	assert find_thumbnail_position([], 10) is None
+
+
+def test_read_thumbnail_frame() -> None:
+	create_thumbnails(get_test_example_file('target-240p-25fps.mp4'))
+	clear_thumbnail_index()
+
+	assert prepare_thumbnails(get_test_example_file('target-240p-25fps.mp4')) is True
+	assert is_file(get_thumbnail_index_path(get_test_example_file('target-240p-25fps.mp4')))
+	assert read_thumbnail_frame(get_test_example_file('target-240p-25fps.mp4'), 100).shape == (226, 426, 3)
+	assert read_thumbnail_frame('invalid') is None
@@ -0,0 +1,46 @@
+import os
+import tempfile
+from typing import List, Optional
+from unittest.mock import patch
+
+from facefusion import model_helper, state_manager
+from facefusion.tuner import create_tune_candidates, tune_model
+from facefusion.types import ExecutionProvider, Resolution, TuneOptions
+from .helper import create_test_model
+
+
+def measure_model_failing(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider], tune_options : TuneOptions, model_resolution : Optional[Resolution] = None) -> float:
+	if tune_options.get('graph_optimization_level') == 'all':
+		raise RuntimeError
+	return 1 / (len(tune_options) + 1)
+
+
+def test_tune_model() -> None:
+	state_manager.init_item('execution_thread_count', 1)
+	state_manager.init_item('tune_cycle_count', 1)
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'tune.onnx'))
+	tune_candidates = create_tune_candidates([ 'cpu' ])
+	tune_options = tune_model(model_path, '0', [ 'cpu' ])
+
+	assert 'cudnn_conv_algo_search' not in tune_candidates
+	assert 'cudnn_conv_algo_search' in create_tune_candidates([ 'cuda', 'cpu' ])
+	for tune_name, tune_value in tune_options.items():
+		assert tune_value in tune_candidates.get(tune_name)
+
+
+def test_tune_model_with_resolution() -> None:
+	state_manager.init_item('execution_thread_count', 1)
+	state_manager.init_item('tune_cycle_count', 1)
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'tune.onnx'), 1, None)
+
+	with patch('facefusion.tuner.create_model_inputs', wraps = model_helper.create_model_inputs) as create_model_inputs:
+		tune_model(model_path, '0', [ 'cpu' ], (64, 64))
+
+		assert all(call_args.args[2] == (64, 64) for call_args in create_model_inputs.call_args_list)
+
+
+def test_tune_model_with_failed_candidate() -> None:
+	with patch('facefusion.tuner.measure_model', side_effect = measure_model_failing):
+		tune_options = tune_model('tune.onnx', '0', [ 'cpu' ])
+
+	assert tune_options.get('graph_optimization_level') == 'extended'
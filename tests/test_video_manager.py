@@ -0,0 +1,72 @@
+import os
+import tempfile
+import threading
+from unittest.mock import patch
+
+import cv2
+import numpy
+import pytest
+
+from facefusion.video_manager import VIDEO_POOL_SET, clear_video_pool, get_video_capture, get_video_capture_key
+
+
+@pytest.fixture(scope = 'module')
+def video_path() -> str:
+	video_path = os.path.join(tempfile.mkdtemp(), 'target.avi')
+	video_writer = cv2.VideoWriter(video_path, cv2.VideoWriter.fourcc(*'MJPG'), 25, (64, 64))
+
+	for frame_number in range(10):
+		video_writer.write(numpy.full((64, 64, 3), frame_number * 20, dtype = numpy.uint8))
+	video_writer.release()
+	return video_path
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_video_pool()
+
+
+def test_get_video_capture(video_path : str) -> None:
+	video_capture = get_video_capture(video_path)
+
+	assert video_capture.isOpened()
+	assert get_video_capture(video_path) is video_capture
+	assert list(VIDEO_POOL_SET.get('capture').keys()) == [ get_video_capture_key(video_path) ]
+	assert get_video_capture('invalid').isOpened() is False
+
+
+def test_get_video_capture_finished_threads(video_path : str) -> None:
+	for _ in range(3):
+		video_thread = threading.Thread(target = get_video_capture, args = (video_path,))
+		video_thread.start()
+		video_thread.join()
+
+	get_video_capture(video_path)
+
+	assert list(VIDEO_POOL_SET.get('capture').keys()) == [ get_video_capture_key(video_path) ]
+
+
+def test_get_video_capture_limit(video_path : str) -> None:
+	video_barrier = threading.Barrier(4)
+	video_event = threading.Event()
+	video_threads = [ threading.Thread(target = hold_video_capture, args = (video_path, video_barrier, video_event)) for _ in range(3) ]
+
+	with patch('facefusion.video_manager.VIDEO_CAPTURE_LIMIT', 2):
+		for video_thread in video_threads:
+			video_thread.start()
+		video_barrier.wait()
+		get_video_capture(video_path)
+
+		assert len(VIDEO_POOL_SET.get('capture')) == 2
+		assert get_video_capture_key(video_path) in VIDEO_POOL_SET.get('capture')
+
+	video_event.set()
+
+	for video_thread in video_threads:
+		video_thread.join()
+
+
+def hold_video_capture(video_path : str, video_barrier : threading.Barrier, video_event : threading.Event) -> None:
+	get_video_capture(video_path)
+	video_barrier.wait()
+	video_event.wait()
@@ -1,8 +1,10 @@
 import subprocess
 
+import numpy
 import pytest
 
 from facefusion.download import conditional_download
+from facefusion.video_manager import clear_video_pool
 from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, unpack_resolution, write_image
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
@@ -65,6 +67,15 @@ def test_read_video_frame() -> None:
 	assert read_video_frame('invalid') is None
 
 
+def test_read_video_frame_sequential() -> None:
+	vision_frames = [ read_video_frame(get_test_example_file('target-240p-25fps.mp4'), frame_number) for frame_number in [ 1, 2, 3, 10, 5, 100 ] ]
+
+	for vision_frame, frame_number in zip(vision_frames, [ 1, 2, 3, 10, 5, 100 ]):
+		clear_video_pool()
+
+		assert numpy.array_equal(vision_frame, read_video_frame(get_test_example_file('target-240p-25fps.mp4'), frame_number))
+
+
 def test_count_video_frame_total() -> None:
 	assert count_video_frame_total(get_test_example_file('target-240p-25fps.mp4')) == 270
 	assert count_video_frame_total(get_test_example_file('target-240p-30fps.mp4')) == 324
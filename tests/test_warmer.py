@@ -0,0 +1,30 @@
+import os
+import tempfile
+
+from onnxruntime import InferenceSession
+
+from facefusion import face_classifier, face_detector, state_manager, voice_extractor
+from facefusion.warmer import resolve_model_resolution, warm_up_inference_pool
+from .helper import create_test_model
+
+
+def test_warm_up_inference_pool() -> None:
+	state_manager.init_item('warm_up_cycle_count', 2)
+	model_path = create_test_model(os.path.join(tempfile.mkdtemp(), 'warm_up.onnx'), None, None)
+	inference_pool =\
+	{
+		'warm_up': InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	}
+	warm_up_set = warm_up_inference_pool(inference_pool, (64, 48))
+
+	assert list(warm_up_set.keys()) == [ 'warm_up' ]
+	assert warm_up_set.get('warm_up') >= 0
+
+
+def test_resolve_model_resolution() -> None:
+	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('face_detector_size', '640x480')
+
+	assert resolve_model_resolution(face_detector) == (640, 480)
+	assert resolve_model_resolution(face_classifier) == (224, 224)
+	assert resolve_model_resolution(voice_extractor) is None